@@ -0,0 +1,75 @@
+"""
+Alembic Migration Environment - Infrastructure Layer
+
+This module runs the schema migrations in migrations/versions against the
+database named by DATABASE_URL, using the same settings as the application
+and the async driver it connects with.
+"""
+
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import async_engine_from_config
+
+from src.infrastructure.database.database import Base, DatabaseSettings
+from src.infrastructure.database.models import blog_post_model, comment_model, user_model  # noqa: F401  (register the tables)
+
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# configparser treats % as interpolation, so escape it in the URL
+config.set_main_option("sqlalchemy.url", DatabaseSettings().database_url.replace("%", "%%"))
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """
+    Run migrations in 'offline' mode, emitting SQL instead of executing it.
+
+    Useful for reviewing the SQL of a revision or handing it to a DBA:
+    ``alembic upgrade head --sql``.
+    """
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"}
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    """Run the pending migrations on an open connection."""
+    context.configure(connection=connection, target_metadata=target_metadata)
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """Run migrations in 'online' mode on a single, unpooled async connection."""
+    connectable = async_engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool
+    )
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_async_migrations())
@@ -0,0 +1,79 @@
+"""
+Baseline schema: blog_posts, comments and users
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-01-15 00:00:00
+
+The tables and indexes as the application first created them with
+Base.metadata.create_all. Every statement is guarded with IF NOT EXISTS, so
+upgrading a database that was bootstrapped that way only records the
+revision and leaves the existing objects alone.
+"""
+
+from alembic import op
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS blog_posts (
+            id UUID NOT NULL PRIMARY KEY,
+            title VARCHAR(200) NOT NULL,
+            content TEXT NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL
+        )
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS comments (
+            id UUID NOT NULL PRIMARY KEY,
+            content TEXT NOT NULL,
+            author_name VARCHAR(100) NOT NULL,
+            author_email VARCHAR(255) NOT NULL,
+            is_approved BOOLEAN NOT NULL,
+            blog_post_id UUID NOT NULL REFERENCES blog_posts (id) ON DELETE CASCADE,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL
+        )
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id UUID NOT NULL PRIMARY KEY,
+            username VARCHAR(50) NOT NULL,
+            email VARCHAR(255) NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            full_name VARCHAR(100),
+            is_active BOOLEAN NOT NULL,
+            is_superuser BOOLEAN NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL
+        )
+    """)
+
+    op.execute("CREATE INDEX IF NOT EXISTS ix_blog_posts_id ON blog_posts (id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_blog_posts_title ON blog_posts (title)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_blog_posts_created_at ON blog_posts (created_at)")
+
+    op.execute("CREATE INDEX IF NOT EXISTS ix_comments_id ON comments (id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_comments_is_approved ON comments (is_approved)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_comments_blog_post_id ON comments (blog_post_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_comments_created_at ON comments (created_at)")
+
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_id ON users (id)")
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username ON users (username)")
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_is_active ON users (is_active)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_is_superuser ON users (is_superuser)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_created_at ON users (created_at)")
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS comments")
+    op.execute("DROP TABLE IF EXISTS users")
+    op.execute("DROP TABLE IF EXISTS blog_posts")
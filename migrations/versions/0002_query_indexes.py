@@ -0,0 +1,70 @@
+"""
+Query indexes: trigram search, keyset listings and partial filters
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-01-15 00:00:00
+
+Replaces the single-column indexes of the baseline with the indexes the
+repositories' queries are written against. The indexes are built with
+CREATE INDEX CONCURRENTLY, which cannot run inside a transaction, so they
+are created in an autocommit block and do not block writes while building.
+"""
+
+from alembic import op
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+# (name, definition) of each index, in creation order
+QUERY_INDEXES = (
+    ("blog_posts_title_trgm", "blog_posts USING gin (title gin_trgm_ops)"),
+    ("blog_posts_recent", "blog_posts (created_at DESC, id DESC)"),
+    ("comments_recent", "comments (created_at DESC, id DESC)"),
+    ("comments_post", "comments (blog_post_id, created_at DESC, id DESC)"),
+    ("comments_pending", "comments (created_at DESC, id DESC) WHERE is_approved = false"),
+    ("comments_approved_post", "comments (blog_post_id, created_at DESC, id DESC) WHERE is_approved = true"),
+    ("users_username_lower_trgm", "users USING gin (lower(username) gin_trgm_ops)"),
+    ("users_recent", "users (created_at DESC, id DESC)"),
+    ("users_active_recent", "users (created_at DESC, id DESC) WHERE is_active = true"),
+)
+
+# Baseline indexes the query indexes make redundant: the id indexes duplicate
+# the primary keys, and the rest are covered by a composite or partial index
+SUPERSEDED_INDEXES = (
+    ("ix_blog_posts_id", "blog_posts (id)"),
+    ("ix_blog_posts_title", "blog_posts (title)"),
+    ("ix_blog_posts_created_at", "blog_posts (created_at)"),
+    ("ix_comments_id", "comments (id)"),
+    ("ix_comments_is_approved", "comments (is_approved)"),
+    ("ix_comments_blog_post_id", "comments (blog_post_id)"),
+    ("ix_comments_created_at", "comments (created_at)"),
+    ("ix_users_id", "users (id)"),
+    ("ix_users_is_active", "users (is_active)"),
+    ("ix_users_is_superuser", "users (is_superuser)"),
+    ("ix_users_created_at", "users (created_at)"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # A failed concurrent build leaves an INVALID index behind that IF NOT
+    # EXISTS would skip; drop it and re-run the upgrade to rebuild it
+    with op.get_context().autocommit_block():
+        for name, definition in QUERY_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+        for name, _ in SUPERSEDED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, definition in SUPERSEDED_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+        for name, _ in reversed(QUERY_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
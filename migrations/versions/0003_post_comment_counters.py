@@ -0,0 +1,88 @@
+"""
+Trigger-maintained comment counters on blog_posts
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-01-15 00:00:00
+
+Adds blog_posts.comment_count and approved_comment_count, the trigger on
+comments that keeps them current, and backfills both counters from the
+existing comments. Everything runs in one transaction: CREATE TRIGGER locks
+comments against writes until the commit, so no comment written between the
+backfill and the trigger taking effect can be missed.
+"""
+
+from alembic import op
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS comment_count INTEGER NOT NULL DEFAULT 0")
+    op.execute("ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS approved_comment_count INTEGER NOT NULL DEFAULT 0")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION comments_maintain_post_counts() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND NEW.blog_post_id = OLD.blog_post_id THEN
+                IF NEW.is_approved <> OLD.is_approved THEN
+                    UPDATE blog_posts
+                    SET approved_comment_count = approved_comment_count + NEW.is_approved::int - OLD.is_approved::int
+                    WHERE id = NEW.blog_post_id;
+                END IF;
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE blog_posts
+                SET comment_count = comment_count - 1,
+                    approved_comment_count = approved_comment_count - OLD.is_approved::int
+                WHERE id = OLD.blog_post_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE blog_posts
+                SET comment_count = comment_count + 1,
+                    approved_comment_count = approved_comment_count + NEW.is_approved::int
+                WHERE id = NEW.blog_post_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # Databases created with AUTO_CREATE_TABLES may already have the trigger
+    op.execute("DROP TRIGGER IF EXISTS comments_post_counts ON comments")
+    op.execute("""
+        CREATE TRIGGER comments_post_counts
+        AFTER INSERT OR DELETE OR UPDATE OF is_approved, blog_post_id ON comments
+        FOR EACH ROW
+        WHEN (pg_trigger_depth() = 0)
+        EXECUTE FUNCTION comments_maintain_post_counts()
+    """)
+
+    op.execute("""
+        UPDATE blog_posts
+        SET comment_count = counts.total,
+            approved_comment_count = counts.approved
+        FROM (
+            SELECT blog_posts.id,
+                   count(comments.id) AS total,
+                   count(comments.id) FILTER (WHERE comments.is_approved) AS approved
+            FROM blog_posts
+            LEFT JOIN comments ON comments.blog_post_id = blog_posts.id
+            GROUP BY blog_posts.id
+        ) AS counts
+        WHERE blog_posts.id = counts.id
+          AND (blog_posts.comment_count, blog_posts.approved_comment_count)
+              IS DISTINCT FROM (counts.total, counts.approved)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS comments_post_counts ON comments")
+    op.execute("DROP FUNCTION IF EXISTS comments_maintain_post_counts()")
+    op.execute("ALTER TABLE blog_posts DROP COLUMN IF EXISTS approved_comment_count")
+    op.execute("ALTER TABLE blog_posts DROP COLUMN IF EXISTS comment_count")
@@ -0,0 +1,49 @@
+"""
+Entity Identifier Helpers - Domain Layer
+
+This module generates random (version 4) UUIDs for the domain entities.
+Random bytes are read from the operating system in batches and handed out
+16 bytes at a time, so creating an entity does not cost one os.urandom call.
+"""
+
+import os
+import threading
+from uuid import UUID
+
+
+_UUID_SIZE = 16
+_BATCH_SIZE = 256
+
+_local = threading.local()
+_generation = 0
+
+
+def _reset_after_fork() -> None:
+    """Invalidate buffered randomness so a forked child never reuses it."""
+    global _generation
+    _generation += 1
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def next_uuid() -> UUID:
+    """
+    Generate a new random version 4 UUID.
+    
+    Each thread keeps its own buffer of random bytes, refilled from
+    os.urandom when exhausted or after the process has forked.
+    
+    Returns:
+        A new random UUID
+    """
+    local = _local
+    if getattr(local, "generation", None) != _generation or local.pos >= len(local.buffer):
+        local.buffer = os.urandom(_UUID_SIZE * _BATCH_SIZE)
+        local.pos = 0
+        local.generation = _generation
+    
+    pos = local.pos
+    local.pos = pos + _UUID_SIZE
+    return UUID(bytes=local.buffer[pos:pos + _UUID_SIZE], version=4)
@@ -0,0 +1,37 @@
+"""
+Entity Validation Helpers - Domain Layer
+
+This module contains small validation helpers shared by the domain entities.
+They have no dependencies on external frameworks or infrastructure.
+"""
+
+from typing import Any, Optional
+
+
+def _ensure_str(
+    name: str,
+    value: Any,
+    max_len: Optional[int] = None,
+    allow_empty: bool = False
+) -> None:
+    """
+    Validate that a field value is a string within the allowed bounds.
+    
+    Args:
+        name: Field name used in error messages (e.g. "Title")
+        value: Value to validate
+        max_len: Maximum allowed length (optional)
+        allow_empty: Whether empty or whitespace-only values are accepted
+    
+    Raises:
+        ValueError: If the value is not a string, is empty when not allowed,
+            or exceeds the maximum length
+    """
+    if type(value) is not str:
+        raise ValueError(f"{name} must be a string")
+    
+    if not allow_empty and (not value or value.isspace()):
+        raise ValueError(f"{name} cannot be empty")
+    
+    if max_len is not None and len(value) > max_len:
+        raise ValueError(f"{name} cannot exceed {max_len} characters")
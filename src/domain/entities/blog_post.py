@@ -10,13 +10,20 @@ Following Clean Architecture principles, this entity contains:
 - No dependencies on external frameworks or infrastructure
 """
 
+import copy
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 from dataclasses import dataclass, field
-from uuid import UUID, uuid4
+from uuid import UUID
 
+from ._ids import next_uuid
+from ._validation import _ensure_str
 
-@dataclass
+
+_now = datetime.utcnow
+
+
+@dataclass(slots=True, eq=False)
 class BlogPost:
     """
     BlogPost entity representing a blog post in the domain.
@@ -33,58 +40,63 @@ class BlogPost:
         content: Content of the blog post (required)
         created_at: Timestamp when the post was created
         updated_at: Timestamp when the post was last updated
-        comment_ids: List of comment IDs associated with this post
+        comment_count: Number of comments on the post, as last read from storage
     """
     
     title: str
     content: str
-    id: UUID = field(default_factory=uuid4)
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
-    comment_ids: List[UUID] = field(default_factory=list)
+    id: UUID = field(default_factory=next_uuid)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
+    comment_count: int = field(default=0)
+    
+    # Cached string forms of fields that never change after creation
+    _id_str: str = field(init=False, repr=False, compare=False)
+    _created_at_iso: str = field(init=False, repr=False, compare=False)
+    
+    # Cached string form of updated_at, valid while updated_at is unchanged
+    _updated_at_iso: str = field(init=False, repr=False, compare=False)
+    _updated_at_iso_source: datetime = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate the blog post data after initialization."""
-        self._validate_title()
-        self._validate_content()
+        self._validate_title_value(self.title)
+        self._validate_content_value(self.content)
     
-    def _validate_title(self) -> None:
+    @staticmethod
+    def _validate_title_value(title: str) -> None:
         """
-        Validate the blog post title.
+        Validate a blog post title.
         
         Business Rules:
         - Title cannot be empty
         - Title cannot exceed 200 characters
         - Title must be a string
         
+        Args:
+            title: The title to validate
+            
         Raises:
             ValueError: If title validation fails
         """
-        if not isinstance(self.title, str):
-            raise ValueError("Title must be a string")
-        
-        if not self.title.strip():
-            raise ValueError("Title cannot be empty")
-        
-        if len(self.title) > 200:
-            raise ValueError("Title cannot exceed 200 characters")
+        _ensure_str("Title", title, max_len=200)
     
-    def _validate_content(self) -> None:
+    @staticmethod
+    def _validate_content_value(content: str) -> None:
         """
-        Validate the blog post content.
+        Validate blog post content.
         
         Business Rules:
         - Content cannot be empty
         - Content must be a string
         
+        Args:
+            content: The content to validate
+            
         Raises:
             ValueError: If content validation fails
         """
-        if not isinstance(self.content, str):
-            raise ValueError("Content must be a string")
-        
-        if not self.content.strip():
-            raise ValueError("Content cannot be empty")
+        _ensure_str("Content", content)
     
     def update_title(self, new_title: str) -> None:
         """
@@ -96,15 +108,9 @@ class BlogPost:
         Raises:
             ValueError: If the new title is invalid
         """
-        old_title = self.title
+        self._validate_title_value(new_title)
         self.title = new_title
-        
-        try:
-            self._validate_title()
-            self.updated_at = datetime.utcnow()
-        except ValueError:
-            self.title = old_title  # Rollback on validation failure
-            raise
+        self.updated_at = _now()
     
     def update_content(self, new_content: str) -> None:
         """
@@ -116,59 +122,44 @@ class BlogPost:
         Raises:
             ValueError: If the new content is invalid
         """
-        old_content = self.content
+        self._validate_content_value(new_content)
         self.content = new_content
-        
-        try:
-            self._validate_content()
-            self.updated_at = datetime.utcnow()
-        except ValueError:
-            self.content = old_content  # Rollback on validation failure
-            raise
-    
-    def add_comment_id(self, comment_id: UUID) -> None:
-        """
-        Add a comment ID to this blog post.
-        
-        Args:
-            comment_id: UUID of the comment to associate with this post
-            
-        Raises:
-            ValueError: If comment_id is not a UUID or already exists
-        """
-        if not isinstance(comment_id, UUID):
-            raise ValueError("Comment ID must be a UUID")
-        
-        if comment_id in self.comment_ids:
-            raise ValueError("Comment ID already exists for this post")
-        
-        self.comment_ids.append(comment_id)
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _now()
     
-    def remove_comment_id(self, comment_id: UUID) -> None:
+    def copy(self) -> "BlogPost":
         """
-        Remove a comment ID from this blog post.
+        Create an independent copy of the blog post.
         
-        Args:
-            comment_id: UUID of the comment to remove from this post
-            
-        Raises:
-            ValueError: If comment_id is not found
+        Returns:
+            A new BlogPost entity with the same field values
         """
-        if comment_id not in self.comment_ids:
-            raise ValueError("Comment ID not found for this post")
-        
-        self.comment_ids.remove(comment_id)
-        self.updated_at = datetime.utcnow()
+        return copy.copy(self)
     
     def get_comment_count(self) -> int:
         """
         Get the number of comments associated with this blog post.
         
+        The count is maintained by the repository from the comments table;
+        it is not updated in memory when comments are created or deleted.
+        
         Returns:
             Number of comments associated with this post
         """
-        return len(self.comment_ids)
+        return self.comment_count
+    
+    def _cache_strings(self) -> None:
+        """Cache the string forms of id and created_at, which never change."""
+        if not hasattr(self, '_id_str'):
+            self._id_str = str(self.id)
+            self._created_at_iso = self.created_at.isoformat()
+    
+    def _updated_at_string(self) -> str:
+        """Format updated_at, reusing the cached string while it is unchanged."""
+        updated_at = self.updated_at
+        if getattr(self, '_updated_at_iso_source', None) is not updated_at:
+            self._updated_at_iso = updated_at.isoformat()
+            self._updated_at_iso_source = updated_at
+        return self._updated_at_iso
     
     def to_dict(self) -> dict:
         """
@@ -177,20 +168,56 @@ class BlogPost:
         Returns:
             Dictionary representation of the blog post
         """
+        self._cache_strings()
+        
         return {
-            'id': str(self.id),
+            'id': self._id_str,
             'title': self.title,
             'content': self.content,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'created_at': self._created_at_iso,
+            'updated_at': self._updated_at_string(),
             'comment_count': self.get_comment_count()
         }
     
+    def to_summary_dict(self, comment_count: int) -> dict:
+        """
+        Convert the blog post to a summary dictionary, without its content.
+        
+        Timestamps are left as datetime objects for the serializer to format.
+        
+        Args:
+            comment_count: Number of comments to report for this post
+            
+        Returns:
+            Dictionary with the blog post's id, title, timestamps and comment count
+        """
+        self._cache_strings()
+        
+        return {
+            'id': self._id_str,
+            'title': self.title,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'comment_count': comment_count
+        }
+    
+    def __eq__(self, other: object) -> bool:
+        """Blog posts are equal when they share the same identifier."""
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        """Hash the blog post by its identifier."""
+        return hash(self.id)
+    
     def __str__(self) -> str:
         """String representation of the blog post."""
-        return f"BlogPost(id={self.id}, title='{self.title[:50]}...', comments={self.get_comment_count()})"
+        self._cache_strings()
+        return f"BlogPost(id={self._id_str}, title='{self.title[:50]}...', comments={self.get_comment_count()})"
     
     def __repr__(self) -> str:
         """Detailed string representation of the blog post."""
-        return (f"BlogPost(id={self.id}, title='{self.title}', "
-                f"created_at={self.created_at}, comment_count={self.get_comment_count()})")
+        self._cache_strings()
+        return (f"BlogPost(id={self._id_str}, title='{self.title}', "
+                f"created_at={self._created_at_iso}, comment_count={self.get_comment_count()})")
@@ -10,12 +10,22 @@ Following Clean Architecture principles, this entity contains:
 - No dependencies on external frameworks or infrastructure
 """
 
-from datetime import datetime
+import sys
+import time
+from datetime import datetime, timezone
 from dataclasses import dataclass, field
-from uuid import UUID, uuid4
+from uuid import UUID
 
+from ._ids import next_uuid
+from ._validation import _ensure_str
 
-@dataclass
+
+_now = datetime.utcnow
+
+_ANONYMOUS = sys.intern("Anonymous")
+
+
+@dataclass(slots=True, eq=False)
 class Comment:
     """
     Comment entity representing a comment in the domain.
@@ -39,40 +49,47 @@ class Comment:
     
     content: str
     blog_post_id: UUID
-    id: UUID = field(default_factory=uuid4)
-    author_name: str = field(default="Anonymous")
+    id: UUID = field(default_factory=next_uuid)
+    author_name: str = field(default=_ANONYMOUS)
     author_email: str = field(default="")
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
     is_approved: bool = field(default=True)
     
+    # Cached string forms of fields that never change after creation
+    _id_str: str = field(init=False, repr=False, compare=False)
+    _blog_post_id_str: str = field(init=False, repr=False, compare=False)
+    _created_at_iso: str = field(init=False, repr=False, compare=False)
+    _created_at_ts: float = field(init=False, repr=False, compare=False)
+    
+    # Cached string form of updated_at, valid while updated_at is unchanged
+    _updated_at_iso: str = field(init=False, repr=False, compare=False)
+    _updated_at_iso_source: datetime = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate the comment data after initialization."""
-        self._validate_content()
+        self._validate_content_value(self.content)
         self._validate_blog_post_id()
-        self._validate_author_name()
-        self._validate_author_email()
+        self._validate_author_name_value(self.author_name)
+        self._validate_author_email_value(self.author_email)
     
-    def _validate_content(self) -> None:
+    @staticmethod
+    def _validate_content_value(content: str) -> None:
         """
-        Validate the comment content.
+        Validate comment content.
         
         Business Rules:
         - Content cannot be empty
         - Content cannot exceed 1000 characters
         - Content must be a string
         
+        Args:
+            content: The content to validate
+            
         Raises:
             ValueError: If content validation fails
         """
-        if not isinstance(self.content, str):
-            raise ValueError("Content must be a string")
-        
-        if not self.content.strip():
-            raise ValueError("Content cannot be empty")
-        
-        if len(self.content) > 1000:
-            raise ValueError("Content cannot exceed 1000 characters")
+        _ensure_str("Content", content, max_len=1000)
     
     def _validate_blog_post_id(self) -> None:
         """
@@ -88,42 +105,42 @@ class Comment:
         if not isinstance(self.blog_post_id, UUID):
             raise ValueError("Blog post ID must be a UUID")
     
-    def _validate_author_name(self) -> None:
+    @staticmethod
+    def _validate_author_name_value(author_name: str) -> None:
         """
-        Validate the author name.
+        Validate an author name.
         
         Business Rules:
         - Author name must be a string
         - Author name cannot exceed 100 characters
         
+        Args:
+            author_name: The author name to validate
+            
         Raises:
             ValueError: If author name validation fails
         """
-        if not isinstance(self.author_name, str):
-            raise ValueError("Author name must be a string")
-        
-        if len(self.author_name) > 100:
-            raise ValueError("Author name cannot exceed 100 characters")
+        _ensure_str("Author name", author_name, max_len=100, allow_empty=True)
     
-    def _validate_author_email(self) -> None:
+    @staticmethod
+    def _validate_author_email_value(author_email: str) -> None:
         """
-        Validate the author email.
+        Validate an author email.
         
         Business Rules:
         - Author email must be a string
         - Author email cannot exceed 255 characters
         - If provided, email should contain @ symbol (basic validation)
         
+        Args:
+            author_email: The author email to validate
+            
         Raises:
             ValueError: If author email validation fails
         """
-        if not isinstance(self.author_email, str):
-            raise ValueError("Author email must be a string")
+        _ensure_str("Author email", author_email, max_len=255, allow_empty=True)
         
-        if len(self.author_email) > 255:
-            raise ValueError("Author email cannot exceed 255 characters")
-        
-        if self.author_email and "@" not in self.author_email:
+        if author_email and "@" not in author_email:
             raise ValueError("Author email must be a valid email address")
     
     def update_content(self, new_content: str) -> None:
@@ -136,15 +153,9 @@ class Comment:
         Raises:
             ValueError: If the new content is invalid
         """
-        old_content = self.content
+        self._validate_content_value(new_content)
         self.content = new_content
-        
-        try:
-            self._validate_content()
-            self.updated_at = datetime.utcnow()
-        except ValueError:
-            self.content = old_content  # Rollback on validation failure
-            raise
+        self.updated_at = _now()
     
     def update_author_info(self, name: str = None, email: str = None) -> None:
         """
@@ -157,25 +168,20 @@ class Comment:
         Raises:
             ValueError: If the new author information is invalid
         """
-        old_name = self.author_name
-        old_email = self.author_email
+        # Validate everything first so a failure leaves the comment untouched
+        if name is not None:
+            self._validate_author_name_value(name)
         
-        try:
-            if name is not None:
-                self.author_name = name
-                self._validate_author_name()
-            
-            if email is not None:
-                self.author_email = email
-                self._validate_author_email()
-            
-            self.updated_at = datetime.utcnow()
-            
-        except ValueError:
-            # Rollback on validation failure
-            self.author_name = old_name
-            self.author_email = old_email
-            raise
+        if email is not None:
+            self._validate_author_email_value(email)
+        
+        if name is not None:
+            self.author_name = name
+        
+        if email is not None:
+            self.author_email = email
+        
+        self.updated_at = _now()
     
     def approve(self) -> None:
         """
@@ -185,7 +191,7 @@ class Comment:
         """
         if not self.is_approved:
             self.is_approved = True
-            self.updated_at = datetime.utcnow()
+            self.updated_at = _now()
     
     def reject(self) -> None:
         """
@@ -195,7 +201,7 @@ class Comment:
         """
         if self.is_approved:
             self.is_approved = False
-            self.updated_at = datetime.utcnow()
+            self.updated_at = _now()
     
     def is_recent(self, hours: int = 24) -> bool:
         """
@@ -207,8 +213,14 @@ class Comment:
         Returns:
             True if the comment was created within the specified hours
         """
-        time_diff = datetime.utcnow() - self.created_at
-        return time_diff.total_seconds() < (hours * 3600)
+        if not hasattr(self, '_created_at_ts'):
+            created_at = self.created_at
+            if created_at.tzinfo is None:
+                # Naive timestamps are UTC (see _now)
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            self._created_at_ts = created_at.timestamp()
+        
+        return time.time() - self._created_at_ts < hours * 3600
     
     def get_content_preview(self, max_length: int = 100) -> str:
         """
@@ -220,10 +232,30 @@ class Comment:
         Returns:
             Truncated content with ellipsis if needed
         """
-        if len(self.content) <= max_length:
-            return self.content
+        content = self.content
+        if len(content) <= max_length:
+            return content
+        
+        preview = content[:max_length]
+        if preview and not preview[-1].isspace():
+            return preview + "..."
         
-        return self.content[:max_length].rstrip() + "..."
+        return preview.rstrip() + "..."
+    
+    def _cache_strings(self) -> None:
+        """Cache the string forms of id, blog_post_id and created_at, which never change."""
+        if not hasattr(self, '_id_str'):
+            self._id_str = str(self.id)
+            self._blog_post_id_str = str(self.blog_post_id)
+            self._created_at_iso = self.created_at.isoformat()
+    
+    def _updated_at_string(self) -> str:
+        """Format updated_at, reusing the cached string while it is unchanged."""
+        updated_at = self.updated_at
+        if getattr(self, '_updated_at_iso_source', None) is not updated_at:
+            self._updated_at_iso = updated_at.isoformat()
+            self._updated_at_iso_source = updated_at
+        return self._updated_at_iso
     
     def to_dict(self) -> dict:
         """
@@ -232,24 +264,38 @@ class Comment:
         Returns:
             Dictionary representation of the comment
         """
+        self._cache_strings()
+        
         return {
-            'id': str(self.id),
+            'id': self._id_str,
             'content': self.content,
-            'blog_post_id': str(self.blog_post_id),
+            'blog_post_id': self._blog_post_id_str,
             'author_name': self.author_name,
             'author_email': self.author_email,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'created_at': self._created_at_iso,
+            'updated_at': self._updated_at_string(),
             'is_approved': self.is_approved
         }
     
+    def __eq__(self, other: object) -> bool:
+        """Comments are equal when they share the same identifier."""
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        """Hash the comment by its identifier."""
+        return hash(self.id)
+    
     def __str__(self) -> str:
         """String representation of the comment."""
+        self._cache_strings()
         preview = self.get_content_preview(50)
-        return f"Comment(id={self.id}, author='{self.author_name}', content='{preview}')"
+        return f"Comment(id={self._id_str}, author='{self.author_name}', content='{preview}')"
     
     def __repr__(self) -> str:
         """Detailed string representation of the comment."""
-        return (f"Comment(id={self.id}, blog_post_id={self.blog_post_id}, "
-                f"author='{self.author_name}', created_at={self.created_at}, "
+        self._cache_strings()
+        return (f"Comment(id={self._id_str}, blog_post_id={self.blog_post_id}, "
+                f"author='{self.author_name}', created_at={self._created_at_iso}, "
                 f"approved={self.is_approved})")
@@ -13,11 +13,50 @@ Following Clean Architecture principles, this entity contains:
 from datetime import datetime
 from typing import Optional
 from dataclasses import dataclass, field
-from uuid import UUID, uuid4
-import re
+from uuid import UUID
+import string
 
+from ._ids import next_uuid
+from ._validation import _ensure_str
 
-@dataclass
+
+_now = datetime.utcnow
+
+_USERNAME_CHARS = frozenset(string.ascii_letters + string.digits + '_')
+
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '.-')
+_EMAIL_TLD_CHARS = frozenset(string.ascii_letters)
+
+
+def _is_valid_email(email: str) -> bool:
+    """
+    Check an email address against the basic format rules.
+    
+    Equivalent to matching ``^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$``
+    but implemented as a linear character scan, without the regex engine.
+    
+    Args:
+        email: Email address to check
+        
+    Returns:
+        True if the email has a valid format, False otherwise
+    """
+    local, at, domain = email.partition('@')
+    if not at or not local or not _EMAIL_LOCAL_CHARS.issuperset(local):
+        return False
+    
+    host, dot, tld = domain.rpartition('.')
+    return (
+        bool(dot)
+        and bool(host)
+        and len(tld) >= 2
+        and _EMAIL_DOMAIN_CHARS.issuperset(host)
+        and _EMAIL_TLD_CHARS.issuperset(tld)
+    )
+
+
+@dataclass(slots=True, eq=False)
 class User:
     """
     User entity representing a user in the domain.
@@ -44,24 +83,33 @@ class User:
     username: str
     email: str
     password_hash: str
-    id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=next_uuid)
     full_name: Optional[str] = field(default=None)
     is_active: bool = field(default=True)
     is_superuser: bool = field(default=False)
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
+    
+    # Cached string forms of fields that never change after creation
+    _id_str: str = field(init=False, repr=False, compare=False)
+    _created_at_iso: str = field(init=False, repr=False, compare=False)
+    
+    # Cached string form of updated_at, valid while updated_at is unchanged
+    _updated_at_iso: str = field(init=False, repr=False, compare=False)
+    _updated_at_iso_source: datetime = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate the user data after initialization."""
-        self._validate_username()
-        self._validate_email()
-        self._validate_password_hash()
+        self.username = self._validate_username_value(self.username)
+        self.email = self._validate_email_value(self.email)
+        self._validate_password_hash_value(self.password_hash)
         if self.full_name:
-            self._validate_full_name()
+            self.full_name = self._validate_full_name_value(self.full_name)
     
-    def _validate_username(self) -> None:
+    @staticmethod
+    def _validate_username_value(username: str) -> str:
         """
-        Validate the username.
+        Validate and normalize a username.
         
         Business Rules:
         - Username must be a string
@@ -69,16 +117,18 @@ class User:
         - Username can only contain alphanumeric characters and underscores
         - Username cannot start or end with underscore
         
+        Args:
+            username: The username to validate
+            
+        Returns:
+            The username with surrounding whitespace removed
+            
         Raises:
             ValueError: If username validation fails
         """
-        if not isinstance(self.username, str):
-            raise ValueError("Username must be a string")
-        
-        if not self.username.strip():
-            raise ValueError("Username cannot be empty")
+        _ensure_str("Username", username)
         
-        username = self.username.strip()
+        username = username.strip()
         
         if len(username) < 3:
             raise ValueError("Username must be at least 3 characters long")
@@ -86,80 +136,94 @@ class User:
         if len(username) > 50:
             raise ValueError("Username cannot exceed 50 characters")
         
-        if not re.match(r'^[a-zA-Z0-9_]+$', username):
+        if not _USERNAME_CHARS.issuperset(username):
             raise ValueError("Username can only contain letters, numbers, and underscores")
         
         if username.startswith('_') or username.endswith('_'):
             raise ValueError("Username cannot start or end with underscore")
         
-        self.username = username
+        return username
     
-    def _validate_email(self) -> None:
+    @staticmethod
+    def _validate_email_value(email: str) -> str:
         """
-        Validate the email address.
+        Validate and normalize an email address.
         
         Business Rules:
         - Email must be a string
         - Email must have valid format
         - Email cannot exceed 255 characters
         
+        Args:
+            email: The email address to validate
+            
+        Returns:
+            The email stripped of surrounding whitespace and lowercased
+            
         Raises:
             ValueError: If email validation fails
         """
-        if not isinstance(self.email, str):
-            raise ValueError("Email must be a string")
-        
-        if not self.email.strip():
-            raise ValueError("Email cannot be empty")
+        _ensure_str("Email", email)
         
-        email = self.email.strip().lower()
+        email = email.strip()
+        if not email.islower():
+            email = email.lower()
         
         if len(email) > 255:
             raise ValueError("Email cannot exceed 255 characters")
         
-        # Basic email validation regex
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
+        # Basic email format validation
+        if not _is_valid_email(email):
             raise ValueError("Email must have a valid format")
         
-        self.email = email
+        return email
     
-    def _validate_password_hash(self) -> None:
+    @staticmethod
+    def _validate_password_hash_value(password_hash: str) -> None:
         """
-        Validate the password hash.
+        Validate a password hash.
         
         Business Rules:
         - Password hash must be a string
         - Password hash cannot be empty
         
+        Args:
+            password_hash: The password hash to validate
+            
         Raises:
             ValueError: If password hash validation fails
         """
-        if not isinstance(self.password_hash, str):
-            raise ValueError("Password hash must be a string")
-        
-        if not self.password_hash.strip():
-            raise ValueError("Password hash cannot be empty")
+        _ensure_str("Password hash", password_hash)
     
-    def _validate_full_name(self) -> None:
+    @staticmethod
+    def _validate_full_name_value(full_name: Optional[str]) -> Optional[str]:
         """
-        Validate the full name.
+        Validate and normalize a full name.
         
         Business Rules:
         - Full name must be a string if provided
         - Full name cannot exceed 100 characters
         
+        Args:
+            full_name: The full name to validate (can be None)
+            
+        Returns:
+            The stripped full name, or None if it is None or blank
+            
         Raises:
             ValueError: If full name validation fails
         """
-        if self.full_name is not None:
-            if not isinstance(self.full_name, str):
-                raise ValueError("Full name must be a string")
-            
-            if len(self.full_name.strip()) > 100:
-                raise ValueError("Full name cannot exceed 100 characters")
-            
-            self.full_name = self.full_name.strip() if self.full_name.strip() else None
+        if full_name is None:
+            return None
+        
+        _ensure_str("Full name", full_name, allow_empty=True)
+        
+        full_name = full_name.strip()
+        
+        if len(full_name) > 100:
+            raise ValueError("Full name cannot exceed 100 characters")
+        
+        return full_name or None
     
     def update_username(self, new_username: str) -> None:
         """
@@ -171,15 +235,8 @@ class User:
         Raises:
             ValueError: If the new username is invalid
         """
-        old_username = self.username
-        self.username = new_username
-        
-        try:
-            self._validate_username()
-            self.updated_at = datetime.utcnow()
-        except ValueError:
-            self.username = old_username  # Rollback on validation failure
-            raise
+        self.username = self._validate_username_value(new_username)
+        self.updated_at = _now()
     
     def update_email(self, new_email: str) -> None:
         """
@@ -191,15 +248,8 @@ class User:
         Raises:
             ValueError: If the new email is invalid
         """
-        old_email = self.email
-        self.email = new_email
-        
-        try:
-            self._validate_email()
-            self.updated_at = datetime.utcnow()
-        except ValueError:
-            self.email = old_email  # Rollback on validation failure
-            raise
+        self.email = self._validate_email_value(new_email)
+        self.updated_at = _now()
     
     def update_password_hash(self, new_password_hash: str) -> None:
         """
@@ -211,15 +261,9 @@ class User:
         Raises:
             ValueError: If the new password hash is invalid
         """
-        old_password_hash = self.password_hash
+        self._validate_password_hash_value(new_password_hash)
         self.password_hash = new_password_hash
-        
-        try:
-            self._validate_password_hash()
-            self.updated_at = datetime.utcnow()
-        except ValueError:
-            self.password_hash = old_password_hash  # Rollback on validation failure
-            raise
+        self.updated_at = _now()
     
     def update_full_name(self, new_full_name: Optional[str]) -> None:
         """
@@ -231,15 +275,8 @@ class User:
         Raises:
             ValueError: If the new full name is invalid
         """
-        old_full_name = self.full_name
-        self.full_name = new_full_name
-        
-        try:
-            self._validate_full_name()
-            self.updated_at = datetime.utcnow()
-        except ValueError:
-            self.full_name = old_full_name  # Rollback on validation failure
-            raise
+        self.full_name = self._validate_full_name_value(new_full_name)
+        self.updated_at = _now()
     
     def activate(self) -> None:
         """
@@ -249,7 +286,7 @@ class User:
         """
         if not self.is_active:
             self.is_active = True
-            self.updated_at = datetime.utcnow()
+            self.updated_at = _now()
     
     def deactivate(self) -> None:
         """
@@ -259,7 +296,7 @@ class User:
         """
         if self.is_active:
             self.is_active = False
-            self.updated_at = datetime.utcnow()
+            self.updated_at = _now()
     
     def make_superuser(self) -> None:
         """
@@ -272,7 +309,7 @@ class User:
         
         if not self.is_superuser:
             self.is_superuser = True
-            self.updated_at = datetime.utcnow()
+            self.updated_at = _now()
     
     def remove_superuser(self) -> None:
         """
@@ -280,7 +317,21 @@ class User:
         """
         if self.is_superuser:
             self.is_superuser = False
-            self.updated_at = datetime.utcnow()
+            self.updated_at = _now()
+    
+    def _cache_strings(self) -> None:
+        """Cache the string forms of id and created_at, which never change."""
+        if not hasattr(self, '_id_str'):
+            self._id_str = str(self.id)
+            self._created_at_iso = self.created_at.isoformat()
+    
+    def _updated_at_string(self) -> str:
+        """Format updated_at, reusing the cached string while it is unchanged."""
+        updated_at = self.updated_at
+        if getattr(self, '_updated_at_iso_source', None) is not updated_at:
+            self._updated_at_iso = updated_at.isoformat()
+            self._updated_at_iso_source = updated_at
+        return self._updated_at_iso
     
     def to_dict(self) -> dict:
         """
@@ -291,22 +342,36 @@ class User:
         Returns:
             Dictionary representation of the user
         """
+        self._cache_strings()
+        
         return {
-            'id': str(self.id),
+            'id': self._id_str,
             'username': self.username,
             'email': self.email,
             'full_name': self.full_name,
             'is_active': self.is_active,
             'is_superuser': self.is_superuser,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self._created_at_iso,
+            'updated_at': self._updated_at_string()
         }
     
+    def __eq__(self, other: object) -> bool:
+        """Users are equal when they share the same identifier."""
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        """Hash the user by its identifier."""
+        return hash(self.id)
+    
     def __str__(self) -> str:
         """String representation of the user."""
-        return f"User(id={self.id}, username='{self.username}', email='{self.email}')"
+        self._cache_strings()
+        return f"User(id={self._id_str}, username='{self.username}', email='{self.email}')"
     
     def __repr__(self) -> str:
         """Detailed string representation of the user."""
-        return (f"User(id={self.id}, username='{self.username}', email='{self.email}', "
+        self._cache_strings()
+        return (f"User(id={self._id_str}, username='{self.username}', email='{self.email}', "
                 f"is_active={self.is_active}, is_superuser={self.is_superuser})")
@@ -9,14 +9,16 @@ Following Clean Architecture and SOLID principles, this interface:
 - Follows the Dependency Inversion Principle
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from abc import abstractmethod
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from ..entities.blog_post import BlogPost
+from .lifecycle import AsyncRepository
+from .pagination import PageCursor
 
 
-class BlogPostRepository(ABC):
+class BlogPostRepository(AsyncRepository):
     """
     Abstract repository interface for BlogPost entities.
     
@@ -33,6 +35,9 @@ class BlogPostRepository(ABC):
         """
         Create a new blog post in the repository.
         
+        Meant for request handlers working on one blog post; use create_many
+        for batches.
+        
         Args:
             blog_post: The BlogPost entity to create
             
@@ -45,6 +50,26 @@ class BlogPostRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def create_many(self, blog_posts: Sequence[BlogPost]) -> List[BlogPost]:
+        """
+        Create several blog posts in the repository in a single batch.
+        
+        Bulk imports should use this instead of calling create in a loop,
+        which costs one round trip per blog post.
+        
+        Args:
+            blog_posts: The BlogPost entities to create
+            
+        Returns:
+            List of the created BlogPost entities, in the given order
+            
+        Raises:
+            RepositoryError: If the blog posts cannot be created
+            DuplicateError: If any blog post ID already exists
+        """
+        pass
+    
     @abstractmethod
     async def get_by_id(self, blog_post_id: UUID) -> Optional[BlogPost]:
         """
@@ -62,17 +87,153 @@ class BlogPostRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_all(self, limit: int = 100, offset: int = 0) -> List[BlogPost]:
+    async def get_by_ids(self, blog_post_ids: Sequence[UUID]) -> Dict[UUID, BlogPost]:
+        """
+        Retrieve several blog posts by their unique identifiers in one query.
+        
+        Args:
+            blog_post_ids: The unique identifiers of the blog posts
+            
+        Returns:
+            Dictionary mapping each found identifier to its BlogPost entity;
+            identifiers that do not exist are absent from the result
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+        """
+        pass
+    
+    @abstractmethod
+    async def get_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[BlogPost]:
         """
         Retrieve all blog posts with optional pagination.
         
         Args:
             limit: Maximum number of blog posts to return (default: 100)
             offset: Number of blog posts to skip (default: 0)
+            cursor: Position of the last blog post of the previous page; when given,
+                the page starts right after it (default: None)
             
         Returns:
             List of BlogPost entities
             
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+            ValueError: If both offset and cursor are given
+        """
+        pass
+    
+    @abstractmethod
+    async def get_all_raw(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[dict]:
+        """
+        Retrieve blog posts as plain dictionaries of stored column values.
+        
+        A read-only fast path for listings that are serialized straight
+        away: no entities are built, so no domain behavior is available.
+        Rows are ordered like get_all.
+        
+        Args:
+            limit: Maximum number of blog posts to return (default: 100)
+            offset: Number of blog posts to skip (default: 0)
+            cursor: Position of the last blog post of the previous page; when given,
+                the page starts right after it (default: None)
+            
+        Returns:
+            List of dictionaries with keys 'id', 'title',
+            'content', 'created_at' and 'updated_at'
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+            ValueError: If both offset and cursor are given
+        """
+        pass
+    
+    @abstractmethod
+    async def get_all_summaries(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[dict]:
+        """
+        Retrieve blog post summaries as plain dictionaries.
+        
+        A read-only fast path for listings: only the summary columns are
+        read (no content) and no entities are built. Rows are ordered like
+        get_all.
+        
+        Args:
+            limit: Maximum number of blog posts to return (default: 100)
+            offset: Number of blog posts to skip (default: 0)
+            cursor: Position of the last blog post of the previous page; when given,
+                the page starts right after it (default: None)
+            
+        Returns:
+            List of dictionaries with keys 'id' (as a string), 'title',
+            'created_at', 'updated_at' and 'comment_count' (approved comments)
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+            ValueError: If both offset and cursor are given
+        """
+        pass
+    
+    @abstractmethod
+    async def get_all_with_comment_counts(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None,
+        approved_only: bool = False
+    ) -> List[Tuple[BlogPost, int]]:
+        """
+        Retrieve blog posts together with their comment counts in one query.
+        
+        Use this instead of get_all followed by one count per post when a
+        listing needs comment counts. The paired count is the number of
+        comments, or of approved comments when approved_only is set.
+        
+        Args:
+            limit: Maximum number of blog posts to return (default: 100)
+            offset: Number of blog posts to skip (default: 0)
+            cursor: Position of the last blog post of the previous page; when given,
+                the page starts right after it (default: None)
+            approved_only: Count only approved comments (default: False)
+            
+        Returns:
+            List of (BlogPost entity, comment count) tuples
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+            ValueError: If both offset and cursor are given
+        """
+        pass
+    
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> AsyncIterator[BlogPost]:
+        """
+        Stream all blog posts, newest first, without loading them all at once.
+        
+        Blog posts are fetched in keyset-paginated batches, so memory use stays
+        bounded by batch_size however many blog posts exist. Meant for exports
+        and reindexing jobs rather than request handlers.
+        
+        Args:
+            batch_size: Number of blog posts fetched per query (default: 1000)
+            
+        Yields:
+            BlogPost entities ordered by creation date (newest first)
+            
         Raises:
             RepositoryError: If there's an error accessing the repository
         """
@@ -83,6 +244,9 @@ class BlogPostRepository(ABC):
         """
         Update an existing blog post in the repository.
         
+        Meant for request handlers working on one blog post; use update_many
+        for batches.
+        
         Args:
             blog_post: The BlogPost entity with updated data
             
@@ -95,10 +259,29 @@ class BlogPostRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def update_many(self, blog_posts: Sequence[BlogPost]) -> List[BlogPost]:
+        """
+        Update several existing blog posts in the repository in a single batch.
+        
+        Args:
+            blog_posts: The BlogPost entities with updated data
+            
+        Returns:
+            List of the updated BlogPost entities, in the given order
+            
+        Raises:
+            RepositoryError: If there's an error updating the blog posts
+            NotFoundError: If any of the blog posts doesn't exist
+        """
+        pass
+    
     @abstractmethod
     async def delete(self, blog_post_id: UUID) -> bool:
         """
-        Delete a blog post from the repository.
+        Delete a blog post and all of its comments from the repository.
+        
+        Implementations must remove the comments atomically with the post.
         
         Args:
             blog_post_id: The unique identifier of the blog post to delete
@@ -111,6 +294,22 @@ class BlogPostRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def delete_many(self, blog_post_ids: Sequence[UUID]) -> int:
+        """
+        Delete several blog posts from the repository in a single statement.
+        
+        Args:
+            blog_post_ids: The unique identifiers of the blog posts to delete
+            
+        Returns:
+            Number of blog posts deleted (identifiers that didn't exist are ignored)
+            
+        Raises:
+            RepositoryError: If there's an error deleting the blog posts
+        """
+        pass
+    
     @abstractmethod
     async def exists(self, blog_post_id: UUID) -> bool:
         """
@@ -132,6 +331,9 @@ class BlogPostRepository(ABC):
         """
         Get the total number of blog posts in the repository.
         
+        This is an exact count and scans the table; prefer count_estimate()
+        when an approximate figure is enough.
+        
         Returns:
             Total number of blog posts
             
@@ -141,13 +343,40 @@ class BlogPostRepository(ABC):
         pass
     
     @abstractmethod
-    async def search_by_title(self, title_query: str, limit: int = 100) -> List[BlogPost]:
+    async def count_estimate(self) -> int:
+        """
+        Get an approximate number of blog posts in the repository.
+        
+        Much cheaper than an exact count on large tables; meant for displays
+        such as "~12k blog posts" where exactness is not required.
+        
+        Returns:
+            Approximate number of blog posts
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+        """
+        pass
+    
+    @abstractmethod
+    async def search_by_title(
+        self,
+        title_query: str,
+        limit: int = 100,
+        cursor: Optional[PageCursor] = None
+    ) -> List[BlogPost]:
         """
         Search blog posts by title (case-insensitive partial match).
         
+        Implementations must back this search with an index that serves
+        infix matches (e.g. a trigram or full-text index) rather than
+        scanning every title.
+        
         Args:
             title_query: The search query for the title
             limit: Maximum number of results to return (default: 100)
+            cursor: Position of the last blog post of the previous page; when given,
+                the page starts right after it (default: None)
             
         Returns:
             List of BlogPost entities matching the search criteria
@@ -158,12 +387,18 @@ class BlogPostRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_recent(self, limit: int = 10) -> List[BlogPost]:
+    async def get_recent(
+        self,
+        limit: int = 10,
+        cursor: Optional[PageCursor] = None
+    ) -> List[BlogPost]:
         """
         Get the most recently created blog posts.
         
         Args:
             limit: Maximum number of recent posts to return (default: 10)
+            cursor: Position of the last post of the previous page; when given,
+                the page starts right after it (default: None)
             
         Returns:
             List of BlogPost entities ordered by creation date (newest first)
@@ -172,16 +407,39 @@ class BlogPostRepository(ABC):
             RepositoryError: If there's an error accessing the repository
         """
         pass
+    
+    @abstractmethod
+    async def get_recent_with_total(self, limit: int = 10) -> Tuple[int, List[BlogPost]]:
+        """
+        Get the most recently created blog posts and the total count together.
+        
+        Use this instead of count() followed by get_recent(), which costs two
+        round trips. The total is exact, like count().
+        
+        Args:
+            limit: Maximum number of recent posts to return (default: 10)
+            
+        Returns:
+            Tuple of (total number of blog posts, list of BlogPost entities
+            ordered by creation date, newest first)
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+        """
+        pass
 
 
 class BlogPostRepositoryError(Exception):
     """Base exception for blog post repository operations."""
-    pass
+    
+    __slots__ = ()
 
 
 class BlogPostNotFoundError(BlogPostRepositoryError):
     """Exception raised when a blog post is not found."""
     
+    __slots__ = ('blog_post_id',)
+    
     def __init__(self, blog_post_id: UUID):
         self.blog_post_id = blog_post_id
         super().__init__(f"Blog post with ID {blog_post_id} not found")
@@ -190,6 +448,8 @@ class BlogPostNotFoundError(BlogPostRepositoryError):
 class DuplicateBlogPostError(BlogPostRepositoryError):
     """Exception raised when trying to create a blog post that already exists."""
     
+    __slots__ = ('blog_post_id',)
+    
     def __init__(self, blog_post_id: UUID):
         self.blog_post_id = blog_post_id
         super().__init__(f"Blog post with ID {blog_post_id} already exists")
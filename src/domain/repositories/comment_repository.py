@@ -9,14 +9,16 @@ Following Clean Architecture and SOLID principles, this interface:
 - Follows the Dependency Inversion Principle
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from abc import abstractmethod
+from typing import AsyncIterator, Dict, List, Optional, Sequence
 from uuid import UUID
 
 from ..entities.comment import Comment
+from .lifecycle import AsyncRepository
+from .pagination import PageCursor
 
 
-class CommentRepository(ABC):
+class CommentRepository(AsyncRepository):
     """
     Abstract repository interface for Comment entities.
     
@@ -33,6 +35,9 @@ class CommentRepository(ABC):
         """
         Create a new comment in the repository.
         
+        Meant for request handlers working on one comment; use create_many
+        for batches.
+        
         Args:
             comment: The Comment entity to create
             
@@ -42,6 +47,27 @@ class CommentRepository(ABC):
         Raises:
             RepositoryError: If the comment cannot be created
             DuplicateError: If a comment with the same ID already exists
+            BlogPostNotFoundError: If the comment's blog post doesn't exist
+        """
+        pass
+    
+    @abstractmethod
+    async def create_many(self, comments: Sequence[Comment]) -> List[Comment]:
+        """
+        Create several comments in the repository in a single batch.
+        
+        Bulk imports should use this instead of calling create in a loop,
+        which costs one round trip per comment.
+        
+        Args:
+            comments: The Comment entities to create
+            
+        Returns:
+            List of the created Comment entities, in the given order
+            
+        Raises:
+            RepositoryError: If the comments cannot be created
+            DuplicateError: If any comment ID already exists
         """
         pass
     
@@ -62,53 +88,147 @@ class CommentRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_by_blog_post_id(self, blog_post_id: UUID, limit: int = 100, offset: int = 0) -> List[Comment]:
+    async def get_by_ids(self, comment_ids: Sequence[UUID]) -> Dict[UUID, Comment]:
+        """
+        Retrieve several comments by their unique identifiers in one query.
+        
+        Args:
+            comment_ids: The unique identifiers of the comments
+            
+        Returns:
+            Dictionary mapping each found identifier to its Comment entity;
+            identifiers that do not exist are absent from the result
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+        """
+        pass
+    
+    @abstractmethod
+    async def get_by_blog_post_id(
+        self,
+        blog_post_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
         """
         Retrieve all comments for a specific blog post.
         
         Args:
             blog_post_id: The unique identifier of the blog post
             limit: Maximum number of comments to return (default: 100)
-            offset: Number of comments to skip (default: 0)
+            offset: Number of comments to skip (default: 0, prefer cursor)
+            cursor: Position of the last comment of the previous page; when given,
+                the page starts right after it (default: None)
             
         Returns:
             List of Comment entities for the specified blog post
             
         Raises:
             RepositoryError: If there's an error accessing the repository
+            ValueError: If both offset and cursor are given
         """
         pass
     
     @abstractmethod
-    async def get_approved_by_blog_post_id(self, blog_post_id: UUID, limit: int = 100, offset: int = 0) -> List[Comment]:
+    async def get_approved_by_blog_post_id(
+        self,
+        blog_post_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
         """
         Retrieve all approved comments for a specific blog post.
         
         Args:
             blog_post_id: The unique identifier of the blog post
             limit: Maximum number of comments to return (default: 100)
-            offset: Number of comments to skip (default: 0)
+            offset: Number of comments to skip (default: 0, prefer cursor)
+            cursor: Position of the last comment of the previous page; when given,
+                the page starts right after it (default: None)
             
         Returns:
             List of approved Comment entities for the specified blog post
             
         Raises:
             RepositoryError: If there's an error accessing the repository
+            ValueError: If both offset and cursor are given
         """
         pass
     
     @abstractmethod
-    async def get_all(self, limit: int = 100, offset: int = 0) -> List[Comment]:
+    async def get_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
         """
         Retrieve all comments with optional pagination.
         
         Args:
             limit: Maximum number of comments to return (default: 100)
-            offset: Number of comments to skip (default: 0)
+            offset: Number of comments to skip (default: 0, prefer cursor)
+            cursor: Position of the last comment of the previous page; when given,
+                the page starts right after it (default: None)
             
         Returns:
             List of Comment entities
             
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+            ValueError: If both offset and cursor are given
+        """
+        pass
+    
+    @abstractmethod
+    async def get_all_raw(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[dict]:
+        """
+        Retrieve comments as plain dictionaries of stored column values.
+        
+        A read-only fast path for listings that are serialized straight
+        away: no entities are built, so no domain behavior is available.
+        Rows are ordered like get_all.
+        
+        Args:
+            limit: Maximum number of comments to return (default: 100)
+            offset: Number of comments to skip (default: 0)
+            cursor: Position of the last comment of the previous page; when given,
+                the page starts right after it (default: None)
+            
+        Returns:
+            List of dictionaries with keys 'id', 'content',
+            'author_name', 'author_email', 'is_approved', 'blog_post_id',
+            'created_at' and 'updated_at'
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+            ValueError: If both offset and cursor are given
+        """
+        pass
+    
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> AsyncIterator[Comment]:
+        """
+        Stream all comments, newest first, without loading them all at once.
+        
+        Comments are fetched in keyset-paginated batches, so memory use stays
+        bounded by batch_size however many comments exist. Meant for exports
+        and reindexing jobs rather than request handlers.
+        
+        Args:
+            batch_size: Number of comments fetched per query (default: 1000)
+            
+        Yields:
+            Comment entities ordered by creation date (newest first)
+            
         Raises:
             RepositoryError: If there's an error accessing the repository
         """
@@ -119,6 +239,9 @@ class CommentRepository(ABC):
         """
         Update an existing comment in the repository.
         
+        Meant for request handlers working on one comment; use update_many
+        for batches.
+        
         Args:
             comment: The Comment entity with updated data
             
@@ -131,6 +254,44 @@ class CommentRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def update_many(self, comments: Sequence[Comment]) -> List[Comment]:
+        """
+        Update several existing comments in the repository in a single batch.
+        
+        Args:
+            comments: The Comment entities with updated data
+            
+        Returns:
+            List of the updated Comment entities, in the given order
+            
+        Raises:
+            RepositoryError: If there's an error updating the comments
+            NotFoundError: If any of the comments doesn't exist
+        """
+        pass
+    
+    @abstractmethod
+    async def set_approval_many(self, comment_ids: Sequence[UUID], approved: bool) -> List[Comment]:
+        """
+        Approve or reject several comments in a single statement.
+        
+        Follows the same rule as Comment.approve() and Comment.reject(): the
+        updated timestamp only changes for comments whose state changes.
+        
+        Args:
+            comment_ids: The unique identifiers of the comments to moderate
+            approved: True to approve the comments, False to reject them
+            
+        Returns:
+            List of the moderated Comment entities, in the given order
+            
+        Raises:
+            RepositoryError: If there's an error updating the comments
+            NotFoundError: If any of the comments doesn't exist
+        """
+        pass
+    
     @abstractmethod
     async def delete(self, comment_id: UUID) -> bool:
         """
@@ -147,11 +308,31 @@ class CommentRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def delete_many(self, comment_ids: Sequence[UUID]) -> int:
+        """
+        Delete several comments from the repository in a single statement.
+        
+        Args:
+            comment_ids: The unique identifiers of the comments to delete
+            
+        Returns:
+            Number of comments deleted (identifiers that didn't exist are ignored)
+            
+        Raises:
+            RepositoryError: If there's an error deleting the comments
+        """
+        pass
+    
     @abstractmethod
     async def delete_by_blog_post_id(self, blog_post_id: UUID) -> int:
         """
         Delete all comments for a specific blog post.
         
+        Implementations should delete in bounded batches rather than in one
+        statement, so a post with very many comments does not produce one
+        long-running delete.
+        
         Args:
             blog_post_id: The unique identifier of the blog post
             
@@ -212,12 +393,51 @@ class CommentRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_recent(self, limit: int = 10) -> List[Comment]:
+    async def count_approved_by_blog_post_ids(self, blog_post_ids: Sequence[UUID]) -> Dict[UUID, int]:
+        """
+        Get the number of approved comments for several blog posts at once.
+        
+        Args:
+            blog_post_ids: The unique identifiers of the blog posts
+            
+        Returns:
+            Dictionary mapping blog post IDs to their approved comment counts;
+            blog posts without approved comments are absent from the result
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+        """
+        pass
+    
+    @abstractmethod
+    async def count_estimate(self) -> int:
+        """
+        Get an approximate number of comments in the repository.
+        
+        Much cheaper than an exact count on large tables; meant for displays
+        such as "~12k comments" where exactness is not required.
+        
+        Returns:
+            Approximate number of comments
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+        """
+        pass
+    
+    @abstractmethod
+    async def get_recent(
+        self,
+        limit: int = 10,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
         """
         Get the most recently created comments.
         
         Args:
             limit: Maximum number of recent comments to return (default: 10)
+            cursor: Position of the last comment of the previous page; when given,
+                the page starts right after it (default: None)
             
         Returns:
             List of Comment entities ordered by creation date (newest first)
@@ -228,31 +448,42 @@ class CommentRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_pending_approval(self, limit: int = 100, offset: int = 0) -> List[Comment]:
+    async def get_pending_approval(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
         """
         Get comments that are pending approval.
         
         Args:
             limit: Maximum number of comments to return (default: 100)
-            offset: Number of comments to skip (default: 0)
+            offset: Number of comments to skip (default: 0, prefer cursor)
+            cursor: Position of the last comment of the previous page; when given,
+                the page starts right after it (default: None)
             
         Returns:
             List of Comment entities that are not approved
             
         Raises:
             RepositoryError: If there's an error accessing the repository
+            ValueError: If both offset and cursor are given
         """
         pass
 
 
 class CommentRepositoryError(Exception):
     """Base exception for comment repository operations."""
-    pass
+    
+    __slots__ = ()
 
 
 class CommentNotFoundError(CommentRepositoryError):
     """Exception raised when a comment is not found."""
     
+    __slots__ = ('comment_id',)
+    
     def __init__(self, comment_id: UUID):
         self.comment_id = comment_id
         super().__init__(f"Comment with ID {comment_id} not found")
@@ -261,6 +492,8 @@ class CommentNotFoundError(CommentRepositoryError):
 class DuplicateCommentError(CommentRepositoryError):
     """Exception raised when trying to create a comment that already exists."""
     
+    __slots__ = ('comment_id',)
+    
     def __init__(self, comment_id: UUID):
         self.comment_id = comment_id
         super().__init__(f"Comment with ID {comment_id} already exists")
@@ -0,0 +1,50 @@
+"""
+Repository Lifecycle - Domain Layer
+
+This module defines the base class shared by the repository interfaces. It
+gives every repository an explicit lifecycle, so callers can scope a group of
+repository calls to one borrowed connection and release it deterministically:
+    
+    async with repository as repo:
+        post = await repo.get_by_id(post_id)
+        exists = await repo.exists(other_id)
+"""
+
+from abc import ABC
+from types import TracebackType
+from typing import Optional, Type, TypeVar
+
+
+RepositoryT = TypeVar("RepositoryT", bound="AsyncRepository")
+
+
+class AsyncRepository(ABC):
+    """
+    Base class giving repositories an async context manager protocol.
+    
+    Implementations that own a connection or session release it in aclose().
+    Implementations that borrow one from their caller (for example a
+    request-scoped session) keep the default no-op, since the owner is
+    responsible for returning it to the pool.
+    """
+    
+    async def aclose(self) -> None:
+        """
+        Release any resources held by the repository.
+        
+        The default implementation does nothing.
+        """
+        return None
+    
+    async def __aenter__(self: RepositoryT) -> RepositoryT:
+        """Enter the repository scope and return the repository itself."""
+        return self
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        """Leave the repository scope, releasing its resources."""
+        await self.aclose()
@@ -0,0 +1,106 @@
+"""
+Pagination Primitives - Domain Layer
+
+This module defines the keyset (cursor) used by the repository interfaces to
+page through time-ordered listings. A cursor names the last item of the
+previous page, so the next page starts right after it instead of skipping
+OFFSET rows, and the cost of fetching a page does not grow with its depth.
+"""
+
+import base64
+import struct
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from uuid import UUID
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Token layout: microseconds since the epoch (signed 64-bit) followed by the 16 id bytes
+_TOKEN_FORMAT = struct.Struct(">q16s")
+
+
+@dataclass(frozen=True, slots=True)
+class PageCursor:
+    """
+    Position of the last item seen in a listing ordered by (created_at, id).
+    
+    Listings are ordered newest first with the id as a tie-breaker, so the
+    next page contains the items strictly after (created_at, id) in that order.
+    
+    Attributes:
+        created_at: Creation timestamp of the last item seen
+        id: Unique identifier of the last item seen
+    """
+    
+    created_at: datetime
+    id: UUID
+    
+    @classmethod
+    def after(cls, entity: Any) -> "PageCursor":
+        """
+        Build the cursor that continues a listing after the given entity.
+        
+        Args:
+            entity: The last entity of the current page (any entity with
+                created_at and id attributes)
+            
+        Returns:
+            PageCursor pointing at the entity
+        """
+        return cls(created_at=entity.created_at, id=entity.id)
+    
+    def encode(self) -> str:
+        """
+        Encode the cursor as an opaque URL-safe token.
+        
+        Naive timestamps are taken to be in UTC.
+        
+        Returns:
+            Token string that decode() turns back into an equal cursor
+        """
+        created_at = self.created_at
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        
+        micros = (created_at - _EPOCH) // _MICROSECOND
+        packed = _TOKEN_FORMAT.pack(micros, self.id.bytes)
+        return base64.urlsafe_b64encode(packed).rstrip(b"=").decode("ascii")
+    
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """
+        Decode a token produced by encode().
+        
+        Args:
+            token: Cursor token
+            
+        Returns:
+            The PageCursor the token describes, with a UTC timestamp
+            
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            packed = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            micros, id_bytes = _TOKEN_FORMAT.unpack(packed)
+            return cls(created_at=_EPOCH + micros * _MICROSECOND, id=UUID(bytes=id_bytes))
+        except (ValueError, struct.error, OverflowError) as e:
+            raise ValueError("Invalid page cursor") from e
+
+
+def check_page_args(offset: int, cursor: Optional[PageCursor]) -> None:
+    """
+    Reject paging requests that mix an offset with a cursor.
+    
+    Args:
+        offset: Number of items to skip (deprecated in favour of cursor)
+        cursor: Keyset cursor of the previous page, if any
+        
+    Raises:
+        ValueError: If both a non-zero offset and a cursor are given
+    """
+    if offset and cursor is not None:
+        raise ValueError("Cannot paginate with both offset and cursor")
@@ -9,14 +9,16 @@ Following Clean Architecture and SOLID principles, this interface:
 - Follows the Dependency Inversion Principle
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from abc import abstractmethod
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from ..entities.user import User
+from .lifecycle import AsyncRepository
+from .pagination import PageCursor
 
 
-class UserRepository(ABC):
+class UserRepository(AsyncRepository):
     """
     Abstract repository interface for User entities.
     
@@ -33,6 +35,9 @@ class UserRepository(ABC):
         """
         Create a new user in the repository.
         
+        Meant for request handlers working on one user; use create_many
+        for batches.
+        
         Args:
             user: The User entity to create
             
@@ -45,6 +50,26 @@ class UserRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def create_many(self, users: Sequence[User]) -> List[User]:
+        """
+        Create several users in the repository in a single batch.
+        
+        Bulk imports should use this instead of calling create in a loop,
+        which costs one round trip per user.
+        
+        Args:
+            users: The User entities to create
+            
+        Returns:
+            List of the created User entities, in the given order
+            
+        Raises:
+            RepositoryError: If the users cannot be created
+            DuplicateError: If any ID, username, or email already exists
+        """
+        pass
+    
     @abstractmethod
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
         """
@@ -61,6 +86,23 @@ class UserRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_by_ids(self, user_ids: Sequence[UUID]) -> Dict[UUID, User]:
+        """
+        Retrieve several users by their unique identifiers in one query.
+        
+        Args:
+            user_ids: The unique identifiers of the users
+            
+        Returns:
+            Dictionary mapping each found identifier to its User entity;
+            identifiers that do not exist are absent from the result
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+        """
+        pass
+    
     @abstractmethod
     async def get_by_username(self, username: str) -> Optional[User]:
         """
@@ -94,36 +136,137 @@ class UserRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_all(self, limit: int = 100, offset: int = 0) -> List[User]:
+    async def get_by_usernames(self, usernames: Sequence[str]) -> Dict[str, User]:
+        """
+        Retrieve several users by their usernames in one query.
+        
+        Args:
+            usernames: The usernames of the users
+            
+        Returns:
+            Dictionary mapping each found username to its User entity;
+            usernames that do not exist are absent from the result
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+        """
+        pass
+    
+    @abstractmethod
+    async def get_by_emails(self, emails: Sequence[str]) -> Dict[str, User]:
+        """
+        Retrieve several users by their email addresses in one query.
+        
+        Args:
+            emails: The email addresses of the users (matched case-insensitively)
+            
+        Returns:
+            Dictionary mapping each found email, lowercased, to its User entity;
+            emails that do not exist are absent from the result
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+        """
+        pass
+    
+    @abstractmethod
+    async def get_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[User]:
         """
         Retrieve all users with optional pagination.
         
         Args:
             limit: Maximum number of users to return (default: 100)
-            offset: Number of users to skip (default: 0)
+            offset: Number of users to skip (default: 0, prefer cursor)
+            cursor: Position of the last user of the previous page; when given,
+                the page starts right after it (default: None)
             
         Returns:
             List of User entities
             
         Raises:
             RepositoryError: If there's an error accessing the repository
+            ValueError: If both offset and cursor are given
         """
         pass
     
     @abstractmethod
-    async def get_active_users(self, limit: int = 100, offset: int = 0) -> List[User]:
+    async def get_all_raw(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[dict]:
         """
-        Retrieve all active users with optional pagination.
+        Retrieve users as plain dictionaries of stored column values.
+        
+        A read-only fast path for listings that are serialized straight
+        away: no entities are built, so no domain behavior is available.
+        Rows are ordered like get_all. The password hash is never included.
         
         Args:
             limit: Maximum number of users to return (default: 100)
             offset: Number of users to skip (default: 0)
+            cursor: Position of the last user of the previous page; when given,
+                the page starts right after it (default: None)
+            
+        Returns:
+            List of dictionaries with keys 'id', 'username',
+            'email', 'full_name', 'is_active', 'is_superuser', 'created_at'
+            and 'updated_at'
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+            ValueError: If both offset and cursor are given
+        """
+        pass
+    
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        """
+        Stream all users, newest first, without loading them all at once.
+        
+        Users are fetched in keyset-paginated batches, so memory use stays
+        bounded by batch_size however many users exist. Meant for exports
+        and reindexing jobs rather than request handlers.
+        
+        Args:
+            batch_size: Number of users fetched per query (default: 1000)
+            
+        Yields:
+            User entities ordered by creation date (newest first)
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+        """
+        pass
+    
+    @abstractmethod
+    async def get_active_users(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[User]:
+        """
+        Retrieve all active users with optional pagination.
+        
+        Args:
+            limit: Maximum number of users to return (default: 100)
+            offset: Number of users to skip (default: 0, prefer cursor)
+            cursor: Position of the last user of the previous page; when given,
+                the page starts right after it (default: None)
             
         Returns:
             List of active User entities
             
         Raises:
             RepositoryError: If there's an error accessing the repository
+            ValueError: If both offset and cursor are given
         """
         pass
     
@@ -132,6 +275,9 @@ class UserRepository(ABC):
         """
         Update an existing user in the repository.
         
+        Meant for request handlers working on one user; use update_many
+        for batches.
+        
         Args:
             user: The User entity with updated data
             
@@ -144,6 +290,23 @@ class UserRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def update_many(self, users: Sequence[User]) -> List[User]:
+        """
+        Update several existing users in the repository in a single batch.
+        
+        Args:
+            users: The User entities with updated data
+            
+        Returns:
+            List of the updated User entities, in the given order
+            
+        Raises:
+            RepositoryError: If there's an error updating the users
+            NotFoundError: If any of the users doesn't exist
+        """
+        pass
+    
     @abstractmethod
     async def delete(self, user_id: UUID) -> bool:
         """
@@ -160,6 +323,22 @@ class UserRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def delete_many(self, user_ids: Sequence[UUID]) -> int:
+        """
+        Delete several users from the repository in a single statement.
+        
+        Args:
+            user_ids: The unique identifiers of the users to delete
+            
+        Returns:
+            Number of users deleted (identifiers that didn't exist are ignored)
+            
+        Raises:
+            RepositoryError: If there's an error deleting the users
+        """
+        pass
+    
     @abstractmethod
     async def exists_by_username(self, username: str) -> bool:
         """
@@ -192,6 +371,26 @@ class UserRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def exists_by_username_or_email(self, username: str, email: str) -> Tuple[bool, bool]:
+        """
+        Check in one query whether a username and an email are already taken.
+        
+        Use this instead of calling exists_by_username and exists_by_email
+        one after the other, which costs two round trips.
+        
+        Args:
+            username: The username to check
+            email: The email to check
+            
+        Returns:
+            Tuple of (username exists, email exists)
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+        """
+        pass
+    
     @abstractmethod
     async def exists(self, user_id: UUID) -> bool:
         """
@@ -213,6 +412,9 @@ class UserRepository(ABC):
         """
         Get the total number of users in the repository.
         
+        This is an exact count and scans the table; prefer count_estimate()
+        when an approximate figure is enough.
+        
         Returns:
             Total number of users
             
@@ -234,11 +436,31 @@ class UserRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def count_estimate(self) -> int:
+        """
+        Get an approximate number of users in the repository.
+        
+        Much cheaper than an exact count on large tables; meant for displays
+        such as "~12k users" where exactness is not required.
+        
+        Returns:
+            Approximate number of users
+            
+        Raises:
+            RepositoryError: If there's an error accessing the repository
+        """
+        pass
+    
     @abstractmethod
     async def search_by_username(self, username_query: str, limit: int = 100) -> List[User]:
         """
         Search users by username (case-insensitive partial match).
         
+        Implementations must back this search with an index that serves
+        infix matches (e.g. a trigram or full-text index) rather than
+        scanning every username.
+        
         Args:
             username_query: The search query for the username
             limit: Maximum number of results to return (default: 100)
@@ -252,12 +474,18 @@ class UserRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_recent(self, limit: int = 10) -> List[User]:
+    async def get_recent(
+        self,
+        limit: int = 10,
+        cursor: Optional[PageCursor] = None
+    ) -> List[User]:
         """
         Get the most recently created users.
         
         Args:
             limit: Maximum number of recent users to return (default: 10)
+            cursor: Position of the last user of the previous page; when given,
+                the page starts right after it (default: None)
             
         Returns:
             List of User entities ordered by creation date (newest first)
@@ -270,12 +498,15 @@ class UserRepository(ABC):
 
 class UserRepositoryError(Exception):
     """Base exception for user repository operations."""
-    pass
+    
+    __slots__ = ()
 
 
 class UserNotFoundError(UserRepositoryError):
     """Exception raised when a user is not found."""
     
+    __slots__ = ('identifier', 'field')
+    
     def __init__(self, identifier: str, field: str = "id"):
         self.identifier = identifier
         self.field = field
@@ -285,6 +516,8 @@ class UserNotFoundError(UserRepositoryError):
 class DuplicateUserError(UserRepositoryError):
     """Exception raised when trying to create a user that already exists."""
     
+    __slots__ = ('identifier', 'field')
+    
     def __init__(self, identifier: str, field: str = "id"):
         self.identifier = identifier
         self.field = field
@@ -8,11 +8,14 @@ Following Clean Architecture principles, these use cases:
 - Are independent of frameworks and external concerns
 """
 
-from typing import Optional
+import asyncio
+import re
+from typing import Optional, Set
 from uuid import UUID
 from datetime import datetime, timedelta
 
 from ..entities.user import User
+from .token_cache import TokenUserCache
 from ..repositories.user_repository import (
     UserRepository,
     UserNotFoundError,
@@ -20,6 +23,29 @@ from ..repositories.user_repository import (
 )
 
 
+_PASSWORD_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+_HAS_UPPER = 1
+_HAS_LOWER = 2
+_HAS_DIGIT = 4
+_HAS_SPECIAL = 8
+_HAS_ALL = _HAS_UPPER | _HAS_LOWER | _HAS_DIGIT | _HAS_SPECIAL
+
+# Fast path for the common case: an ASCII-classed strong password is accepted
+# by one compiled match. Every class here is a subset of the one the scan in
+# _validate_password_strength accepts, so a match never admits a weak password.
+_STRONG_PASSWORD = re.compile(
+    r"(?=[^A-Z]*[A-Z])(?=[^a-z]*[a-z])(?=\D*\d)"
+    r"(?=[^!@#$%^&*()_+\-=\[\]{}|;:,.<>?]*[!@#$%^&*()_+\-=\[\]{}|;:,.<>?])"
+    r".{8,}",
+    re.DOTALL
+)
+
+# Strong references to emails being sent in the background, so the tasks
+# are not garbage collected before they finish
+_background_tasks: Set[asyncio.Task] = set()
+
+
 class AuthUseCases:
     """
     Use cases for authentication operations.
@@ -35,7 +61,9 @@ class AuthUseCases:
         self,
         user_repository: UserRepository,
         password_hasher: 'PasswordHasher',
-        token_manager: 'TokenManager'
+        token_manager: 'TokenManager',
+        token_cache: Optional[TokenUserCache] = None,
+        email_sender: Optional['EmailSender'] = None
     ):
         """
         Initialize the authentication use cases.
@@ -44,10 +72,15 @@ class AuthUseCases:
             user_repository: Repository for user persistence
             password_hasher: Service for password hashing and verification
             token_manager: Service for JWT token management
+            token_cache: Cache of users by access token, shared across
+                requests (optional; disabled when None)
+            email_sender: Service for sending emails to users (optional)
         """
         self._user_repository = user_repository
         self._password_hasher = password_hasher
         self._token_manager = token_manager
+        self._token_cache = token_cache
+        self._email_sender = email_sender
     
     async def register_user(
         self,
@@ -81,16 +114,18 @@ class AuthUseCases:
         # Validate password strength
         self._validate_password_strength(password)
         
-        # Check if username already exists
-        if await self._user_repository.exists_by_username(username):
+        # Check if username or email already exist, in a single query
+        username_exists, email_exists = await self._user_repository.exists_by_username_or_email(
+            username, email
+        )
+        if username_exists:
             raise DuplicateUserError(username, "username")
         
-        # Check if email already exists
-        if await self._user_repository.exists_by_email(email):
+        if email_exists:
             raise DuplicateUserError(email, "email")
         
         # Hash the password
-        password_hash = self._password_hasher.hash_password(password)
+        password_hash = await self._password_hasher.hash_password_async(password)
         
         # Create user entity
         user = User(
@@ -119,17 +154,19 @@ class AuthUseCases:
         Returns:
             User entity if authentication successful, None otherwise
         """
-        # Try to find user by username first, then by email
-        user = await self._user_repository.get_by_username(username_or_email)
-        if not user:
+        # Usernames cannot contain '@' and emails must, so a single lookup
+        # is enough to find the user
+        if '@' in username_or_email:
             user = await self._user_repository.get_by_email(username_or_email)
+        else:
+            user = await self._user_repository.get_by_username(username_or_email)
         
         # If user not found or inactive, authentication fails
         if not user or not user.is_active:
             return None
         
         # Verify password
-        if not self._password_hasher.verify_password(password, user.password_hash):
+        if not await self._password_hasher.verify_password_async(password, user.password_hash):
             return None
         
         return user
@@ -145,7 +182,8 @@ class AuthUseCases:
             Dictionary containing token information
         """
         token_data = {
-            "sub": str(user.id),
+            # Dashless hex: shorter than str(user.id), and UUID(hex=...) accepts both
+            "sub": user.id.hex,
             "username": user.username,
             "email": user.email,
             "is_superuser": user.is_superuser
@@ -164,28 +202,42 @@ class AuthUseCases:
         """
         Get the current user from a JWT token.
         
+        When a token cache is configured, a token seen recently is answered
+        from the cache without decoding it or querying the repository.
+        
         Args:
             token: JWT access token
             
         Returns:
             User entity if token is valid, None otherwise
         """
+        if self._token_cache is not None:
+            user = self._token_cache.get(token)
+            if user is not None:
+                return user
+        
+        # Decode and validate token
         try:
-            # Decode and validate token
             payload = self._token_manager.decode_token(token)
-            user_id = UUID(payload.get("sub"))
-            
-            # Get user from repository
-            user = await self._user_repository.get_by_id(user_id)
-            
-            # Check if user is still active
-            if user and user.is_active:
-                return user
-            
+        except InvalidTokenError:
             return None
-            
-        except Exception:
+        
+        user_id = self._uuid_claim(payload, "sub")
+        if user_id is None:
             return None
+        
+        # Get user from repository
+        user = await self._user_repository.get_by_id(user_id)
+        
+        # Check if user is still active
+        if not user or not user.is_active:
+            return None
+        
+        exp = payload.get("exp")
+        if self._token_cache is not None and isinstance(exp, (int, float)):
+            self._token_cache.put(token, user, exp)
+        
+        return user
     
     async def change_password(
         self,
@@ -213,29 +265,33 @@ class AuthUseCases:
             UserNotFoundError: If user doesn't exist
             ValueError: If validation fails
         """
+        # Validate new password strength before any lookup or hashing
+        self._validate_password_strength(new_password)
+        
+        # Check if new password is different; the current password is
+        # verified against the stored hash below, so comparing plaintexts is enough
+        if new_password == current_password:
+            raise ValueError("New password must be different from current password")
+        
         # Get user
         user = await self._user_repository.get_by_id(user_id)
         if not user:
             raise UserNotFoundError(str(user_id))
         
         # Verify current password
-        if not self._password_hasher.verify_password(current_password, user.password_hash):
+        if not await self._password_hasher.verify_password_async(current_password, user.password_hash):
             raise ValueError("Current password is incorrect")
         
-        # Validate new password strength
-        self._validate_password_strength(new_password)
-        
-        # Check if new password is different
-        if self._password_hasher.verify_password(new_password, user.password_hash):
-            raise ValueError("New password must be different from current password")
-        
         # Hash new password and update user
-        new_password_hash = self._password_hasher.hash_password(new_password)
+        new_password_hash = await self._password_hasher.hash_password_async(new_password)
         user.update_password_hash(new_password_hash)
         
         # Save updated user
         await self._user_repository.update(user)
         
+        if self._token_cache is not None:
+            self._token_cache.invalidate_user(user.id)
+        
         return True
     
     async def reset_password(self, email: str) -> bool:
@@ -244,6 +300,9 @@ class AuthUseCases:
         
         Business Rule: Only active users can reset passwords.
         
+        The reset email is sent in the background, so the response does not
+        wait for the email provider.
+        
         Args:
             email: Email address of the user
             
@@ -257,12 +316,14 @@ class AuthUseCases:
         if not user or not user.is_active:
             return True
         
-        # Generate reset token (implementation would send email)
-        reset_token = self._token_manager.create_reset_token({"user_id": str(user.id)})
+        # Generate reset token
+        reset_token = self._token_manager.create_reset_token({"user_id": user.id.hex})
         
-        # In a real implementation, you would send an email with the reset token
-        # For now, we just log it (in production, use proper logging)
-        print(f"Password reset token for {email}: {reset_token}")
+        # Send the reset email without waiting for it
+        if self._email_sender is not None:
+            task = asyncio.create_task(self._email_sender.send_password_reset(email, reset_token))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
         
         return True
     
@@ -284,30 +345,56 @@ class AuthUseCases:
         Raises:
             ValueError: If token is invalid or password validation fails
         """
+        # Validate new password before decoding the token or loading the user
+        self._validate_password_strength(new_password)
+        
+        # Decode reset token
         try:
-            # Decode reset token
             payload = self._token_manager.decode_reset_token(reset_token)
-            user_id = UUID(payload.get("user_id"))
-            
-            # Get user
-            user = await self._user_repository.get_by_id(user_id)
-            if not user or not user.is_active:
-                raise ValueError("Invalid reset token")
-            
-            # Validate new password
-            self._validate_password_strength(new_password)
-            
-            # Hash new password and update user
-            new_password_hash = self._password_hasher.hash_password(new_password)
-            user.update_password_hash(new_password_hash)
-            
-            # Save updated user
-            await self._user_repository.update(user)
-            
-            return True
-            
-        except Exception:
+        except InvalidTokenError:
+            raise ValueError("Invalid or expired reset token")
+        
+        user_id = self._uuid_claim(payload, "user_id")
+        if user_id is None:
+            raise ValueError("Invalid or expired reset token")
+        
+        # Get user
+        user = await self._user_repository.get_by_id(user_id)
+        if not user or not user.is_active:
             raise ValueError("Invalid or expired reset token")
+        
+        # Hash new password and update user
+        new_password_hash = await self._password_hasher.hash_password_async(new_password)
+        user.update_password_hash(new_password_hash)
+        
+        # Save updated user
+        await self._user_repository.update(user)
+        
+        if self._token_cache is not None:
+            self._token_cache.invalidate_user(user.id)
+        
+        return True
+    
+    @staticmethod
+    def _uuid_claim(payload: dict, claim: str) -> Optional[UUID]:
+        """
+        Read a UUID claim from a decoded token payload.
+        
+        Args:
+            payload: Decoded token payload
+            claim: Name of the claim holding the UUID
+            
+        Returns:
+            The UUID, or None if the claim is missing or malformed
+        """
+        value = payload.get(claim)
+        if type(value) is not str:
+            return None
+        
+        try:
+            return UUID(hex=value)
+        except ValueError:
+            return None
     
     def _validate_password_strength(self, password: str) -> None:
         """
@@ -320,27 +407,48 @@ class AuthUseCases:
         - Password must contain at least one digit
         - Password must contain at least one special character
         
+        A precompiled pattern accepts typical strong passwords in one match;
+        otherwise the character classes are collected in a single pass over
+        the password to report which requirement is missing.
+        
         Args:
             password: Plain text password to validate
             
         Raises:
             ValueError: If password doesn't meet requirements
         """
+        if _STRONG_PASSWORD.match(password):
+            return
+        
         if len(password) < 8:
             raise ValueError("Password must be at least 8 characters long")
         
-        if not any(c.isupper() for c in password):
+        flags = 0
+        for c in password:
+            if c.isupper():
+                flags |= _HAS_UPPER
+            elif c.islower():
+                flags |= _HAS_LOWER
+            elif c.isdigit():
+                flags |= _HAS_DIGIT
+            elif c in _PASSWORD_SPECIAL_CHARS:
+                flags |= _HAS_SPECIAL
+            else:
+                continue
+            
+            if flags == _HAS_ALL:
+                return
+        
+        if not flags & _HAS_UPPER:
             raise ValueError("Password must contain at least one uppercase letter")
         
-        if not any(c.islower() for c in password):
+        if not flags & _HAS_LOWER:
             raise ValueError("Password must contain at least one lowercase letter")
         
-        if not any(c.isdigit() for c in password):
+        if not flags & _HAS_DIGIT:
             raise ValueError("Password must contain at least one digit")
         
-        special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-        if not any(c in special_chars for c in password):
-            raise ValueError("Password must contain at least one special character")
+        raise ValueError("Password must contain at least one special character")
 
 
 class AuthUseCaseError(Exception):
@@ -353,6 +461,11 @@ class InvalidCredentialsError(AuthUseCaseError):
     pass
 
 
+class InvalidTokenError(AuthUseCaseError):
+    """Exception raised when a token cannot be decoded or validated."""
+    pass
+
+
 class TokenExpiredError(AuthUseCaseError):
     """Exception raised when a token has expired."""
     pass
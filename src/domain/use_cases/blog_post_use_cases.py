@@ -9,6 +9,7 @@ Following Clean Architecture principles, these use cases:
 - Are independent of frameworks and external concerns
 """
 
+import asyncio
 from typing import List, Optional
 from uuid import UUID
 
@@ -16,10 +17,12 @@ from ..entities.blog_post import BlogPost
 from ..entities.comment import Comment
 from ..repositories.blog_post_repository import (
     BlogPostRepository,
-    BlogPostNotFoundError,
-    DuplicateBlogPostError
+    BlogPostNotFoundError
 )
 from ..repositories.comment_repository import CommentRepository
+from ..repositories.pagination import PageCursor
+from .entity_cache import EntityCache
+from .expiring_value import ExpiringValue
 
 
 class BlogPostUseCases:
@@ -37,7 +40,10 @@ class BlogPostUseCases:
     def __init__(
         self,
         blog_post_repository: BlogPostRepository,
-        comment_repository: CommentRepository
+        comment_repository: CommentRepository,
+        blog_post_cache: Optional[EntityCache[BlogPost]] = None,
+        statistics_cache: Optional[ExpiringValue[dict]] = None,
+        concurrent_reads: bool = False
     ):
         """
         Initialize the blog post use cases.
@@ -45,9 +51,28 @@ class BlogPostUseCases:
         Args:
             blog_post_repository: Repository for blog post persistence
             comment_repository: Repository for comment persistence
+            blog_post_cache: Cache of hot blog posts, shared across requests
+                (optional; disabled when None). Writes only invalidate it, and
+                the cache given for a transaction should apply invalidations
+                once the transaction commits
+            statistics_cache: Cache of the blog post statistics, shared across
+                requests; cleared by every blog post write, and the cache
+                given for a transaction should apply the clear once the
+                transaction commits (optional)
+            concurrent_reads: Whether the two repositories can serve calls at
+                the same time, i.e. they do not share a database session
+                (default: False, reads are awaited one after the other)
         """
         self._blog_post_repository = blog_post_repository
         self._comment_repository = comment_repository
+        self._blog_post_cache = blog_post_cache
+        self._statistics_cache = statistics_cache
+        self._concurrent_reads = concurrent_reads
+    
+    def _invalidate_statistics(self) -> None:
+        """Drop the cached blog post statistics after a blog post write."""
+        if self._statistics_cache is not None:
+            self._statistics_cache.clear()
     
     async def create_blog_post(self, title: str, content: str) -> BlogPost:
         """
@@ -71,17 +96,19 @@ class BlogPostUseCases:
         # Create the blog post entity (validation happens in entity)
         blog_post = BlogPost(title=title, content=content)
         
-        # Check if blog post already exists (unlikely with UUID, but good practice)
-        if await self._blog_post_repository.exists(blog_post.id):
-            raise DuplicateBlogPostError(blog_post.id)
-        
-        # Persist the blog post
-        return await self._blog_post_repository.create(blog_post)
+        # Persist the blog post; the repository raises DuplicateBlogPostError
+        # if the ID is taken, so no separate existence check is needed
+        created_blog_post = await self._blog_post_repository.create(blog_post)
+        self._invalidate_statistics()
+        return created_blog_post
     
     async def get_blog_post_by_id(self, blog_post_id: UUID) -> BlogPost:
         """
         Retrieve a blog post by its ID.
         
+        When a blog post cache is configured, recently read blog posts are
+        served from it without a repository call.
+        
         Args:
             blog_post_id: Unique identifier of the blog post
             
@@ -91,19 +118,34 @@ class BlogPostUseCases:
         Raises:
             BlogPostNotFoundError: If the blog post doesn't exist
         """
+        if self._blog_post_cache is not None:
+            cached = self._blog_post_cache.get(blog_post_id)
+            if cached is not None:
+                return cached.copy()
+        
         blog_post = await self._blog_post_repository.get_by_id(blog_post_id)
         
         if blog_post is None:
             raise BlogPostNotFoundError(blog_post_id)
         
+        self._cache_blog_post(blog_post)
         return blog_post
     
+    def _cache_blog_post(self, blog_post: BlogPost) -> None:
+        """Store a private copy of a blog post in the cache, if configured."""
+        if self._blog_post_cache is not None:
+            self._blog_post_cache.put(blog_post.copy())
+    
     async def get_blog_post_with_comments(self, blog_post_id: UUID) -> tuple[BlogPost, List[Comment]]:
         """
         Retrieve a blog post with its associated comments.
         
         Business Rule: Only approved comments are returned for public viewing.
         
+        The blog post and its comments are fetched concurrently when the use
+        cases were built with concurrent_reads, and one after the other
+        otherwise.
+        
         Args:
             blog_post_id: Unique identifier of the blog post
             
@@ -113,28 +155,60 @@ class BlogPostUseCases:
         Raises:
             BlogPostNotFoundError: If the blog post doesn't exist
         """
-        # Get the blog post
-        blog_post = await self.get_blog_post_by_id(blog_post_id)
+        # A cached blog post leaves only the comments to fetch
+        if self._blog_post_cache is not None:
+            cached = self._blog_post_cache.get(blog_post_id)
+            if cached is not None:
+                comments = await self._comment_repository.get_approved_by_blog_post_id(blog_post_id)
+                return cached.copy(), comments
         
-        # Get approved comments for the blog post
-        comments = await self._comment_repository.get_approved_by_blog_post_id(blog_post_id)
+        if self._concurrent_reads:
+            blog_post, comments = await asyncio.gather(
+                self._blog_post_repository.get_by_id(blog_post_id),
+                self._comment_repository.get_approved_by_blog_post_id(blog_post_id)
+            )
+            if blog_post is None:
+                raise BlogPostNotFoundError(blog_post_id)
+        else:
+            # A shared session cannot run two queries at once
+            blog_post = await self._blog_post_repository.get_by_id(blog_post_id)
+            if blog_post is None:
+                raise BlogPostNotFoundError(blog_post_id)
+            comments = await self._comment_repository.get_approved_by_blog_post_id(blog_post_id)
         
+        self._cache_blog_post(blog_post)
         return blog_post, comments
     
-    async def get_all_blog_posts(self, limit: int = 100, offset: int = 0) -> List[BlogPost]:
+    async def get_all_blog_posts(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[BlogPost]:
         """
         Retrieve all blog posts with pagination.
         
+        Prefer cursor over offset: a cursor page costs the same at any depth.
+        
         Args:
             limit: Maximum number of blog posts to return
             offset: Number of blog posts to skip
+            cursor: Position of the last blog post of the previous page
             
         Returns:
             List of BlogPost entities
+            
+        Raises:
+            ValueError: If both offset and cursor are given
         """
-        return await self._blog_post_repository.get_all(limit=limit, offset=offset)
+        return await self._blog_post_repository.get_all(limit=limit, offset=offset, cursor=cursor)
     
-    async def get_blog_posts_summary(self, limit: int = 100, offset: int = 0) -> List[dict]:
+    async def get_blog_posts_summary(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[dict]:
         """
         Get a summary of all blog posts including comment counts.
         
@@ -144,27 +218,18 @@ class BlogPostUseCases:
         Args:
             limit: Maximum number of blog posts to return
             offset: Number of blog posts to skip
+            cursor: Position of the last blog post of the previous page
             
         Returns:
             List of dictionaries containing blog post summaries with comment counts
-        """
-        blog_posts = await self._blog_post_repository.get_all(limit=limit, offset=offset)
-        
-        # Build summary with comment counts
-        summaries = []
-        for blog_post in blog_posts:
-            comment_count = await self._comment_repository.count_approved_by_blog_post_id(blog_post.id)
             
-            summary = {
-                'id': str(blog_post.id),
-                'title': blog_post.title,
-                'created_at': blog_post.created_at.isoformat(),
-                'updated_at': blog_post.updated_at.isoformat(),
-                'comment_count': comment_count
-            }
-            summaries.append(summary)
-        
-        return summaries
+        Raises:
+            ValueError: If both offset and cursor are given
+        """
+        # Summary rows come straight from the repository, without entities
+        return await self._blog_post_repository.get_all_summaries(
+            limit=limit, offset=offset, cursor=cursor
+        )
     
     async def update_blog_post(self, blog_post_id: UUID, title: str = None, content: str = None) -> BlogPost:
         """
@@ -187,8 +252,11 @@ class BlogPostUseCases:
             BlogPostNotFoundError: If the blog post doesn't exist
             ValueError: If the new title or content are invalid
         """
-        # Get the existing blog post
-        blog_post = await self.get_blog_post_by_id(blog_post_id)
+        # Get the existing blog post from the repository, never from the cache,
+        # so fields left unchanged are not overwritten with stale values
+        blog_post = await self._blog_post_repository.get_by_id(blog_post_id)
+        if blog_post is None:
+            raise BlogPostNotFoundError(blog_post_id)
         
         # Update fields if provided
         if title is not None:
@@ -198,7 +266,13 @@ class BlogPostUseCases:
             blog_post.update_content(content)
         
         # Persist the changes
-        return await self._blog_post_repository.update(blog_post)
+        updated_blog_post = await self._blog_post_repository.update(blog_post)
+        
+        # Invalidate rather than cache the new version, which is not committed yet
+        if self._blog_post_cache is not None:
+            self._blog_post_cache.invalidate(blog_post_id)
+        self._invalidate_statistics()
+        return updated_blog_post
     
     async def delete_blog_post(self, blog_post_id: UUID) -> bool:
         """
@@ -206,34 +280,40 @@ class BlogPostUseCases:
         
         Business Rule: When a blog post is deleted, all its comments are also deleted.
         
+        The blog post repository removes the comments together with the post,
+        atomically and in the same statement.
+        
         Args:
             blog_post_id: Unique identifier of the blog post
             
         Returns:
             True if the blog post was deleted, False if it didn't exist
         """
-        # Check if blog post exists
-        if not await self._blog_post_repository.exists(blog_post_id):
-            return False
-        
-        # Delete all comments associated with the blog post
-        await self._comment_repository.delete_by_blog_post_id(blog_post_id)
+        deleted = await self._blog_post_repository.delete(blog_post_id)
         
-        # Delete the blog post
-        return await self._blog_post_repository.delete(blog_post_id)
+        if self._blog_post_cache is not None:
+            self._blog_post_cache.invalidate(blog_post_id)
+        self._invalidate_statistics()
+        return deleted
     
-    async def search_blog_posts(self, title_query: str, limit: int = 100) -> List[BlogPost]:
+    async def search_blog_posts(
+        self,
+        title_query: str,
+        limit: int = 100,
+        cursor: Optional[PageCursor] = None
+    ) -> List[BlogPost]:
         """
         Search blog posts by title.
         
         Args:
             title_query: Search query for the title
             limit: Maximum number of results to return
+            cursor: Position of the last result of the previous page
             
         Returns:
             List of BlogPost entities matching the search criteria
         """
-        return await self._blog_post_repository.search_by_title(title_query, limit=limit)
+        return await self._blog_post_repository.search_by_title(title_query, limit=limit, cursor=cursor)
     
     async def get_recent_blog_posts(self, limit: int = 10) -> List[BlogPost]:
         """
@@ -251,17 +331,30 @@ class BlogPostUseCases:
         """
         Get statistics about blog posts.
         
+        The exact total counts every blog post, so the result is served from
+        the statistics cache, when configured, until it expires or a blog
+        post is written. Comment counts in it may lag by up to the cache TTL.
+        
         Returns:
             Dictionary containing blog post statistics
         """
-        total_posts = await self._blog_post_repository.count()
-        recent_posts = await self._blog_post_repository.get_recent(limit=5)
+        if self._statistics_cache is not None:
+            cached = self._statistics_cache.get()
+            if cached is not None:
+                return dict(cached)
+        
+        total_posts, recent_posts = await self._blog_post_repository.get_recent_with_total(limit=5)
         
-        return {
+        statistics = {
             'total_posts': total_posts,
             'recent_posts_count': len(recent_posts),
             'recent_posts': [post.to_dict() for post in recent_posts]
         }
+        
+        if self._statistics_cache is not None:
+            self._statistics_cache.set(statistics)
+            return dict(statistics)
+        return statistics
 
 
 class BlogPostUseCaseError(Exception):
@@ -16,13 +16,15 @@ from ..entities.comment import Comment
 from ..entities.blog_post import BlogPost
 from ..repositories.comment_repository import (
     CommentRepository,
-    CommentNotFoundError,
-    DuplicateCommentError
+    CommentNotFoundError
 )
 from ..repositories.blog_post_repository import (
     BlogPostRepository,
     BlogPostNotFoundError
 )
+from ..repositories.pagination import PageCursor
+from .entity_cache import EntityCache
+from .expiring_value import ExpiringValue
 
 
 class CommentUseCases:
@@ -40,17 +42,36 @@ class CommentUseCases:
     def __init__(
         self,
         comment_repository: CommentRepository,
-        blog_post_repository: BlogPostRepository
+        blog_post_repository: BlogPostRepository,
+        blog_post_cache: Optional[EntityCache[BlogPost]] = None,
+        statistics_cache: Optional[ExpiringValue[dict]] = None
     ):
         """
         Initialize the comment use cases.
         
+        Operations that write through both repositories are only atomic if
+        the repositories share one transaction (in the SQLAlchemy
+        implementation, one session), as the web controllers arrange.
+        
         Args:
             comment_repository: Repository for comment persistence
             blog_post_repository: Repository for blog post persistence
+            blog_post_cache: Cache of hot blog posts, shared with the blog post
+                use cases; entries are dropped when a post's comments change,
+                once the transaction commits (optional)
+            statistics_cache: Cache of the comment statistics, shared across
+                requests; cleared by every comment write, once the
+                transaction commits (optional)
         """
         self._comment_repository = comment_repository
         self._blog_post_repository = blog_post_repository
+        self._blog_post_cache = blog_post_cache
+        self._statistics_cache = statistics_cache
+    
+    def _invalidate_statistics(self) -> None:
+        """Drop the cached comment statistics after a comment write."""
+        if self._statistics_cache is not None:
+            self._statistics_cache.clear()
     
     async def create_comment(
         self,
@@ -82,11 +103,6 @@ class CommentUseCases:
             ValueError: If content or author information is invalid
             DuplicateCommentError: If a comment with the same ID already exists
         """
-        # Verify that the blog post exists
-        blog_post = await self._blog_post_repository.get_by_id(blog_post_id)
-        if blog_post is None:
-            raise BlogPostNotFoundError(blog_post_id)
-        
         # Create the comment entity (validation happens in entity)
         comment = Comment(
             content=content,
@@ -95,16 +111,13 @@ class CommentUseCases:
             author_email=author_email
         )
         
-        # Check if comment already exists (unlikely with UUID, but good practice)
-        if await self._comment_repository.exists(comment.id):
-            raise DuplicateCommentError(comment.id)
-        
-        # Persist the comment
+        # Persist the comment; the repository reports a missing blog post or a
+        # duplicate ID, so neither needs a query beforehand
         created_comment = await self._comment_repository.create(comment)
         
-        # Update the blog post's comment list (business rule)
-        blog_post.add_comment_id(created_comment.id)
-        await self._blog_post_repository.update(blog_post)
+        if self._blog_post_cache is not None:
+            self._blog_post_cache.invalidate(blog_post_id)
+        self._invalidate_statistics()
         
         return created_comment
     
@@ -133,37 +146,46 @@ class CommentUseCases:
         blog_post_id: UUID,
         approved_only: bool = True,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
     ) -> List[Comment]:
         """
-        Retrieve comments for a specific blog post.
+        Retrieve comments for a specific blog post, newest first.
         
         Business Rule: By default, only approved comments are returned for public viewing.
         
+        Prefer cursor over offset for deep pages: a cursor page is an index
+        seek, while an offset page scans and discards every skipped comment.
+        
         Args:
             blog_post_id: Unique identifier of the blog post
             approved_only: Whether to return only approved comments (default: True)
             limit: Maximum number of comments to return
             offset: Number of comments to skip
+            cursor: Position of the last comment of the previous page
             
         Returns:
             List of Comment entities
             
         Raises:
             BlogPostNotFoundError: If the blog post doesn't exist
+            ValueError: If both offset and cursor are given
         """
-        # Verify that the blog post exists
-        if not await self._blog_post_repository.exists(blog_post_id):
-            raise BlogPostNotFoundError(blog_post_id)
-        
         if approved_only:
-            return await self._comment_repository.get_approved_by_blog_post_id(
-                blog_post_id, limit=limit, offset=offset
+            comments = await self._comment_repository.get_approved_by_blog_post_id(
+                blog_post_id, limit=limit, offset=offset, cursor=cursor
             )
         else:
-            return await self._comment_repository.get_by_blog_post_id(
-                blog_post_id, limit=limit, offset=offset
+            comments = await self._comment_repository.get_by_blog_post_id(
+                blog_post_id, limit=limit, offset=offset, cursor=cursor
             )
+        
+        # A page with comments proves the blog post exists; only an empty
+        # page needs the extra existence check
+        if not comments and not await self._blog_post_repository.exists(blog_post_id):
+            raise BlogPostNotFoundError(blog_post_id)
+        
+        return comments
     
     async def update_comment(
         self,
@@ -204,7 +226,9 @@ class CommentUseCases:
             comment.update_author_info(name=author_name, email=author_email)
         
         # Persist the changes
-        return await self._comment_repository.update(comment)
+        updated_comment = await self._comment_repository.update(comment)
+        self._invalidate_statistics()
+        return updated_comment
     
     async def approve_comment(self, comment_id: UUID) -> Comment:
         """
@@ -221,9 +245,12 @@ class CommentUseCases:
         Raises:
             CommentNotFoundError: If the comment doesn't exist
         """
-        comment = await self.get_comment_by_id(comment_id)
-        comment.approve()
-        return await self._comment_repository.update(comment)
+        # A single conditional UPDATE; no read of the comment beforehand
+        [updated_comment] = await self._comment_repository.set_approval_many(
+            [comment_id], approved=True
+        )
+        self._invalidate_statistics()
+        return updated_comment
     
     async def reject_comment(self, comment_id: UUID) -> Comment:
         """
@@ -240,16 +267,17 @@ class CommentUseCases:
         Raises:
             CommentNotFoundError: If the comment doesn't exist
         """
-        comment = await self.get_comment_by_id(comment_id)
-        comment.reject()
-        return await self._comment_repository.update(comment)
+        # A single conditional UPDATE; no read of the comment beforehand
+        [updated_comment] = await self._comment_repository.set_approval_many(
+            [comment_id], approved=False
+        )
+        self._invalidate_statistics()
+        return updated_comment
     
     async def delete_comment(self, comment_id: UUID) -> bool:
         """
         Delete a comment.
         
-        Business Rule: When a comment is deleted, it's also removed from the blog post's comment list.
-        
         Args:
             comment_id: Unique identifier of the comment
             
@@ -262,18 +290,14 @@ class CommentUseCases:
         except CommentNotFoundError:
             return False
         
-        # Remove comment from blog post's comment list
-        blog_post = await self._blog_post_repository.get_by_id(comment.blog_post_id)
-        if blog_post:
-            try:
-                blog_post.remove_comment_id(comment_id)
-                await self._blog_post_repository.update(blog_post)
-            except ValueError:
-                # Comment ID not in blog post's list, continue with deletion
-                pass
-        
-        # Delete the comment
-        return await self._comment_repository.delete(comment_id)
+        deleted = await self._comment_repository.delete(comment_id)
+        
+        # The post's comment count changed
+        if self._blog_post_cache is not None:
+            self._blog_post_cache.invalidate(comment.blog_post_id)
+        self._invalidate_statistics()
+        
+        return deleted
     
     async def get_recent_comments(self, limit: int = 10) -> List[Comment]:
         """
@@ -287,36 +311,63 @@ class CommentUseCases:
         """
         return await self._comment_repository.get_recent(limit=limit)
     
-    async def get_pending_comments(self, limit: int = 100, offset: int = 0) -> List[Comment]:
+    async def get_pending_comments(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
         """
-        Get comments that are pending approval.
+        Get comments that are pending approval, newest first.
         
-        This is useful for moderation workflows.
+        This is useful for moderation workflows. Prefer cursor over offset
+        when walking the whole queue.
         
         Args:
             limit: Maximum number of comments to return
             offset: Number of comments to skip
+            cursor: Position of the last comment of the previous page
             
         Returns:
             List of Comment entities that are not approved
+            
+        Raises:
+            ValueError: If both offset and cursor are given
         """
-        return await self._comment_repository.get_pending_approval(limit=limit, offset=offset)
+        return await self._comment_repository.get_pending_approval(
+            limit=limit, offset=offset, cursor=cursor
+        )
     
     async def get_comment_statistics(self) -> dict:
         """
         Get statistics about comments.
         
+        With a statistics cache, the result is computed at most once per
+        cache TTL between comment writes.
+        
         Returns:
             Dictionary containing comment statistics
         """
+        if self._statistics_cache is not None:
+            cached = self._statistics_cache.get()
+            if cached is not None:
+                return dict(cached)
+        
+        # Sequential on purpose: both queries go through the same repository,
+        # and a repository session cannot run two queries at once
         recent_comments = await self._comment_repository.get_recent(limit=5)
         pending_comments = await self._comment_repository.get_pending_approval(limit=1)
         
-        return {
+        statistics = {
             'recent_comments_count': len(recent_comments),
             'pending_approval_count': len(pending_comments),
             'recent_comments': [comment.to_dict() for comment in recent_comments]
         }
+        
+        if self._statistics_cache is not None:
+            self._statistics_cache.set(statistics)
+            return dict(statistics)
+        return statistics
     
     async def moderate_comments_batch(
         self,
@@ -326,6 +377,9 @@ class CommentUseCases:
         """
         Perform batch moderation actions on multiple comments.
         
+        All comments are moderated with a single repository call, so either
+        every comment is moderated or none is.
+        
         Args:
             comment_ids: List of comment IDs to moderate
             action: Action to perform ('approve' or 'reject')
@@ -340,17 +394,11 @@ class CommentUseCases:
         if action not in ['approve', 'reject']:
             raise ValueError("Action must be 'approve' or 'reject'")
         
-        moderated_comments = []
-        
-        for comment_id in comment_ids:
-            if action == 'approve':
-                comment = await self.approve_comment(comment_id)
-            else:  # reject
-                comment = await self.reject_comment(comment_id)
-            
-            moderated_comments.append(comment)
-        
-        return moderated_comments
+        moderated = await self._comment_repository.set_approval_many(
+            comment_ids, approved=(action == 'approve')
+        )
+        self._invalidate_statistics()
+        return moderated
 
 
 class CommentUseCaseError(Exception):
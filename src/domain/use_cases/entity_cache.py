@@ -0,0 +1,91 @@
+"""
+Entity Cache - Domain Layer
+
+This module contains a small in-process cache of entities keyed by their
+identifiers. It lets use cases answer repeated reads of hot entities without
+a repository round trip, for a bounded time.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Optional, Tuple, TypeVar
+from uuid import UUID
+
+
+T = TypeVar("T")
+
+
+class EntityCache(Generic[T]):
+    """
+    Bounded TTL cache of entities keyed by ID.
+    
+    Entries expire ttl seconds after they are stored, which bounds how long a
+    change made by another process can go unnoticed. When full, the least
+    recently used entry is evicted. Callers must not mutate the entities they
+    get back; copy them first.
+    
+    Attributes:
+        max_size: Maximum number of cached entities
+        ttl: Number of seconds an entry stays valid
+    """
+    
+    def __init__(self, max_size: int = 4096, ttl: float = 60.0):
+        """
+        Initialize the entity cache.
+        
+        Args:
+            max_size: Maximum number of cached entities (default: 4096)
+            ttl: Number of seconds an entry stays valid (default: 60)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[UUID, Tuple[Any, float]]" = OrderedDict()
+    
+    def get(self, entity_id: UUID) -> Optional[T]:
+        """
+        Get a cached entity.
+        
+        Args:
+            entity_id: ID of the entity
+            
+        Returns:
+            The cached entity, or None if absent or expired
+        """
+        entry = self._entries.get(entity_id)
+        if entry is None:
+            return None
+        
+        entity, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[entity_id]
+            return None
+        
+        self._entries.move_to_end(entity_id)
+        return entity
+    
+    def put(self, entity: T) -> None:
+        """
+        Cache an entity under its ID.
+        
+        Args:
+            entity: Entity to cache (any entity with an id attribute)
+        """
+        entries = self._entries
+        entries[entity.id] = (entity, time.monotonic() + self.ttl)
+        entries.move_to_end(entity.id)
+        
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+    
+    def invalidate(self, entity_id: UUID) -> None:
+        """
+        Drop a cached entity, if present.
+        
+        Args:
+            entity_id: ID of the entity to drop
+        """
+        self._entries.pop(entity_id, None)
+    
+    def clear(self) -> None:
+        """Drop every cached entity."""
+        self._entries.clear()
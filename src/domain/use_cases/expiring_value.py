@@ -0,0 +1,64 @@
+"""
+Expiring Value - Domain Layer
+
+This module contains a single-slot in-process cache for a computed value,
+such as a statistics summary, that is expensive to build and may be served
+slightly stale for a bounded time.
+"""
+
+import time
+from typing import Generic, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class ExpiringValue(Generic[T]):
+    """
+    A cached value that expires ttl seconds after it is stored.
+    
+    Writers that change the data behind the value should call clear() so the
+    next read recomputes it; the TTL bounds how long changes made by another
+    process can go unnoticed. Callers must not mutate the value they get
+    back; copy it first.
+    
+    Attributes:
+        ttl: Number of seconds the value stays valid
+    """
+    
+    def __init__(self, ttl: float = 30.0):
+        """
+        Initialize the expiring value, initially empty.
+        
+        Args:
+            ttl: Number of seconds the value stays valid (default: 30)
+        """
+        self.ttl = ttl
+        self._value: Optional[T] = None
+        self._expires_at = 0.0
+    
+    def get(self) -> Optional[T]:
+        """
+        Get the cached value.
+        
+        Returns:
+            The cached value, or None if absent or expired
+        """
+        if self._expires_at <= time.monotonic():
+            self._value = None
+        return self._value
+    
+    def set(self, value: T) -> None:
+        """
+        Cache a value, replacing any previous one.
+        
+        Args:
+            value: Value to cache
+        """
+        self._value = value
+        self._expires_at = time.monotonic() + self.ttl
+    
+    def clear(self) -> None:
+        """Drop the cached value."""
+        self._value = None
+        self._expires_at = 0.0
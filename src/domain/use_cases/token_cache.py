@@ -0,0 +1,102 @@
+"""
+Token User Cache - Domain Layer
+
+This module contains a small in-process cache mapping access tokens to the
+users they authenticate. It lets repeated requests carrying the same token
+skip JWT verification and the user lookup until the entry expires.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from uuid import UUID
+
+from ..entities.user import User
+
+
+class TokenUserCache:
+    """
+    Bounded TTL cache of authenticated users keyed by token digest.
+    
+    Tokens are stored as 16-byte BLAKE2b digests, never in plain text.
+    Each entry expires at the token's own expiry time, capped at max_age
+    seconds so that deactivations made elsewhere are picked up promptly.
+    When full, the least recently used entry is evicted.
+    
+    Attributes:
+        max_size: Maximum number of cached tokens
+        max_age: Maximum number of seconds an entry is trusted
+    """
+    
+    def __init__(self, max_size: int = 10000, max_age: float = 60.0):
+        """
+        Initialize the token user cache.
+        
+        Args:
+            max_size: Maximum number of cached tokens (default: 10000)
+            max_age: Maximum number of seconds an entry is trusted (default: 60)
+        """
+        self.max_size = max_size
+        self.max_age = max_age
+        self._entries: "OrderedDict[bytes, Tuple[User, float]]" = OrderedDict()
+    
+    @staticmethod
+    def _key(token: str) -> bytes:
+        """Digest a token into its cache key."""
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+    
+    def get(self, token: str) -> Optional[User]:
+        """
+        Get the user cached for a token.
+        
+        Args:
+            token: JWT access token
+            
+        Returns:
+            The cached User entity, or None if absent or expired
+        """
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        user, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return user
+    
+    def put(self, token: str, user: User, exp: float) -> None:
+        """
+        Cache the user authenticated by a token.
+        
+        Args:
+            token: JWT access token
+            user: User entity the token authenticates
+            exp: Token expiry as a Unix timestamp
+        """
+        key = self._key(token)
+        entries = self._entries
+        entries[key] = (user, min(exp, time.time() + self.max_age))
+        entries.move_to_end(key)
+        
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+    
+    def invalidate_user(self, user_id: UUID) -> None:
+        """
+        Drop every cached token belonging to a user.
+        
+        Args:
+            user_id: ID of the user whose entries are dropped
+        """
+        stale = [key for key, (user, _) in self._entries.items() if user.id == user_id]
+        for key in stale:
+            del self._entries[key]
+    
+    def clear(self) -> None:
+        """Drop every cached token."""
+        self._entries.clear()
@@ -0,0 +1,174 @@
+"""
+Commit-Bound Entity Cache - Infrastructure Layer
+
+This module ties invalidations of the process-wide caches (EntityCache and
+ExpiringValue) to the commit of a request's database session. The session is committed only when the request
+finishes, so invalidating while the request runs would let a concurrent
+reader cache the pre-write row again and keep serving it for the cache TTL.
+"""
+
+from typing import Callable, Generic, List, Optional, Set, TypeVar
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ...domain.use_cases.entity_cache import EntityCache
+from ...domain.use_cases.expiring_value import ExpiringValue
+
+
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+T = TypeVar("T")
+
+
+def call_after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Run a callback once the session's current transaction commits.
+    
+    Callbacks are discarded if the transaction is rolled back, and never run
+    for sessions that are not committed.
+    
+    Args:
+        session: Session whose commit triggers the callback
+        callback: Function to call after the commit
+    """
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    """Run and forget the callbacks registered for the committed transaction."""
+    callbacks: List[Callable[[], None]] = session.info.pop(_AFTER_COMMIT_KEY, [])
+    for callback in callbacks:
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_callbacks(session: Session) -> None:
+    """Forget the callbacks of a transaction that was rolled back."""
+    session.info.pop(_AFTER_COMMIT_KEY, None)
+
+
+class CommitBoundEntityCache(Generic[T]):
+    """
+    Per-request view of an EntityCache whose invalidations wait for commit.
+    
+    Offers the EntityCache interface to the use cases. Reads and stores go
+    straight to the shared cache; invalidations are applied once the session
+    commits, and dropped if it rolls back. Entities invalidated earlier in
+    the request are not stored again, since the copy read in this session
+    may include its uncommitted changes.
+    
+    Attributes:
+        cache: Shared cache the invalidations are applied to
+    """
+    
+    def __init__(self, cache: EntityCache[T], session: AsyncSession):
+        """
+        Initialize the commit-bound cache.
+        
+        Args:
+            cache: Shared, process-wide entity cache
+            session: Request session whose commit applies the invalidations
+        """
+        self.cache = cache
+        self._session = session
+        self._invalidated: Set[UUID] = set()
+    
+    def get(self, entity_id: UUID) -> Optional[T]:
+        """
+        Get a cached entity.
+        
+        Args:
+            entity_id: ID of the entity
+            
+        Returns:
+            The cached entity, or None if absent, expired or invalidated
+            in this request
+        """
+        if entity_id in self._invalidated:
+            return None
+        return self.cache.get(entity_id)
+    
+    def put(self, entity: T) -> None:
+        """
+        Cache an entity under its ID, unless this request invalidated it.
+        
+        Args:
+            entity: Entity to cache (any entity with an id attribute)
+        """
+        if entity.id not in self._invalidated:
+            self.cache.put(entity)
+    
+    def invalidate(self, entity_id: UUID) -> None:
+        """
+        Drop a cached entity once the session commits.
+        
+        Args:
+            entity_id: ID of the entity to drop
+        """
+        if entity_id in self._invalidated:
+            return
+        
+        self._invalidated.add(entity_id)
+        cache = self.cache
+        call_after_commit(self._session, lambda: cache.invalidate(entity_id))
+
+
+class CommitBoundExpiringValue(Generic[T]):
+    """
+    Per-request view of an ExpiringValue whose clear() waits for commit.
+    
+    Offers the ExpiringValue interface to the use cases. Reads and stores go
+    straight to the shared value until the request clears it; the clear is
+    applied once the session commits, and dropped if it rolls back. After
+    clearing, the request neither reads nor stores the shared value, since
+    what it computes may include its uncommitted changes.
+    
+    Attributes:
+        value: Shared value the clear is applied to
+    """
+    
+    def __init__(self, value: ExpiringValue[T], session: AsyncSession):
+        """
+        Initialize the commit-bound value.
+        
+        Args:
+            value: Shared, process-wide expiring value
+            session: Request session whose commit applies the clear
+        """
+        self.value = value
+        self._session = session
+        self._cleared = False
+    
+    def get(self) -> Optional[T]:
+        """
+        Get the cached value.
+        
+        Returns:
+            The cached value, or None if absent, expired or cleared in this
+            request
+        """
+        if self._cleared:
+            return None
+        return self.value.get()
+    
+    def set(self, value: T) -> None:
+        """
+        Cache a value, unless this request cleared it.
+        
+        Args:
+            value: Value to cache
+        """
+        if not self._cleared:
+            self.value.set(value)
+    
+    def clear(self) -> None:
+        """Drop the cached value once the session commits."""
+        if self._cleared:
+            return
+        
+        self._cleared = True
+        call_after_commit(self._session, self.value.clear)
@@ -10,9 +10,10 @@ Following Clean Architecture principles, this model:
 """
 
 from datetime import datetime
-from typing import List, TYPE_CHECKING
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Sequence, TYPE_CHECKING
 from uuid import UUID, uuid4
-from sqlalchemy import String, Text, DateTime, func
+from sqlalchemy import Integer, String, Text, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,6 +24,10 @@ if TYPE_CHECKING:
     from .comment_model import CommentModel
 
 
+# Reads the entity fields off a model in one C-level call, in ENTITY_COLUMNS order
+_entity_values = attrgetter("id", "title", "content", "created_at", "updated_at", "comment_count")
+
+
 class BlogPostModel(Base):
     """
     SQLAlchemy model for blog posts.
@@ -38,16 +43,14 @@ class BlogPostModel(Base):
     # Primary key
     id: Mapped[UUID] = mapped_column(
         PostgresUUID(as_uuid=True),
-        primary_key=True,
-        default=uuid4,
-        index=True
+        primary_key=True,  # Backed by the primary key's unique index
+        default=uuid4
     )
     
     # Blog post fields
     title: Mapped[str] = mapped_column(
         String(200),
-        nullable=False,
-        index=True  # Index for search functionality
+        nullable=False  # Searched through blog_posts_title_trgm below
     )
     
     content: Mapped[str] = mapped_column(
@@ -55,12 +58,27 @@ class BlogPostModel(Base):
         nullable=False
     )
     
+    # Comment counters, maintained by the comments_post_counts trigger
+    # (see comment_model); never written by the application
+    comment_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0"
+    )
+    
+    approved_comment_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0"
+    )
+    
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=func.now(),
-        index=True  # Index for sorting by creation date
+        default=func.now()
     )
     
     updated_at: Mapped[datetime] = mapped_column(
@@ -74,8 +92,9 @@ class BlogPostModel(Base):
     comments: Mapped[List["CommentModel"]] = relationship(
         "CommentModel",
         back_populates="blog_post",
-        cascade="all, delete-orphan",  # Delete comments when blog post is deleted
-        lazy="selectin"  # Optimize loading of comments
+        cascade="save-update, merge",
+        passive_deletes=True,  # The comments FK's ON DELETE CASCADE removes them
+        lazy="raise"  # Never load a post's comments implicitly; query them instead
     )
     
     def __repr__(self) -> str:
@@ -93,20 +112,71 @@ class BlogPostModel(Base):
         Returns:
             BlogPost: Domain entity representation
         """
-        # Extract comment IDs from the relationship
-        comment_ids = [comment.id for comment in self.comments] if self.comments else []
+        return self.entity_from_row(_entity_values(self))
+    
+    @classmethod
+    def to_entities(cls, models: Iterable["BlogPostModel"]) -> List[BlogPost]:
+        """
+        Convert several database models to domain entities.
         
-        # Create domain entity with database values
+        Args:
+            models: BlogPostModel instances
+            
+        Returns:
+            List of BlogPost domain entities, in the given order
+        """
+        entity_from_row = cls.entity_from_row
+        return [entity_from_row(values) for values in map(_entity_values, models)]
+    
+    @staticmethod
+    def entity_from_row(row: Sequence[Any]) -> BlogPost:
+        """
+        Build a domain entity straight from a row of ENTITY_COLUMNS values.
+        
+        Read-only listings select just these columns and use this instead of
+        to_entity, which skips ORM object construction and identity-map
+        bookkeeping for every row.
+        
+        Args:
+            row: Row whose leading values are those of ENTITY_COLUMNS, in order
+            
+        Returns:
+            BlogPost: Domain entity representation
+        """
         blog_post = BlogPost.__new__(BlogPost)  # Create without calling __init__
-        blog_post.id = self.id
-        blog_post.title = self.title
-        blog_post.content = self.content
-        blog_post.created_at = self.created_at
-        blog_post.updated_at = self.updated_at
-        blog_post.comment_ids = comment_ids
+        (
+            blog_post.id,
+            blog_post.title,
+            blog_post.content,
+            blog_post.created_at,
+            blog_post.updated_at,
+            blog_post.comment_count
+        ) = row[:6]
         
         return blog_post
     
+    @staticmethod
+    def values_from_entity(entity: BlogPost) -> Dict[str, Any]:
+        """
+        Get the column values of a domain entity, keyed by attribute name.
+        
+        Used to build models and for bulk INSERT statements, which take one
+        dictionary per row instead of model instances.
+        
+        Args:
+            entity: BlogPost domain entity
+            
+        Returns:
+            Dictionary of column values for the entity's row
+        """
+        return {
+            'id': entity.id,
+            'title': entity.title,
+            'content': entity.content,
+            'created_at': entity.created_at,
+            'updated_at': entity.updated_at
+        }
+    
     @classmethod
     def from_entity(cls, entity: BlogPost) -> "BlogPostModel":
         """
@@ -121,13 +191,7 @@ class BlogPostModel(Base):
         Returns:
             BlogPostModel: Database model representation
         """
-        return cls(
-            id=entity.id,
-            title=entity.title,
-            content=entity.content,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at
-        )
+        return cls(**cls.values_from_entity(entity))
     
     def update_from_entity(self, entity: BlogPost) -> None:
         """
@@ -150,33 +214,24 @@ class BlogPostModel(Base):
         Returns:
             Number of comments
         """
-        return len(self.comments) if self.comments else 0
-    
-    def get_approved_comment_count(self) -> int:
-        """
-        Get the number of approved comments associated with this blog post.
-        
-        Returns:
-            Number of approved comments
-        """
-        if not self.comments:
-            return 0
-        
-        return sum(1 for comment in self.comments if comment.is_approved)
+        return self.comment_count
     
     def to_dict(self) -> dict:
         """
         Convert the model to a dictionary representation.
         
+        Values are left as UUID and datetime objects for the JSON
+        serializer to format.
+        
         Returns:
             Dictionary representation of the blog post
         """
         return {
-            'id': str(self.id),
+            'id': self.id,
             'title': self.title,
             'content': self.content,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
             'comment_count': self.get_comment_count()
         }
     
@@ -185,14 +240,42 @@ class BlogPostModel(Base):
         Convert the model to a summary dictionary representation.
         
         This is useful for list endpoints where full content is not needed.
+        The comment count is the trigger-maintained approved_comment_count
+        column. Values are left as UUID and datetime objects, like to_dict.
         
         Returns:
             Summary dictionary representation of the blog post
         """
         return {
-            'id': str(self.id),
+            'id': self.id,
             'title': self.title,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-            'comment_count': self.get_approved_comment_count()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'comment_count': self.approved_comment_count
         }
+
+
+# Columns that entity_from_row reads, in order
+ENTITY_COLUMNS = (
+    BlogPostModel.id,
+    BlogPostModel.title,
+    BlogPostModel.content,
+    BlogPostModel.created_at,
+    BlogPostModel.updated_at,
+    BlogPostModel.comment_count
+)
+
+
+# Trigram index so case-insensitive partial title searches (ILIKE '%...%')
+# are answered from the index instead of scanning every title
+Index(
+    "blog_posts_title_trgm",
+    BlogPostModel.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"}
+)
+
+
+# Composite index for newest-first listings; the id makes the order total so
+# keyset pagination on (created_at, id) is an index range scan
+Index("blog_posts_recent", BlogPostModel.created_at.desc(), BlogPostModel.id.desc())
@@ -9,10 +9,12 @@ Following Clean Architecture principles, this model:
 - Provides conversion methods to/from domain entities
 """
 
-from datetime import datetime
-from typing import TYPE_CHECKING
+import time
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, TYPE_CHECKING
 from uuid import UUID, uuid4
-from sqlalchemy import String, Text, DateTime, Boolean, ForeignKey, func
+from sqlalchemy import DDL, String, Text, DateTime, Boolean, ForeignKey, Index, event, func
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,6 +25,13 @@ if TYPE_CHECKING:
     from .blog_post_model import BlogPostModel
 
 
+# Reads the entity fields off a model in one C-level call
+_entity_values = attrgetter(
+    "id", "content", "blog_post_id", "author_name", "author_email",
+    "created_at", "updated_at", "is_approved"
+)
+
+
 class CommentModel(Base):
     """
     SQLAlchemy model for comments.
@@ -38,9 +47,8 @@ class CommentModel(Base):
     # Primary key
     id: Mapped[UUID] = mapped_column(
         PostgresUUID(as_uuid=True),
-        primary_key=True,
-        default=uuid4,
-        index=True
+        primary_key=True,  # Backed by the primary key's unique index
+        default=uuid4
     )
     
     # Comment fields
@@ -64,24 +72,21 @@ class CommentModel(Base):
     is_approved: Mapped[bool] = mapped_column(
         Boolean,
         nullable=False,
-        default=True,
-        index=True  # Index for filtering approved comments
+        default=True
     )
     
     # Foreign key to blog post
     blog_post_id: Mapped[UUID] = mapped_column(
         PostgresUUID(as_uuid=True),
         ForeignKey("blog_posts.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True  # Index for querying comments by blog post
+        nullable=False  # Indexed by comments_post below
     )
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=func.now(),
-        index=True  # Index for sorting by creation date
+        default=func.now()
     )
     
     updated_at: Mapped[datetime] = mapped_column(
@@ -99,7 +104,7 @@ class CommentModel(Base):
     
     def __repr__(self) -> str:
         """String representation of the comment model."""
-        content_preview = self.content[:50] + "..." if len(self.content) > 50 else self.content
+        content_preview = self.get_content_preview(50)
         return f"<CommentModel(id={self.id}, author='{self.author_name}', content='{content_preview}')>"
     
     def to_entity(self) -> Comment:
@@ -115,17 +120,57 @@ class CommentModel(Base):
         """
         # Create domain entity with database values
         comment = Comment.__new__(Comment)  # Create without calling __init__
-        comment.id = self.id
-        comment.content = self.content
-        comment.blog_post_id = self.blog_post_id
-        comment.author_name = self.author_name
-        comment.author_email = self.author_email
-        comment.created_at = self.created_at
-        comment.updated_at = self.updated_at
-        comment.is_approved = self.is_approved
+        (
+            comment.id,
+            comment.content,
+            comment.blog_post_id,
+            comment.author_name,
+            comment.author_email,
+            comment.created_at,
+            comment.updated_at,
+            comment.is_approved
+        ) = _entity_values(self)
         
         return comment
     
+    @classmethod
+    def to_entities(cls, models: Iterable["CommentModel"]) -> List[Comment]:
+        """
+        Convert several database models to domain entities.
+        
+        Args:
+            models: CommentModel instances
+            
+        Returns:
+            List of Comment domain entities, in the given order
+        """
+        return list(map(cls.to_entity, models))
+    
+    @staticmethod
+    def values_from_entity(entity: Comment) -> Dict[str, Any]:
+        """
+        Get the column values of a domain entity, keyed by attribute name.
+        
+        Used to build models and for bulk INSERT statements, which take one
+        dictionary per row instead of model instances.
+        
+        Args:
+            entity: Comment domain entity
+            
+        Returns:
+            Dictionary of column values for the entity's row
+        """
+        return {
+            'id': entity.id,
+            'content': entity.content,
+            'blog_post_id': entity.blog_post_id,
+            'author_name': entity.author_name,
+            'author_email': entity.author_email,
+            'created_at': entity.created_at,
+            'updated_at': entity.updated_at,
+            'is_approved': entity.is_approved
+        }
+    
     @classmethod
     def from_entity(cls, entity: Comment) -> "CommentModel":
         """
@@ -140,16 +185,7 @@ class CommentModel(Base):
         Returns:
             CommentModel: Database model representation
         """
-        return cls(
-            id=entity.id,
-            content=entity.content,
-            blog_post_id=entity.blog_post_id,
-            author_name=entity.author_name,
-            author_email=entity.author_email,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-            is_approved=entity.is_approved
-        )
+        return cls(**cls.values_from_entity(entity))
     
     def update_from_entity(self, entity: Comment) -> None:
         """
@@ -177,39 +213,53 @@ class CommentModel(Base):
         Returns:
             Truncated content with ellipsis if needed
         """
-        if len(self.content) <= max_length:
-            return self.content
+        content = self.content
+        if len(content) <= max_length:
+            return content
+        
+        preview = content[:max_length]
+        if preview and not preview[-1].isspace():
+            return preview + "..."
         
-        return self.content[:max_length].rstrip() + "..."
+        return preview.rstrip() + "..."
     
     def is_recent(self, hours: int = 24) -> bool:
         """
         Check if the comment was created recently.
         
+        Compares epoch seconds, so no timedelta is built and timezone-aware
+        values loaded from the database compare correctly.
+        
         Args:
             hours: Number of hours to consider as "recent"
             
         Returns:
             True if the comment was created within the specified hours
         """
-        time_diff = datetime.utcnow() - self.created_at
-        return time_diff.total_seconds() < (hours * 3600)
+        created_at = self.created_at
+        if created_at.tzinfo is None:
+            # Naive timestamps are UTC, like the domain's
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return time.time() - created_at.timestamp() < hours * 3600
     
     def to_dict(self) -> dict:
         """
         Convert the model to a dictionary representation.
         
+        Values are left as UUID and datetime objects for the JSON
+        serializer to format.
+        
         Returns:
             Dictionary representation of the comment
         """
         return {
-            'id': str(self.id),
+            'id': self.id,
             'content': self.content,
-            'blog_post_id': str(self.blog_post_id),
+            'blog_post_id': self.blog_post_id,
             'author_name': self.author_name,
             'author_email': self.author_email,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
             'is_approved': self.is_approved
         }
     
@@ -218,15 +268,93 @@ class CommentModel(Base):
         Convert the model to a public dictionary representation.
         
         This excludes sensitive information like author email
-        and is suitable for public API responses.
+        and is suitable for public API responses. Values are left as UUID
+        and datetime objects, like to_dict.
         
         Returns:
             Public dictionary representation of the comment
         """
         return {
-            'id': str(self.id),
+            'id': self.id,
             'content': self.content,
             'author_name': self.author_name,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
+
+
+# Composite index for newest-first listings; the id makes the order total so
+# keyset pagination on (created_at, id) is an index range scan
+Index("comments_recent", CommentModel.created_at.desc(), CommentModel.id.desc())
+
+# Composite index for a post's comments, newest first; serves keyset pages of
+# a post's thread and, through its leading column, lookups by blog_post_id
+Index(
+    "comments_post",
+    CommentModel.blog_post_id,
+    CommentModel.created_at.desc(),
+    CommentModel.id.desc()
+)
+
+# Partial indexes for the moderation queue and a post's approved comments;
+# each covers only the rows its listing reads, already in listing order
+Index(
+    "comments_pending",
+    CommentModel.created_at.desc(),
+    CommentModel.id.desc(),
+    postgresql_where=CommentModel.is_approved == False
+)
+Index(
+    "comments_approved_post",
+    CommentModel.blog_post_id,
+    CommentModel.created_at.desc(),
+    CommentModel.id.desc(),
+    postgresql_where=CommentModel.is_approved == True
+)
+
+
+# Keep blog_posts.comment_count and approved_comment_count in step with the
+# comments table; the counters are updated inside the writing transaction,
+# without a round trip, and are read as plain columns. These hooks only run
+# when create_all creates the table; existing databases get the function,
+# trigger and backfilled counters from migration 0003_post_comment_counters
+_maintain_post_comment_counts = DDL("""
+CREATE OR REPLACE FUNCTION comments_maintain_post_counts() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW.blog_post_id = OLD.blog_post_id THEN
+        IF NEW.is_approved <> OLD.is_approved THEN
+            UPDATE blog_posts
+            SET approved_comment_count = approved_comment_count + NEW.is_approved::int - OLD.is_approved::int
+            WHERE id = NEW.blog_post_id;
+        END IF;
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE blog_posts
+        SET comment_count = comment_count - 1,
+            approved_comment_count = approved_comment_count - OLD.is_approved::int
+        WHERE id = OLD.blog_post_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE blog_posts
+        SET comment_count = comment_count + 1,
+            approved_comment_count = approved_comment_count + NEW.is_approved::int
+        WHERE id = NEW.blog_post_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+# Comments removed by the ON DELETE CASCADE of their blog post are deleted
+# from within a trigger (depth > 0); their post is gone, so they are skipped
+_post_comment_counts_trigger = DDL("""
+CREATE TRIGGER comments_post_counts
+AFTER INSERT OR DELETE OR UPDATE OF is_approved, blog_post_id ON comments
+FOR EACH ROW
+WHEN (pg_trigger_depth() = 0)
+EXECUTE FUNCTION comments_maintain_post_counts()
+""")
+
+event.listen(CommentModel.__table__, "after_create", _maintain_post_comment_counts)
+event.listen(CommentModel.__table__, "after_create", _post_comment_counts_trigger)
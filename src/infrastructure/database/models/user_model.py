@@ -10,9 +10,10 @@ Following Clean Architecture principles, this model:
 """
 
 from datetime import datetime
-from typing import Optional
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID, uuid4
-from sqlalchemy import String, Boolean, DateTime, func
+from sqlalchemy import String, Boolean, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -20,6 +21,13 @@ from ..database import Base
 from ....domain.entities.user import User
 
 
+# Reads the entity fields off a model in one C-level call
+_entity_values = attrgetter(
+    "id", "username", "email", "password_hash", "full_name",
+    "is_active", "is_superuser", "created_at", "updated_at"
+)
+
+
 class UserModel(Base):
     """
     SQLAlchemy model for users.
@@ -35,9 +43,8 @@ class UserModel(Base):
     # Primary key
     id: Mapped[UUID] = mapped_column(
         PostgresUUID(as_uuid=True),
-        primary_key=True,
-        default=uuid4,
-        index=True
+        primary_key=True,  # Backed by the primary key's unique index
+        default=uuid4
     )
     
     # User fields
@@ -45,14 +52,14 @@ class UserModel(Base):
         String(50),
         nullable=False,
         unique=True,
-        index=True  # Index for login queries
+        index=True  # Index for login queries (usernames are case-sensitive)
     )
     
     email: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
         unique=True,
-        index=True  # Index for login queries
+        index=True  # Index for login queries (stored lowercased, so no lower() needed)
     )
     
     password_hash: Mapped[str] = mapped_column(
@@ -68,23 +75,20 @@ class UserModel(Base):
     is_active: Mapped[bool] = mapped_column(
         Boolean,
         nullable=False,
-        default=True,
-        index=True  # Index for filtering active users
+        default=True
     )
     
     is_superuser: Mapped[bool] = mapped_column(
         Boolean,
         nullable=False,
-        default=False,
-        index=True  # Index for admin queries
+        default=False
     )
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=func.now(),
-        index=True  # Index for sorting by creation date
+        default=func.now()
     )
     
     updated_at: Mapped[datetime] = mapped_column(
@@ -111,18 +115,59 @@ class UserModel(Base):
         """
         # Create domain entity with database values
         user = User.__new__(User)  # Create without calling __init__
-        user.id = self.id
-        user.username = self.username
-        user.email = self.email
-        user.password_hash = self.password_hash
-        user.full_name = self.full_name
-        user.is_active = self.is_active
-        user.is_superuser = self.is_superuser
-        user.created_at = self.created_at
-        user.updated_at = self.updated_at
+        (
+            user.id,
+            user.username,
+            user.email,
+            user.password_hash,
+            user.full_name,
+            user.is_active,
+            user.is_superuser,
+            user.created_at,
+            user.updated_at
+        ) = _entity_values(self)
         
         return user
     
+    @classmethod
+    def to_entities(cls, models: Iterable["UserModel"]) -> List[User]:
+        """
+        Convert several database models to domain entities.
+        
+        Args:
+            models: UserModel instances
+            
+        Returns:
+            List of User domain entities, in the given order
+        """
+        return list(map(cls.to_entity, models))
+    
+    @staticmethod
+    def values_from_entity(entity: User) -> Dict[str, Any]:
+        """
+        Get the column values of a domain entity, keyed by attribute name.
+        
+        Used to build models and for bulk INSERT statements, which take one
+        dictionary per row instead of model instances.
+        
+        Args:
+            entity: User domain entity
+            
+        Returns:
+            Dictionary of column values for the entity's row
+        """
+        return {
+            'id': entity.id,
+            'username': entity.username,
+            'email': entity.email,
+            'password_hash': entity.password_hash,
+            'full_name': entity.full_name,
+            'is_active': entity.is_active,
+            'is_superuser': entity.is_superuser,
+            'created_at': entity.created_at,
+            'updated_at': entity.updated_at
+        }
+    
     @classmethod
     def from_entity(cls, entity: User) -> "UserModel":
         """
@@ -137,17 +182,7 @@ class UserModel(Base):
         Returns:
             UserModel: Database model representation
         """
-        return cls(
-            id=entity.id,
-            username=entity.username,
-            email=entity.email,
-            password_hash=entity.password_hash,
-            full_name=entity.full_name,
-            is_active=entity.is_active,
-            is_superuser=entity.is_superuser,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at
-        )
+        return cls(**cls.values_from_entity(entity))
     
     def update_from_entity(self, entity: User) -> None:
         """
@@ -171,20 +206,21 @@ class UserModel(Base):
         """
         Convert the model to a dictionary representation.
         
-        Note: Password hash is excluded for security reasons.
+        Note: Password hash is excluded for security reasons. Values are
+        left as UUID and datetime objects for the JSON serializer to format.
         
         Returns:
             Dictionary representation of the user
         """
         return {
-            'id': str(self.id),
+            'id': self.id,
             'username': self.username,
             'email': self.email,
             'full_name': self.full_name,
             'is_active': self.is_active,
             'is_superuser': self.is_superuser,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
     
     def to_public_dict(self) -> dict:
@@ -192,13 +228,38 @@ class UserModel(Base):
         Convert the model to a public dictionary representation.
         
         This excludes sensitive information and is suitable for public API responses.
+        Values are left as UUID and datetime objects, like to_dict.
         
         Returns:
             Public dictionary representation of the user
         """
         return {
-            'id': str(self.id),
+            'id': self.id,
             'username': self.username,
             'full_name': self.full_name,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
+
+
+# Trigram index on lower(username) so case-insensitive partial username
+# searches are answered from the index instead of scanning every user
+Index(
+    "users_username_lower_trgm",
+    func.lower(UserModel.username).label("username_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"username_lower": "gin_trgm_ops"}
+)
+
+
+# Composite index for newest-first listings; the id makes the order total so
+# keyset pagination on (created_at, id) is an index range scan
+Index("users_recent", UserModel.created_at.desc(), UserModel.id.desc())
+
+
+# Partial index for listing and counting active users, newest first
+Index(
+    "users_active_recent",
+    UserModel.created_at.desc(),
+    UserModel.id.desc(),
+    postgresql_where=UserModel.is_active == True
+)
@@ -0,0 +1,39 @@
+"""
+Row Count Estimation Helper - Infrastructure Layer
+
+This module reads PostgreSQL's planner statistics to estimate the number of
+rows in a table without scanning it.
+"""
+
+from typing import Any
+
+from sqlalchemy import select, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+_RELTUPLES_SQL = text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table_name")
+
+
+async def estimate_row_count(session: AsyncSession, model: Any) -> int:
+    """
+    Estimate the number of rows in a model's table.
+    
+    The estimate comes from pg_class.reltuples, which is kept up to date by
+    VACUUM/ANALYZE and costs a single catalog lookup. Tables that have never
+    been analyzed report no estimate, in which case an exact count is used.
+    
+    Args:
+        session: SQLAlchemy async session for database operations
+        model: Mapped model class whose table is counted
+        
+    Returns:
+        Approximate number of rows in the table
+    """
+    result = await session.execute(_RELTUPLES_SQL, {"table_name": model.__tablename__})
+    estimate = result.scalar()
+    
+    if estimate is None or estimate < 0:
+        result = await session.execute(select(func.count()).select_from(model))
+        return result.scalar()
+    
+    return estimate
@@ -0,0 +1,54 @@
+"""
+Database Error Helpers - Infrastructure Layer
+
+This module contains helpers for telling database integrity errors apart,
+so repositories can let a constraint do a check instead of querying first.
+"""
+
+import re
+from typing import Optional, Tuple
+
+from sqlalchemy.exc import DBAPIError
+
+
+# PostgreSQL SQLSTATE codes
+FOREIGN_KEY_VIOLATION = "23503"
+UNIQUE_VIOLATION = "23505"
+
+# DETAIL message of a unique violation, e.g. "Key (email)=(a@b.c) already exists."
+_DUPLICATE_KEY_DETAIL = re.compile(r"Key \((?P<column>[^)]+)\)=\((?P<value>.*)\) already exists")
+
+
+def sqlstate_of(error: DBAPIError) -> Optional[str]:
+    """
+    Get the PostgreSQL SQLSTATE code of a database error.
+    
+    Args:
+        error: Error raised by SQLAlchemy for a failed statement
+        
+    Returns:
+        The five-character SQLSTATE code, or None if the driver did not report one
+    """
+    return getattr(error.orig, "sqlstate", None)
+
+
+def duplicate_key_of(error: DBAPIError) -> Optional[Tuple[str, str]]:
+    """
+    Get the column and value that caused a unique violation.
+    
+    Bulk inserts use this to report which row collided without querying
+    for it, since the failed transaction cannot run further statements.
+    
+    Args:
+        error: Error raised by SQLAlchemy for a unique violation
+        
+    Returns:
+        Tuple of (column, value) as PostgreSQL reported them, or None if the
+        driver did not report the key
+    """
+    # The DBAPI adapter keeps the driver's own exception, which carries DETAIL
+    driver_error = error.orig.__cause__ or error.orig
+    match = _DUPLICATE_KEY_DETAIL.search(getattr(driver_error, "detail", None) or "")
+    if match is None:
+        return None
+    return match.group("column"), match.group("value")
@@ -0,0 +1,50 @@
+"""
+Query Filter Helpers - Infrastructure Layer
+
+This module contains small builders for WHERE clauses shared by the
+repositories.
+"""
+
+from typing import Any, Iterable
+
+from sqlalchemy import ColumnElement, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+
+
+# Escape character for LIKE patterns built by contains_pattern
+LIKE_ESCAPE = "\\"
+
+
+def any_of(column: Any, values: Iterable[Any]) -> ColumnElement[bool]:
+    """
+    Build a "column = ANY(:values)" condition with a single array parameter.
+    
+    Unlike IN, which renders one placeholder per value, the SQL text is the
+    same for every number of values, so the driver prepares it only once.
+    
+    Args:
+        column: Mapped column to compare
+        values: Values to match; duplicates are removed
+        
+    Returns:
+        Boolean clause that is true when the column equals any of the values
+    """
+    return column == any_(bindparam(None, list(set(values)), type_=ARRAY(column.type)))
+
+
+def contains_pattern(query: str) -> str:
+    """
+    Build a LIKE pattern matching values that contain the query literally.
+    
+    Wildcards in the query are escaped, so a search for "%" or "_" cannot
+    widen into a match-everything pattern that the trigram index cannot
+    narrow down. Use with like/ilike(..., escape=LIKE_ESCAPE).
+    
+    Args:
+        query: Text to search for
+        
+    Returns:
+        The escaped query wrapped in % wildcards
+    """
+    escaped = query.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2).replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
@@ -0,0 +1,48 @@
+"""
+Keyset Pagination Helper - Infrastructure Layer
+
+This module translates the domain PageCursor into SQLAlchemy clauses shared by
+the repository implementations.
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import Select, tuple_
+
+from ....domain.repositories.pagination import PageCursor
+
+
+def paginate(
+    stmt: Select,
+    model: Any,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[PageCursor] = None
+) -> Select:
+    """
+    Order a listing newest first and restrict it to a single page.
+    
+    With a cursor, the page is selected with a row-value comparison on
+    (created_at, id), which the database answers by seeking in the index
+    rather than walking and discarding OFFSET rows. The id breaks ties
+    between rows created at the same instant so no row is skipped or
+    repeated across pages.
+    
+    Args:
+        stmt: Select statement over the model
+        model: Mapped model class with created_at and id columns
+        limit: Maximum number of rows to return
+        offset: Number of rows to skip (ignored when a cursor is given)
+        cursor: Position of the last row of the previous page
+        
+    Returns:
+        The paginated select statement
+    """
+    stmt = stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit)
+    
+    if cursor is not None:
+        return stmt.where(
+            tuple_(model.created_at, model.id) < tuple_(cursor.created_at, cursor.id)
+        )
+    
+    return stmt.offset(offset) if offset else stmt
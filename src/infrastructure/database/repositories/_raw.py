@@ -0,0 +1,84 @@
+"""
+Raw Query Helpers - Infrastructure Layer
+
+This module contains the lightweight read paths used by the repositories:
+single-value queries run directly on the asyncpg connection that backs a
+SQLAlchemy session, and column selects returned as plain dictionaries. Both
+skip the ORM's object construction for results that do not need entities.
+"""
+
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def fetch_value(session: AsyncSession, sql: str, *args: Any) -> Any:
+    """
+    Execute a query on the session's driver connection and return one value.
+    
+    The query runs on the same connection and transaction as the session, so
+    it sees everything the session has written. Pending changes are flushed
+    first, matching the session's autoflush behaviour.
+    
+    asyncpg prepares each distinct SQL text once per connection and reuses
+    the prepared statement afterwards, so callers should pass constant SQL
+    and supply all varying values as arguments.
+    
+    Args:
+        session: SQLAlchemy async session for database operations
+        sql: SQL text using asyncpg-style positional placeholders ($1, $2, ...)
+        *args: Values bound to the placeholders
+        
+    Returns:
+        The first column of the first row, or None if there are no rows
+    """
+    driver_connection = await _driver_connection(session)
+    return await driver_connection.fetchval(sql, *args)
+
+
+async def fetch_row(session: AsyncSession, sql: str, *args: Any) -> Optional[Tuple]:
+    """
+    Execute a query on the session's driver connection and return one row.
+    
+    Behaves like fetch_value, but returns every column of the first row.
+    
+    Args:
+        session: SQLAlchemy async session for database operations
+        sql: SQL text using asyncpg-style positional placeholders ($1, $2, ...)
+        *args: Values bound to the placeholders
+        
+    Returns:
+        Tuple of the first row's column values, or None if there are no rows
+    """
+    driver_connection = await _driver_connection(session)
+    row = await driver_connection.fetchrow(sql, *args)
+    return tuple(row) if row is not None else None
+
+
+async def _driver_connection(session: AsyncSession) -> Any:
+    """Flush pending changes and return the asyncpg connection behind the session."""
+    if session.new or session.dirty or session.deleted:
+        await session.flush()
+    
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    return raw_connection.driver_connection
+
+
+async def fetch_rows(session: AsyncSession, stmt: Select) -> List[dict]:
+    """
+    Execute a column select and return its rows as plain dictionaries.
+    
+    Selecting columns instead of mapped classes skips ORM object
+    construction and identity-map bookkeeping entirely.
+    
+    Args:
+        session: SQLAlchemy async session for database operations
+        stmt: Select statement over individual columns
+        
+    Returns:
+        List of dictionaries keyed by column name
+    """
+    result = await session.execute(stmt)
+    return [dict(row) for row in result.mappings()]
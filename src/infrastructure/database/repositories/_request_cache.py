@@ -0,0 +1,130 @@
+"""
+Request-Scoped Read Cache - Infrastructure Layer
+
+This module memoizes idempotent repository reads for the lifetime of a
+database session. The session is created per request, so repeated lookups in
+one request (authentication, handler and serializer all resolving the same
+user, for example) reach the database only once. Any write through a
+repository sharing the session clears the cache, so reads never observe data
+older than the session's own changes.
+"""
+
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Tuple, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+_CACHE_KEY = "repository_read_cache"
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+def _cache_for(session: AsyncSession) -> Dict[Tuple[Hashable, ...], Any]:
+    """Return the read cache stored on the session, creating it if needed."""
+    return session.info.setdefault(_CACHE_KEY, {})
+
+
+def prime_request_cache(repository: Any, method_name: str, args: Tuple[Any, ...], value: Any) -> None:
+    """
+    Store a value as the cached result of a repository read.
+    
+    Lets bulk lookups populate the cache of the matching single-item read,
+    so a later call for one of the same keys needs no round trip.
+    
+    Args:
+        repository: Repository instance whose session holds the cache
+        method_name: Name of the cached read method (e.g. "get_by_id")
+        args: Positional arguments of the read call
+        value: Result to return for that call
+    """
+    _cache_for(repository._session)[(type(repository).__name__, method_name, *args)] = value
+
+
+def cached_request_results(
+    repository: Any,
+    method_name: str,
+    keys: Iterable[Hashable]
+) -> Dict[Hashable, Any]:
+    """
+    Look up the cached results of a single-key repository read.
+    
+    Lets bulk lookups reuse entities already read in this session and fetch
+    only the keys that are not cached. A cached None means the read found
+    nothing.
+    
+    Args:
+        repository: Repository instance whose session holds the cache
+        method_name: Name of the cached read method (e.g. "get_by_id")
+        keys: Single positional argument of each read call
+        
+    Returns:
+        Dictionary mapping each key with a cached result to that result
+    """
+    cache = _cache_for(repository._session)
+    repository_name = type(repository).__name__
+    
+    results = {}
+    for key in keys:
+        cache_key = (repository_name, method_name, key)
+        if cache_key in cache:
+            results[key] = cache[cache_key]
+    return results
+
+
+def request_cached(method: F) -> F:
+    """
+    Memoize an idempotent repository read for the lifetime of the session.
+    
+    Only positional arguments are used in the key; calls with keyword
+    arguments bypass the cache.
+    
+    Args:
+        method: Async repository method to cache
+        
+    Returns:
+        The wrapped method
+    """
+    name = method.__name__
+    
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if kwargs:
+            return await method(self, *args, **kwargs)
+        
+        cache = _cache_for(self._session)
+        key = (type(self).__name__, name, *args)
+        
+        if key in cache:
+            return cache[key]
+        
+        result = await method(self, *args)
+        cache[key] = result
+        return result
+    
+    return wrapper
+
+
+def invalidates_request_cache(method: F) -> F:
+    """
+    Clear the session's read cache whenever a write method runs.
+    
+    The cache is cleared before the write and again after it, whether the
+    write succeeds or fails.
+    
+    Args:
+        method: Async repository write method
+        
+    Returns:
+        The wrapped method
+    """
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        cache = _cache_for(self._session)
+        cache.clear()
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            cache.clear()
+    
+    return wrapper
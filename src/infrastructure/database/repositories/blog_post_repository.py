@@ -10,11 +10,13 @@ using SQLAlchemy for data persistence. Following Clean Architecture principles:
 """
 
 import logging
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
-from sqlalchemy import select, func, or_
+from sqlalchemy import String, bindparam, insert, lambda_stmt, select, func, or_, delete, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from ....domain.entities.blog_post import BlogPost
 from ....domain.repositories.blog_post_repository import (
@@ -23,12 +25,80 @@ from ....domain.repositories.blog_post_repository import (
     BlogPostNotFoundError,
     DuplicateBlogPostError
 )
-from ..models.blog_post_model import BlogPostModel
+from ....domain.repositories.pagination import PageCursor, check_page_args
+from ..models.blog_post_model import ENTITY_COLUMNS, BlogPostModel
+from ..models.comment_model import CommentModel  # registers the target of BlogPostModel.comments
+from ._counting import estimate_row_count
+from ._errors import UNIQUE_VIOLATION, duplicate_key_of, sqlstate_of
+from ._filters import LIKE_ESCAPE, contains_pattern
+from ._pagination import paginate
+from ._raw import fetch_rows, fetch_value
+from ._request_cache import (
+    cached_request_results,
+    invalidates_request_cache,
+    prime_request_cache,
+    request_cached
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+# Statements for the hottest reads, built once and cached by lambda code
+# object so each call skips rebuilding and cache-keying the select; every
+# per-call value is a named bind parameter
+_BY_ID_STMT = lambda_stmt(
+    lambda: select(BlogPostModel).where(BlogPostModel.id == bindparam("id"))
+)
+
+_NEWEST_FIRST_STMT = lambda_stmt(
+    lambda: select(*ENTITY_COLUMNS)
+    .order_by(BlogPostModel.created_at.desc(), BlogPostModel.id.desc())
+    .limit(bindparam("limit"))
+)
+
+_TITLE_SEARCH_STMT = _NEWEST_FIRST_STMT.add_criteria(
+    lambda s: s.where(BlogPostModel.title.ilike(bindparam("title_pattern"), escape=LIKE_ESCAPE))
+)
+
+
+def _page(
+    stmt: StatementLambdaElement,
+    params: Dict[str, Any],
+    offset: int = 0,
+    cursor: Optional[PageCursor] = None
+) -> StatementLambdaElement:
+    """
+    Restrict a cached newest-first statement to one page, like paginate().
+    
+    Args:
+        stmt: Cached statement ordered newest first with a "limit" parameter
+        params: Bind parameters for the statement, extended in place
+        offset: Number of rows to skip (ignored when a cursor is given)
+        cursor: Position of the last row of the previous page
+        
+    Returns:
+        The statement restricted to the page
+    """
+    if cursor is not None:
+        params["cursor_created_at"] = cursor.created_at
+        params["cursor_id"] = cursor.id
+        return stmt.add_criteria(
+            lambda s: s.where(
+                tuple_(BlogPostModel.created_at, BlogPostModel.id) < tuple_(
+                    bindparam("cursor_created_at", type_=BlogPostModel.created_at.type),
+                    bindparam("cursor_id", type_=BlogPostModel.id.type)
+                )
+            )
+        )
+    
+    if offset:
+        params["offset"] = offset
+        return stmt.add_criteria(lambda s: s.offset(bindparam("offset")))
+    
+    return stmt
+
+
 class BlogPostRepositoryImpl(BlogPostRepository):
     """
     SQLAlchemy implementation of the BlogPostRepository interface.
@@ -52,10 +122,15 @@ class BlogPostRepositoryImpl(BlogPostRepository):
         """
         self._session = session
     
+    @invalidates_request_cache
     async def create(self, blog_post: BlogPost) -> BlogPost:
         """
         Create a new blog post in the database.
         
+        The duplicate check is fused into the INSERT with ON CONFLICT DO
+        NOTHING; RETURNING yields no row when the ID is already taken, so
+        creating takes one round trip.
+        
         Args:
             blog_post: The BlogPost entity to create
             
@@ -69,19 +144,16 @@ class BlogPostRepositoryImpl(BlogPostRepository):
         try:
             logger.debug(f"Creating blog post with ID: {blog_post.id}")
             
-            # Check if blog post already exists
-            existing = await self._session.get(BlogPostModel, blog_post.id)
-            if existing:
+            stmt = (
+                pg_insert(BlogPostModel)
+                .values(**BlogPostModel.values_from_entity(blog_post))
+                .on_conflict_do_nothing(index_elements=[BlogPostModel.id])
+                .returning(BlogPostModel)
+            )
+            db_blog_post = (await self._session.execute(stmt)).scalar_one_or_none()
+            if db_blog_post is None:
                 raise DuplicateBlogPostError(blog_post.id)
             
-            # Create database model from domain entity
-            db_blog_post = BlogPostModel.from_entity(blog_post)
-            
-            # Add to session and flush to get any database-generated values
-            self._session.add(db_blog_post)
-            await self._session.flush()
-            await self._session.refresh(db_blog_post)
-            
             logger.info(f"Successfully created blog post: {blog_post.id}")
             return db_blog_post.to_entity()
             
@@ -91,6 +163,51 @@ class BlogPostRepositoryImpl(BlogPostRepository):
             logger.error(f"Error creating blog post {blog_post.id}: {e}")
             raise BlogPostRepositoryError(f"Failed to create blog post: {e}")
     
+    @invalidates_request_cache
+    async def create_many(self, blog_posts: Sequence[BlogPost]) -> List[BlogPost]:
+        """
+        Create several blog posts in the database in a single batch.
+        
+        The rows go through an ORM bulk INSERT, which SQLAlchemy sends as
+        multi-row INSERT statements (insertmanyvalues) without building a
+        model instance per blog post.
+        
+        Args:
+            blog_posts: The BlogPost entities to create
+            
+        Returns:
+            List of the created BlogPost entities, in the given order
+            
+        Raises:
+            DuplicateBlogPostError: If any blog post ID already exists
+            BlogPostRepositoryError: If there's an error creating the blog posts
+        """
+        if not blog_posts:
+            return []
+        
+        try:
+            logger.debug(f"Creating {len(blog_posts)} blog posts")
+            
+            # The primary key does the duplicate check
+            await self._session.execute(
+                insert(BlogPostModel),
+                [BlogPostModel.values_from_entity(blog_post) for blog_post in blog_posts]
+            )
+            
+            logger.info(f"Successfully created {len(blog_posts)} blog posts")
+            return list(blog_posts)
+            
+        except IntegrityError as e:
+            if sqlstate_of(e) == UNIQUE_VIOLATION:
+                key = duplicate_key_of(e)
+                raise DuplicateBlogPostError(UUID(key[1]) if key else blog_posts[0].id)
+            logger.error(f"Error creating blog posts: {e}")
+            raise BlogPostRepositoryError(f"Failed to create blog posts: {e}")
+        except Exception as e:
+            logger.error(f"Error creating blog posts: {e}")
+            raise BlogPostRepositoryError(f"Failed to create blog posts: {e}")
+    
+    @request_cached
     async def get_by_id(self, blog_post_id: UUID) -> Optional[BlogPost]:
         """
         Retrieve a blog post by its unique identifier.
@@ -107,12 +224,7 @@ class BlogPostRepositoryImpl(BlogPostRepository):
         try:
             logger.debug(f"Retrieving blog post with ID: {blog_post_id}")
             
-            # Query with eager loading of comments for complete entity
-            stmt = select(BlogPostModel).options(
-                selectinload(BlogPostModel.comments)
-            ).where(BlogPostModel.id == blog_post_id)
-            
-            result = await self._session.execute(stmt)
+            result = await self._session.execute(_BY_ID_STMT, {"id": blog_post_id})
             db_blog_post = result.scalar_one_or_none()
             
             if db_blog_post:
@@ -126,31 +238,86 @@ class BlogPostRepositoryImpl(BlogPostRepository):
             logger.error(f"Error retrieving blog post {blog_post_id}: {e}")
             raise BlogPostRepositoryError(f"Failed to retrieve blog post: {e}")
     
-    async def get_all(self, limit: int = 100, offset: int = 0) -> List[BlogPost]:
+    async def get_by_ids(self, blog_post_ids: Sequence[UUID]) -> Dict[UUID, BlogPost]:
+        """
+        Retrieve several blog posts by their unique identifiers in one query.
+        
+        Blog posts already read by get_by_id in this session are reused from
+        the request cache; only the others are queried.
+        
+        Args:
+            blog_post_ids: The unique identifiers of the blog posts
+            
+        Returns:
+            Dictionary mapping each found identifier to its BlogPost entity
+            
+        Raises:
+            BlogPostRepositoryError: If there's an error accessing the database
+        """
+        if not blog_post_ids:
+            return {}
+        
+        try:
+            logger.debug(f"Retrieving {len(blog_post_ids)} blog posts by ID")
+            
+            cached = cached_request_results(self, "get_by_id", blog_post_ids)
+            blog_posts = {
+                blog_post_id: blog_post
+                for blog_post_id, blog_post in cached.items()
+                if blog_post is not None
+            }
+            
+            missing_ids = set(blog_post_ids).difference(cached)
+            if missing_ids:
+                stmt = select(BlogPostModel).where(BlogPostModel.id.in_(missing_ids))
+                
+                result = await self._session.execute(stmt)
+                for db_blog_post in result.scalars():
+                    blog_posts[db_blog_post.id] = db_blog_post.to_entity()
+                
+                # Let later get_by_id calls for these IDs skip the round trip
+                for blog_post_id in missing_ids:
+                    prime_request_cache(self, "get_by_id", (blog_post_id,), blog_posts.get(blog_post_id))
+            
+            logger.debug(f"Found {len(blog_posts)} of {len(blog_post_ids)} blog posts")
+            return blog_posts
+            
+        except Exception as e:
+            logger.error(f"Error retrieving blog posts by ID: {e}")
+            raise BlogPostRepositoryError(f"Failed to retrieve blog posts: {e}")
+    
+    async def get_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[BlogPost]:
         """
         Retrieve all blog posts with optional pagination.
         
         Args:
             limit: Maximum number of blog posts to return
             offset: Number of blog posts to skip
+            cursor: Position of the last blog post of the previous page
             
         Returns:
             List of BlogPost entities
             
         Raises:
+            ValueError: If both offset and cursor are given
             BlogPostRepositoryError: If there's an error accessing the database
         """
+        check_page_args(offset, cursor)
+        
         try:
-            logger.debug(f"Retrieving blog posts with limit={limit}, offset={offset}")
-            
-            stmt = select(BlogPostModel).options(
-                selectinload(BlogPostModel.comments)
-            ).order_by(BlogPostModel.created_at.desc()).limit(limit).offset(offset)
+            logger.debug(f"Retrieving blog posts with limit={limit}, offset={offset}, cursor={cursor}")
             
-            result = await self._session.execute(stmt)
-            db_blog_posts = result.scalars().all()
+            # Entities are built from column rows, without ORM objects
+            params = {"limit": limit}
+            stmt = _page(_NEWEST_FIRST_STMT, params, offset, cursor)
             
-            blog_posts = [db_blog_post.to_entity() for db_blog_post in db_blog_posts]
+            result = await self._session.execute(stmt, params)
+            blog_posts = [BlogPostModel.entity_from_row(row) for row in result]
             
             logger.debug(f"Retrieved {len(blog_posts)} blog posts")
             return blog_posts
@@ -159,10 +326,203 @@ class BlogPostRepositoryImpl(BlogPostRepository):
             logger.error(f"Error retrieving blog posts: {e}")
             raise BlogPostRepositoryError(f"Failed to retrieve blog posts: {e}")
     
+    async def get_all_raw(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[dict]:
+        """
+        Retrieve blog posts as plain dictionaries of column values.
+        
+        Args:
+            limit: Maximum number of blog posts to return
+            offset: Number of blog posts to skip
+            cursor: Position of the last blog post of the previous page
+            
+        Returns:
+            List of dictionaries with the blog post columns
+            
+        Raises:
+            ValueError: If both offset and cursor are given
+            BlogPostRepositoryError: If there's an error accessing the database
+        """
+        check_page_args(offset, cursor)
+        
+        try:
+            logger.debug(f"Retrieving raw blog posts with limit={limit}, offset={offset}, cursor={cursor}")
+            
+            stmt = paginate(
+                select(
+                    BlogPostModel.id,
+                    BlogPostModel.title,
+                    BlogPostModel.content,
+                    BlogPostModel.created_at,
+                    BlogPostModel.updated_at
+                ),
+                BlogPostModel, limit, offset, cursor
+            )
+            
+            rows = await fetch_rows(self._session, stmt)
+            
+            logger.debug(f"Retrieved {len(rows)} raw blog posts")
+            return rows
+            
+        except Exception as e:
+            logger.error(f"Error retrieving raw blog posts: {e}")
+            raise BlogPostRepositoryError(f"Failed to retrieve blog posts: {e}")
+    
+    async def get_all_summaries(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[dict]:
+        """
+        Retrieve blog post summaries as plain dictionaries of column values.
+        
+        The id is cast to text in the query, so the rows are ready to
+        serialize without any per-row conversion.
+        
+        Args:
+            limit: Maximum number of blog posts to return
+            offset: Number of blog posts to skip
+            cursor: Position of the last blog post of the previous page
+            
+        Returns:
+            List of summary dictionaries
+            
+        Raises:
+            ValueError: If both offset and cursor are given
+            BlogPostRepositoryError: If there's an error accessing the database
+        """
+        check_page_args(offset, cursor)
+        
+        try:
+            logger.debug(f"Retrieving blog post summaries with limit={limit}, offset={offset}, cursor={cursor}")
+            
+            stmt = paginate(
+                select(
+                    BlogPostModel.id.cast(String).label("id"),
+                    BlogPostModel.title,
+                    BlogPostModel.created_at,
+                    BlogPostModel.updated_at,
+                    BlogPostModel.approved_comment_count.label("comment_count")
+                ),
+                BlogPostModel, limit, offset, cursor
+            )
+            
+            rows = await fetch_rows(self._session, stmt)
+            
+            logger.debug(f"Retrieved {len(rows)} blog post summaries")
+            return rows
+            
+        except Exception as e:
+            logger.error(f"Error retrieving blog post summaries: {e}")
+            raise BlogPostRepositoryError(f"Failed to retrieve blog posts: {e}")
+    
+    async def get_all_with_comment_counts(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None,
+        approved_only: bool = False
+    ) -> List[Tuple[BlogPost, int]]:
+        """
+        Retrieve blog posts with their comment counts using a single query.
+        
+        The counts are read from the trigger-maintained counter columns of
+        blog_posts, so no comments are joined or aggregated.
+        
+        Args:
+            limit: Maximum number of blog posts to return
+            offset: Number of blog posts to skip
+            cursor: Position of the last blog post of the previous page
+            approved_only: Count only approved comments
+            
+        Returns:
+            List of (BlogPost entity, comment count) tuples
+            
+        Raises:
+            ValueError: If both offset and cursor are given
+            BlogPostRepositoryError: If there's an error accessing the database
+        """
+        check_page_args(offset, cursor)
+        
+        try:
+            logger.debug(f"Retrieving blog posts with comment counts, limit={limit}, offset={offset}")
+            
+            result = await self._session.execute(
+                paginate(
+                    select(*ENTITY_COLUMNS, BlogPostModel.approved_comment_count),
+                    BlogPostModel, limit, offset, cursor
+                )
+            )
+            
+            blog_posts = []
+            for row in result:
+                blog_post = BlogPostModel.entity_from_row(row)
+                blog_posts.append(
+                    (blog_post, row[-1] if approved_only else blog_post.comment_count)
+                )
+            
+            logger.debug(f"Retrieved {len(blog_posts)} blog posts with comment counts")
+            return blog_posts
+            
+        except Exception as e:
+            logger.error(f"Error retrieving blog posts with comment counts: {e}")
+            raise BlogPostRepositoryError(f"Failed to retrieve blog posts: {e}")
+    
+    async def iter_all(self, batch_size: int = 1000) -> AsyncIterator[BlogPost]:
+        """
+        Stream all blog posts in keyset-paginated batches.
+        
+        Entities are built from column rows, so nothing is added to the
+        session's identity map however many rows are streamed.
+        
+        Args:
+            batch_size: Number of blog posts fetched per query
+            
+        Yields:
+            BlogPost entities ordered by creation date (newest first)
+            
+        Raises:
+            BlogPostRepositoryError: If there's an error accessing the database
+        """
+        cursor = None
+        
+        while True:
+            try:
+                stmt = paginate(
+                    select(*ENTITY_COLUMNS),
+                    BlogPostModel, batch_size, cursor=cursor
+                )
+                
+                result = await self._session.execute(stmt)
+                blog_posts = [BlogPostModel.entity_from_row(row) for row in result]
+                
+            except Exception as e:
+                logger.error(f"Error streaming blog posts: {e}")
+                raise BlogPostRepositoryError(f"Failed to stream blog posts: {e}")
+            
+            logger.debug(f"Streamed batch of {len(blog_posts)} blog posts")
+            
+            for blog_post in blog_posts:
+                yield blog_post
+            
+            if len(blog_posts) < batch_size:
+                break
+            
+            cursor = PageCursor.after(blog_posts[-1])
+    
+    @invalidates_request_cache
     async def update(self, blog_post: BlogPost) -> BlogPost:
         """
         Update an existing blog post in the database.
         
+        A single UPDATE ... RETURNING replaces loading, flushing and
+        refreshing the row; no returned row means the blog post is missing.
+        
         Args:
             blog_post: The BlogPost entity with updated data
             
@@ -176,18 +536,21 @@ class BlogPostRepositoryImpl(BlogPostRepository):
         try:
             logger.debug(f"Updating blog post with ID: {blog_post.id}")
             
-            # Get existing blog post
-            db_blog_post = await self._session.get(BlogPostModel, blog_post.id)
-            if not db_blog_post:
+            stmt = (
+                update(BlogPostModel)
+                .where(BlogPostModel.id == blog_post.id)
+                .values(
+                    title=blog_post.title,
+                    content=blog_post.content,
+                    updated_at=blog_post.updated_at
+                )
+                .returning(BlogPostModel)
+                .execution_options(populate_existing=True)
+            )
+            db_blog_post = (await self._session.execute(stmt)).scalar_one_or_none()
+            if db_blog_post is None:
                 raise BlogPostNotFoundError(blog_post.id)
             
-            # Update with new values
-            db_blog_post.update_from_entity(blog_post)
-            
-            # Flush to apply changes and refresh to get updated values
-            await self._session.flush()
-            await self._session.refresh(db_blog_post)
-            
             logger.info(f"Successfully updated blog post: {blog_post.id}")
             return db_blog_post.to_entity()
             
@@ -197,9 +560,61 @@ class BlogPostRepositoryImpl(BlogPostRepository):
             logger.error(f"Error updating blog post {blog_post.id}: {e}")
             raise BlogPostRepositoryError(f"Failed to update blog post: {e}")
     
+    @invalidates_request_cache
+    async def update_many(self, blog_posts: Sequence[BlogPost]) -> List[BlogPost]:
+        """
+        Update several existing blog posts in the database in a single batch.
+        
+        The rows are loaded with one query and flushed together.
+        
+        Args:
+            blog_posts: The BlogPost entities with updated data
+            
+        Returns:
+            List of the updated BlogPost entities, in the given order
+            
+        Raises:
+            BlogPostNotFoundError: If any of the blog posts doesn't exist
+            BlogPostRepositoryError: If there's an error updating the blog posts
+        """
+        if not blog_posts:
+            return []
+        
+        try:
+            logger.debug(f"Updating {len(blog_posts)} blog posts")
+            
+            stmt = select(BlogPostModel).where(
+                BlogPostModel.id.in_([blog_post.id for blog_post in blog_posts])
+            )
+            
+            result = await self._session.execute(stmt)
+            db_blog_posts = {db_blog_post.id: db_blog_post for db_blog_post in result.scalars()}
+            
+            for blog_post in blog_posts:
+                db_blog_post = db_blog_posts.get(blog_post.id)
+                if db_blog_post is None:
+                    raise BlogPostNotFoundError(blog_post.id)
+                db_blog_post.update_from_entity(blog_post)
+            
+            await self._session.flush()
+            
+            logger.info(f"Successfully updated {len(blog_posts)} blog posts")
+            return [db_blog_posts[blog_post.id].to_entity() for blog_post in blog_posts]
+            
+        except BlogPostNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Error updating blog posts: {e}")
+            raise BlogPostRepositoryError(f"Failed to update blog posts: {e}")
+    
+    @invalidates_request_cache
     async def delete(self, blog_post_id: UUID) -> bool:
         """
-        Delete a blog post from the database.
+        Delete a blog post from the database in a single statement.
+        
+        DELETE ... RETURNING reports whether the blog post existed, so no
+        lookup is needed beforehand. Comments are removed by the database
+        through the foreign key's ON DELETE CASCADE.
         
         Args:
             blog_post_id: The unique identifier of the blog post to delete
@@ -213,16 +628,16 @@ class BlogPostRepositoryImpl(BlogPostRepository):
         try:
             logger.debug(f"Deleting blog post with ID: {blog_post_id}")
             
-            # Get the blog post to delete
-            db_blog_post = await self._session.get(BlogPostModel, blog_post_id)
-            if not db_blog_post:
+            stmt = (
+                delete(BlogPostModel)
+                .where(BlogPostModel.id == blog_post_id)
+                .returning(BlogPostModel.id)
+            )
+            result = await self._session.execute(stmt)
+            if result.scalar_one_or_none() is None:
                 logger.debug(f"Blog post not found for deletion: {blog_post_id}")
                 return False
             
-            # Delete the blog post (cascade will handle comments)
-            await self._session.delete(db_blog_post)
-            await self._session.flush()
-            
             logger.info(f"Successfully deleted blog post: {blog_post_id}")
             return True
             
@@ -230,6 +645,40 @@ class BlogPostRepositoryImpl(BlogPostRepository):
             logger.error(f"Error deleting blog post {blog_post_id}: {e}")
             raise BlogPostRepositoryError(f"Failed to delete blog post: {e}")
     
+    @invalidates_request_cache
+    async def delete_many(self, blog_post_ids: Sequence[UUID]) -> int:
+        """
+        Delete several blog posts from the database in a single statement.
+        
+        Comments are removed by the database through the foreign key's
+        ON DELETE CASCADE.
+        
+        Args:
+            blog_post_ids: The unique identifiers of the blog posts to delete
+            
+        Returns:
+            Number of blog posts deleted
+            
+        Raises:
+            BlogPostRepositoryError: If there's an error deleting the blog posts
+        """
+        if not blog_post_ids:
+            return 0
+        
+        try:
+            logger.debug(f"Deleting {len(blog_post_ids)} blog posts")
+            
+            stmt = delete(BlogPostModel).where(BlogPostModel.id.in_(blog_post_ids))
+            result = await self._session.execute(stmt)
+            
+            logger.info(f"Successfully deleted {result.rowcount} blog posts")
+            return result.rowcount
+            
+        except Exception as e:
+            logger.error(f"Error deleting blog posts: {e}")
+            raise BlogPostRepositoryError(f"Failed to delete blog posts: {e}")
+    
+    @request_cached
     async def exists(self, blog_post_id: UUID) -> bool:
         """
         Check if a blog post exists in the database.
@@ -246,9 +695,11 @@ class BlogPostRepositoryImpl(BlogPostRepository):
         try:
             logger.debug(f"Checking existence of blog post: {blog_post_id}")
             
-            stmt = select(BlogPostModel.id).where(BlogPostModel.id == blog_post_id)
-            result = await self._session.execute(stmt)
-            exists = result.scalar_one_or_none() is not None
+            exists = await fetch_value(
+                self._session,
+                "SELECT EXISTS(SELECT 1 FROM blog_posts WHERE id = $1)",
+                blog_post_id
+            )
             
             logger.debug(f"Blog post {blog_post_id} exists: {exists}")
             return exists
@@ -270,9 +721,7 @@ class BlogPostRepositoryImpl(BlogPostRepository):
         try:
             logger.debug("Counting total blog posts")
             
-            stmt = select(func.count(BlogPostModel.id))
-            result = await self._session.execute(stmt)
-            count = result.scalar()
+            count = await fetch_value(self._session, "SELECT count(*) FROM blog_posts")
             
             logger.debug(f"Total blog posts count: {count}")
             return count
@@ -281,13 +730,41 @@ class BlogPostRepositoryImpl(BlogPostRepository):
             logger.error(f"Error counting blog posts: {e}")
             raise BlogPostRepositoryError(f"Failed to count blog posts: {e}")
     
-    async def search_by_title(self, title_query: str, limit: int = 100) -> List[BlogPost]:
+    async def count_estimate(self) -> int:
+        """
+        Get an approximate number of blog posts from the planner statistics.
+        
+        Returns:
+            Approximate number of blog posts
+            
+        Raises:
+            BlogPostRepositoryError: If there's an error accessing the database
+        """
+        try:
+            logger.debug("Estimating total blog posts")
+            
+            count = await estimate_row_count(self._session, BlogPostModel)
+            
+            logger.debug(f"Estimated blog posts count: {count}")
+            return count
+            
+        except Exception as e:
+            logger.error(f"Error estimating blog posts count: {e}")
+            raise BlogPostRepositoryError(f"Failed to estimate blog posts count: {e}")
+    
+    async def search_by_title(
+        self,
+        title_query: str,
+        limit: int = 100,
+        cursor: Optional[PageCursor] = None
+    ) -> List[BlogPost]:
         """
         Search blog posts by title (case-insensitive partial match).
         
         Args:
             title_query: The search query for the title
             limit: Maximum number of results to return
+            cursor: Position of the last blog post of the previous page
             
         Returns:
             List of BlogPost entities matching the search criteria
@@ -299,16 +776,11 @@ class BlogPostRepositoryImpl(BlogPostRepository):
             logger.debug(f"Searching blog posts by title: '{title_query}'")
             
             # Case-insensitive partial match
-            stmt = select(BlogPostModel).options(
-                selectinload(BlogPostModel.comments)
-            ).where(
-                BlogPostModel.title.ilike(f"%{title_query}%")
-            ).order_by(BlogPostModel.created_at.desc()).limit(limit)
-            
-            result = await self._session.execute(stmt)
-            db_blog_posts = result.scalars().all()
+            params = {"limit": limit, "title_pattern": contains_pattern(title_query)}
+            stmt = _page(_TITLE_SEARCH_STMT, params, cursor=cursor)
             
-            blog_posts = [db_blog_post.to_entity() for db_blog_post in db_blog_posts]
+            result = await self._session.execute(stmt, params)
+            blog_posts = [BlogPostModel.entity_from_row(row) for row in result]
             
             logger.debug(f"Found {len(blog_posts)} blog posts matching title search")
             return blog_posts
@@ -317,12 +789,17 @@ class BlogPostRepositoryImpl(BlogPostRepository):
             logger.error(f"Error searching blog posts by title '{title_query}': {e}")
             raise BlogPostRepositoryError(f"Failed to search blog posts: {e}")
     
-    async def get_recent(self, limit: int = 10) -> List[BlogPost]:
+    async def get_recent(
+        self,
+        limit: int = 10,
+        cursor: Optional[PageCursor] = None
+    ) -> List[BlogPost]:
         """
         Get the most recently created blog posts.
         
         Args:
             limit: Maximum number of recent posts to return
+            cursor: Position of the last blog post of the previous page
             
         Returns:
             List of BlogPost entities ordered by creation date (newest first)
@@ -333,14 +810,11 @@ class BlogPostRepositoryImpl(BlogPostRepository):
         try:
             logger.debug(f"Retrieving {limit} most recent blog posts")
             
-            stmt = select(BlogPostModel).options(
-                selectinload(BlogPostModel.comments)
-            ).order_by(BlogPostModel.created_at.desc()).limit(limit)
+            params = {"limit": limit}
+            stmt = _page(_NEWEST_FIRST_STMT, params, cursor=cursor)
             
-            result = await self._session.execute(stmt)
-            db_blog_posts = result.scalars().all()
-            
-            blog_posts = [db_blog_post.to_entity() for db_blog_post in db_blog_posts]
+            result = await self._session.execute(stmt, params)
+            blog_posts = [BlogPostModel.entity_from_row(row) for row in result]
             
             logger.debug(f"Retrieved {len(blog_posts)} recent blog posts")
             return blog_posts
@@ -348,3 +822,41 @@ class BlogPostRepositoryImpl(BlogPostRepository):
         except Exception as e:
             logger.error(f"Error retrieving recent blog posts: {e}")
             raise BlogPostRepositoryError(f"Failed to retrieve recent blog posts: {e}")
+    
+    async def get_recent_with_total(self, limit: int = 10) -> Tuple[int, List[BlogPost]]:
+        """
+        Get the most recent blog posts and the total count using a single query.
+        
+        The total is computed with a count(*) OVER () window, which is
+        evaluated before LIMIT and so counts every blog post.
+        
+        Args:
+            limit: Maximum number of recent posts to return
+            
+        Returns:
+            Tuple of (total number of blog posts, list of BlogPost entities)
+            
+        Raises:
+            BlogPostRepositoryError: If there's an error accessing the database
+        """
+        try:
+            logger.debug(f"Retrieving {limit} most recent blog posts with total count")
+            
+            stmt = paginate(
+                select(*ENTITY_COLUMNS, func.count().over()),
+                BlogPostModel, limit
+            )
+            
+            result = await self._session.execute(stmt)
+            rows = result.all()
+            
+            # With no rows there is nothing to count, so the total is zero
+            total = rows[0][-1] if rows else 0
+            blog_posts = [BlogPostModel.entity_from_row(row) for row in rows]
+            
+            logger.debug(f"Retrieved {len(blog_posts)} recent blog posts of {total}")
+            return total, blog_posts
+            
+        except Exception as e:
+            logger.error(f"Error retrieving recent blog posts with total: {e}")
+            raise BlogPostRepositoryError(f"Failed to retrieve recent blog posts: {e}")
@@ -6,9 +6,10 @@ using SQLAlchemy for data persistence.
 """
 
 import logging
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Sequence
 from uuid import UUID
-from sqlalchemy import select, func, delete
+from sqlalchemy import insert, select, func, delete, update, case
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....domain.entities.comment import Comment
@@ -18,7 +19,15 @@ from ....domain.repositories.comment_repository import (
     CommentNotFoundError,
     DuplicateCommentError
 )
+from ....domain.repositories.blog_post_repository import BlogPostNotFoundError
+from ....domain.repositories.pagination import PageCursor, check_page_args
 from ..models.comment_model import CommentModel
+from ._counting import estimate_row_count
+from ._errors import FOREIGN_KEY_VIOLATION, UNIQUE_VIOLATION, duplicate_key_of, sqlstate_of
+from ._filters import any_of
+from ._pagination import paginate
+from ._raw import fetch_rows, fetch_value
+from ._request_cache import invalidates_request_cache, prime_request_cache, request_cached
 
 
 logger = logging.getLogger(__name__)
@@ -30,23 +39,48 @@ class CommentRepositoryImpl(CommentRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
     
+    @invalidates_request_cache
     async def create(self, comment: Comment) -> Comment:
         try:
-            existing = await self._session.get(CommentModel, comment.id)
-            if existing:
-                raise DuplicateCommentError(comment.id)
-            
-            db_comment = CommentModel.from_entity(comment)
-            self._session.add(db_comment)
-            await self._session.flush()
-            await self._session.refresh(db_comment)
+            # The primary key and the blog post foreign key do the existence checks;
+            # RETURNING hands back the stored row without a refresh query
+            stmt = insert(CommentModel).values(**CommentModel.values_from_entity(comment)).returning(CommentModel)
+            db_comment = (await self._session.execute(stmt)).scalar_one()
             
             return db_comment.to_entity()
-        except DuplicateCommentError:
-            raise
+        except IntegrityError as e:
+            sqlstate = sqlstate_of(e)
+            if sqlstate == FOREIGN_KEY_VIOLATION:
+                raise BlogPostNotFoundError(comment.blog_post_id)
+            if sqlstate == UNIQUE_VIOLATION:
+                raise DuplicateCommentError(comment.id)
+            raise CommentRepositoryError(f"Failed to create comment: {e}")
         except Exception as e:
             raise CommentRepositoryError(f"Failed to create comment: {e}")
     
+    @invalidates_request_cache
+    async def create_many(self, comments: Sequence[Comment]) -> List[Comment]:
+        if not comments:
+            return []
+        
+        try:
+            # ORM bulk INSERT: multi-row statements, no model instances; the
+            # primary key does the duplicate check
+            await self._session.execute(
+                insert(CommentModel),
+                [CommentModel.values_from_entity(comment) for comment in comments]
+            )
+            
+            return list(comments)
+        except IntegrityError as e:
+            if sqlstate_of(e) == UNIQUE_VIOLATION:
+                key = duplicate_key_of(e)
+                raise DuplicateCommentError(UUID(key[1]) if key else comments[0].id)
+            raise CommentRepositoryError(f"Failed to create comments: {e}")
+        except Exception as e:
+            raise CommentRepositoryError(f"Failed to create comments: {e}")
+    
+    @request_cached
     async def get_by_id(self, comment_id: UUID) -> Optional[Comment]:
         try:
             db_comment = await self._session.get(CommentModel, comment_id)
@@ -54,56 +88,216 @@ class CommentRepositoryImpl(CommentRepository):
         except Exception as e:
             raise CommentRepositoryError(f"Failed to retrieve comment: {e}")
     
-    async def get_by_blog_post_id(self, blog_post_id: UUID, limit: int = 100, offset: int = 0) -> List[Comment]:
+    async def get_by_ids(self, comment_ids: Sequence[UUID]) -> Dict[UUID, Comment]:
+        if not comment_ids:
+            return {}
+        
         try:
-            stmt = select(CommentModel).where(
-                CommentModel.blog_post_id == blog_post_id
-            ).order_by(CommentModel.created_at.desc()).limit(limit).offset(offset)
+            stmt = select(CommentModel).where(CommentModel.id.in_(set(comment_ids)))
+            result = await self._session.execute(stmt)
+            comments = {db_comment.id: db_comment.to_entity() for db_comment in result.scalars()}
+            
+            for comment_id in comment_ids:
+                prime_request_cache(self, "get_by_id", (comment_id,), comments.get(comment_id))
+            
+            return comments
+        except Exception as e:
+            raise CommentRepositoryError(f"Failed to retrieve comments: {e}")
+    
+    async def get_by_blog_post_id(
+        self,
+        blog_post_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        check_page_args(offset, cursor)
+        
+        try:
+            stmt = paginate(
+                select(CommentModel).where(CommentModel.blog_post_id == blog_post_id),
+                CommentModel, limit, offset, cursor
+            )
             
             result = await self._session.execute(stmt)
             db_comments = result.scalars().all()
-            return [db_comment.to_entity() for db_comment in db_comments]
+            return CommentModel.to_entities(db_comments)
         except Exception as e:
             raise CommentRepositoryError(f"Failed to retrieve comments: {e}")
     
-    async def get_approved_by_blog_post_id(self, blog_post_id: UUID, limit: int = 100, offset: int = 0) -> List[Comment]:
+    async def get_approved_by_blog_post_id(
+        self,
+        blog_post_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        check_page_args(offset, cursor)
+        
         try:
-            stmt = select(CommentModel).where(
-                CommentModel.blog_post_id == blog_post_id,
-                CommentModel.is_approved == True
-            ).order_by(CommentModel.created_at.desc()).limit(limit).offset(offset)
+            stmt = paginate(
+                select(CommentModel).where(
+                    CommentModel.blog_post_id == blog_post_id,
+                    CommentModel.is_approved == True
+                ),
+                CommentModel, limit, offset, cursor
+            )
             
             result = await self._session.execute(stmt)
             db_comments = result.scalars().all()
-            return [db_comment.to_entity() for db_comment in db_comments]
+            return CommentModel.to_entities(db_comments)
         except Exception as e:
             raise CommentRepositoryError(f"Failed to retrieve approved comments: {e}")
     
-    async def get_all(self, limit: int = 100, offset: int = 0) -> List[Comment]:
+    async def get_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        check_page_args(offset, cursor)
+        
         try:
-            stmt = select(CommentModel).order_by(CommentModel.created_at.desc()).limit(limit).offset(offset)
+            stmt = paginate(select(CommentModel), CommentModel, limit, offset, cursor)
             result = await self._session.execute(stmt)
             db_comments = result.scalars().all()
-            return [db_comment.to_entity() for db_comment in db_comments]
+            return CommentModel.to_entities(db_comments)
         except Exception as e:
             raise CommentRepositoryError(f"Failed to retrieve comments: {e}")
     
+    async def get_all_raw(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[dict]:
+        check_page_args(offset, cursor)
+        
+        try:
+            stmt = paginate(
+                select(
+                    CommentModel.id,
+                    CommentModel.content,
+                    CommentModel.author_name,
+                    CommentModel.author_email,
+                    CommentModel.is_approved,
+                    CommentModel.blog_post_id,
+                    CommentModel.created_at,
+                    CommentModel.updated_at
+                ),
+                CommentModel, limit, offset, cursor
+            )
+            return await fetch_rows(self._session, stmt)
+        except Exception as e:
+            raise CommentRepositoryError(f"Failed to retrieve comments: {e}")
+    
+    async def iter_all(self, batch_size: int = 1000) -> AsyncIterator[Comment]:
+        cursor = None
+        
+        while True:
+            try:
+                stmt = paginate(select(CommentModel), CommentModel, batch_size, cursor=cursor)
+                result = await self._session.execute(stmt)
+                db_comments = result.scalars().all()
+                
+                comments = CommentModel.to_entities(db_comments)
+                for db_comment in db_comments:
+                    self._session.expunge(db_comment)
+            except Exception as e:
+                raise CommentRepositoryError(f"Failed to stream comments: {e}")
+            
+            for comment in comments:
+                yield comment
+            
+            if len(comments) < batch_size:
+                break
+            
+            cursor = PageCursor.after(comments[-1])
+    
+    @invalidates_request_cache
     async def update(self, comment: Comment) -> Comment:
         try:
-            db_comment = await self._session.get(CommentModel, comment.id)
-            if not db_comment:
+            # One UPDATE ... RETURNING instead of load, flush and refresh
+            stmt = (
+                update(CommentModel)
+                .where(CommentModel.id == comment.id)
+                .values(
+                    content=comment.content,
+                    author_name=comment.author_name,
+                    author_email=comment.author_email,
+                    updated_at=comment.updated_at,
+                    is_approved=comment.is_approved
+                )
+                .returning(CommentModel)
+                .execution_options(populate_existing=True)
+            )
+            db_comment = (await self._session.execute(stmt)).scalar_one_or_none()
+            if db_comment is None:
                 raise CommentNotFoundError(comment.id)
             
-            db_comment.update_from_entity(comment)
-            await self._session.flush()
-            await self._session.refresh(db_comment)
-            
             return db_comment.to_entity()
         except CommentNotFoundError:
             raise
         except Exception as e:
             raise CommentRepositoryError(f"Failed to update comment: {e}")
     
+    @invalidates_request_cache
+    async def update_many(self, comments: Sequence[Comment]) -> List[Comment]:
+        if not comments:
+            return []
+        
+        try:
+            stmt = select(CommentModel).where(CommentModel.id.in_([comment.id for comment in comments]))
+            result = await self._session.execute(stmt)
+            db_comments = {db_comment.id: db_comment for db_comment in result.scalars()}
+            
+            for comment in comments:
+                db_comment = db_comments.get(comment.id)
+                if db_comment is None:
+                    raise CommentNotFoundError(comment.id)
+                db_comment.update_from_entity(comment)
+            
+            await self._session.flush()
+            
+            return [db_comments[comment.id].to_entity() for comment in comments]
+        except CommentNotFoundError:
+            raise
+        except Exception as e:
+            raise CommentRepositoryError(f"Failed to update comments: {e}")
+    
+    @invalidates_request_cache
+    async def set_approval_many(self, comment_ids: Sequence[UUID], approved: bool) -> List[Comment]:
+        if not comment_ids:
+            return []
+        
+        try:
+            stmt = (
+                update(CommentModel)
+                .where(any_of(CommentModel.id, comment_ids))
+                .values(
+                    is_approved=approved,
+                    updated_at=case(
+                        (CommentModel.is_approved == approved, CommentModel.updated_at),
+                        else_=func.now()
+                    )
+                )
+                .returning(CommentModel)
+                .execution_options(synchronize_session="fetch", populate_existing=True)
+            )
+            result = await self._session.execute(stmt)
+            comments = {db_comment.id: db_comment.to_entity() for db_comment in result.scalars()}
+            
+            for comment_id in comment_ids:
+                if comment_id not in comments:
+                    raise CommentNotFoundError(comment_id)
+            
+            return [comments[comment_id] for comment_id in comment_ids]
+        except CommentNotFoundError:
+            raise
+        except Exception as e:
+            raise CommentRepositoryError(f"Failed to moderate comments: {e}")
+    
+    @invalidates_request_cache
     async def delete(self, comment_id: UUID) -> bool:
         try:
             db_comment = await self._session.get(CommentModel, comment_id)
@@ -116,58 +310,128 @@ class CommentRepositoryImpl(CommentRepository):
         except Exception as e:
             raise CommentRepositoryError(f"Failed to delete comment: {e}")
     
-    async def delete_by_blog_post_id(self, blog_post_id: UUID) -> int:
+    @invalidates_request_cache
+    async def delete_many(self, comment_ids: Sequence[UUID]) -> int:
+        if not comment_ids:
+            return 0
+        
         try:
-            stmt = delete(CommentModel).where(CommentModel.blog_post_id == blog_post_id)
+            stmt = delete(CommentModel).where(CommentModel.id.in_(comment_ids))
             result = await self._session.execute(stmt)
             return result.rowcount
         except Exception as e:
             raise CommentRepositoryError(f"Failed to delete comments: {e}")
     
+    @invalidates_request_cache
+    async def delete_by_blog_post_id(self, blog_post_id: UUID, batch_size: int = 1000) -> int:
+        try:
+            total = 0
+            last_id = None
+            
+            # Delete in keyset-ordered batches so each statement touches at most
+            # batch_size rows and never rescans the rows already deleted
+            while True:
+                batch = select(CommentModel.id).where(CommentModel.blog_post_id == blog_post_id)
+                if last_id is not None:
+                    batch = batch.where(CommentModel.id > last_id)
+                batch = batch.order_by(CommentModel.id).limit(batch_size)
+                
+                stmt = delete(CommentModel).where(
+                    CommentModel.id.in_(batch.scalar_subquery())
+                ).returning(CommentModel.id).execution_options(synchronize_session="fetch")
+                
+                result = await self._session.execute(stmt)
+                deleted_ids = result.scalars().all()
+                total += len(deleted_ids)
+                
+                if len(deleted_ids) < batch_size:
+                    return total
+                
+                last_id = max(deleted_ids)
+        except Exception as e:
+            raise CommentRepositoryError(f"Failed to delete comments: {e}")
+    
+    @request_cached
     async def exists(self, comment_id: UUID) -> bool:
         try:
-            stmt = select(CommentModel.id).where(CommentModel.id == comment_id)
-            result = await self._session.execute(stmt)
-            return result.scalar_one_or_none() is not None
+            return await fetch_value(
+                self._session,
+                "SELECT EXISTS(SELECT 1 FROM comments WHERE id = $1)",
+                comment_id
+            )
         except Exception as e:
             raise CommentRepositoryError(f"Failed to check comment existence: {e}")
     
     async def count_by_blog_post_id(self, blog_post_id: UUID) -> int:
         try:
-            stmt = select(func.count(CommentModel.id)).where(CommentModel.blog_post_id == blog_post_id)
-            result = await self._session.execute(stmt)
-            return result.scalar()
+            return await fetch_value(
+                self._session,
+                "SELECT count(*) FROM comments WHERE blog_post_id = $1",
+                blog_post_id
+            )
         except Exception as e:
             raise CommentRepositoryError(f"Failed to count comments: {e}")
     
     async def count_approved_by_blog_post_id(self, blog_post_id: UUID) -> int:
         try:
-            stmt = select(func.count(CommentModel.id)).where(
-                CommentModel.blog_post_id == blog_post_id,
-                CommentModel.is_approved == True
+            return await fetch_value(
+                self._session,
+                "SELECT count(*) FROM comments WHERE blog_post_id = $1 AND is_approved = true",
+                blog_post_id
             )
+        except Exception as e:
+            raise CommentRepositoryError(f"Failed to count approved comments: {e}")
+    
+    async def count_approved_by_blog_post_ids(self, blog_post_ids: Sequence[UUID]) -> Dict[UUID, int]:
+        if not blog_post_ids:
+            return {}
+        
+        try:
+            stmt = select(CommentModel.blog_post_id, func.count()).where(
+                CommentModel.blog_post_id.in_(set(blog_post_ids)),
+                CommentModel.is_approved == True
+            ).group_by(CommentModel.blog_post_id)
+            
             result = await self._session.execute(stmt)
-            return result.scalar()
+            return dict(result.tuples().all())
         except Exception as e:
             raise CommentRepositoryError(f"Failed to count approved comments: {e}")
     
-    async def get_recent(self, limit: int = 10) -> List[Comment]:
+    async def count_estimate(self) -> int:
         try:
-            stmt = select(CommentModel).order_by(CommentModel.created_at.desc()).limit(limit)
+            return await estimate_row_count(self._session, CommentModel)
+        except Exception as e:
+            raise CommentRepositoryError(f"Failed to estimate comments count: {e}")
+    
+    async def get_recent(
+        self,
+        limit: int = 10,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        try:
+            stmt = paginate(select(CommentModel), CommentModel, limit, cursor=cursor)
             result = await self._session.execute(stmt)
             db_comments = result.scalars().all()
-            return [db_comment.to_entity() for db_comment in db_comments]
+            return CommentModel.to_entities(db_comments)
         except Exception as e:
             raise CommentRepositoryError(f"Failed to retrieve recent comments: {e}")
     
-    async def get_pending_approval(self, limit: int = 100, offset: int = 0) -> List[Comment]:
+    async def get_pending_approval(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        check_page_args(offset, cursor)
+        
         try:
-            stmt = select(CommentModel).where(
-                CommentModel.is_approved == False
-            ).order_by(CommentModel.created_at.desc()).limit(limit).offset(offset)
+            stmt = paginate(
+                select(CommentModel).where(CommentModel.is_approved == False),
+                CommentModel, limit, offset, cursor
+            )
             
             result = await self._session.execute(stmt)
             db_comments = result.scalars().all()
-            return [db_comment.to_entity() for db_comment in db_comments]
+            return CommentModel.to_entities(db_comments)
         except Exception as e:
             raise CommentRepositoryError(f"Failed to retrieve pending comments: {e}")
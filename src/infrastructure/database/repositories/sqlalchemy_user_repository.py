@@ -6,9 +6,10 @@ using SQLAlchemy for data persistence.
 """
 
 import logging
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
-from sqlalchemy import select, func
+from sqlalchemy import insert, select, func, delete, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....domain.entities.user import User
@@ -18,7 +19,14 @@ from ....domain.repositories.user_repository import (
     UserNotFoundError,
     DuplicateUserError
 )
+from ....domain.repositories.pagination import PageCursor, check_page_args
 from ..models.user_model import UserModel
+from ._counting import estimate_row_count
+from ._errors import UNIQUE_VIOLATION, duplicate_key_of, sqlstate_of
+from ._filters import LIKE_ESCAPE, any_of, contains_pattern
+from ._pagination import paginate
+from ._raw import fetch_row, fetch_rows, fetch_value
+from ._request_cache import invalidates_request_cache, prime_request_cache, request_cached
 
 
 logger = logging.getLogger(__name__)
@@ -30,6 +38,7 @@ class UserRepositoryImpl(UserRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
     
+    @invalidates_request_cache
     async def create(self, user: User) -> User:
         try:
             # Check if user already exists by ID, username, or email
@@ -37,16 +46,18 @@ class UserRepositoryImpl(UserRepository):
             if existing_id:
                 raise DuplicateUserError(str(user.id), "id")
             
-            if await self.exists_by_username(user.username):
+            username_exists, email_exists = await self.exists_by_username_or_email(
+                user.username, user.email
+            )
+            if username_exists:
                 raise DuplicateUserError(user.username, "username")
             
-            if await self.exists_by_email(user.email):
+            if email_exists:
                 raise DuplicateUserError(user.email, "email")
             
-            db_user = UserModel.from_entity(user)
-            self._session.add(db_user)
-            await self._session.flush()
-            await self._session.refresh(db_user)
+            # RETURNING hands back the stored row without a refresh query
+            stmt = insert(UserModel).values(**UserModel.values_from_entity(user)).returning(UserModel)
+            db_user = (await self._session.execute(stmt)).scalar_one()
             
             return db_user.to_entity()
         except (DuplicateUserError):
@@ -54,6 +65,29 @@ class UserRepositoryImpl(UserRepository):
         except Exception as e:
             raise UserRepositoryError(f"Failed to create user: {e}")
     
+    @invalidates_request_cache
+    async def create_many(self, users: Sequence[User]) -> List[User]:
+        if not users:
+            return []
+        
+        try:
+            # ORM bulk INSERT: multi-row statements, no model instances; the
+            # unique indexes on id, username and email do the duplicate checks
+            await self._session.execute(
+                insert(UserModel),
+                [UserModel.values_from_entity(user) for user in users]
+            )
+            
+            return list(users)
+        except IntegrityError as e:
+            if sqlstate_of(e) == UNIQUE_VIOLATION:
+                column, value = duplicate_key_of(e) or ("id", str(users[0].id))
+                raise DuplicateUserError(value, column)
+            raise UserRepositoryError(f"Failed to create users: {e}")
+        except Exception as e:
+            raise UserRepositoryError(f"Failed to create users: {e}")
+    
+    @request_cached
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
         try:
             db_user = await self._session.get(UserModel, user_id)
@@ -61,6 +95,23 @@ class UserRepositoryImpl(UserRepository):
         except Exception as e:
             raise UserRepositoryError(f"Failed to retrieve user: {e}")
     
+    async def get_by_ids(self, user_ids: Sequence[UUID]) -> Dict[UUID, User]:
+        if not user_ids:
+            return {}
+        
+        try:
+            stmt = select(UserModel).where(any_of(UserModel.id, user_ids))
+            result = await self._session.execute(stmt)
+            users = {db_user.id: db_user.to_entity() for db_user in result.scalars()}
+            
+            for user_id in user_ids:
+                prime_request_cache(self, "get_by_id", (user_id,), users.get(user_id))
+            
+            return users
+        except Exception as e:
+            raise UserRepositoryError(f"Failed to retrieve users: {e}")
+    
+    @request_cached
     async def get_by_username(self, username: str) -> Optional[User]:
         try:
             stmt = select(UserModel).where(UserModel.username == username)
@@ -70,6 +121,7 @@ class UserRepositoryImpl(UserRepository):
         except Exception as e:
             raise UserRepositoryError(f"Failed to retrieve user by username: {e}")
     
+    @request_cached
     async def get_by_email(self, email: str) -> Optional[User]:
         try:
             stmt = select(UserModel).where(UserModel.email == email.lower())
@@ -79,43 +131,169 @@ class UserRepositoryImpl(UserRepository):
         except Exception as e:
             raise UserRepositoryError(f"Failed to retrieve user by email: {e}")
     
-    async def get_all(self, limit: int = 100, offset: int = 0) -> List[User]:
+    async def get_by_usernames(self, usernames: Sequence[str]) -> Dict[str, User]:
+        if not usernames:
+            return {}
+        
         try:
-            stmt = select(UserModel).order_by(UserModel.created_at.desc()).limit(limit).offset(offset)
+            stmt = select(UserModel).where(any_of(UserModel.username, usernames))
+            result = await self._session.execute(stmt)
+            return {db_user.username: db_user.to_entity() for db_user in result.scalars()}
+        except Exception as e:
+            raise UserRepositoryError(f"Failed to retrieve users by username: {e}")
+    
+    async def get_by_emails(self, emails: Sequence[str]) -> Dict[str, User]:
+        if not emails:
+            return {}
+        
+        try:
+            stmt = select(UserModel).where(
+                any_of(UserModel.email, (email.lower() for email in emails))
+            )
+            result = await self._session.execute(stmt)
+            return {db_user.email: db_user.to_entity() for db_user in result.scalars()}
+        except Exception as e:
+            raise UserRepositoryError(f"Failed to retrieve users by email: {e}")
+    
+    async def get_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[User]:
+        check_page_args(offset, cursor)
+        
+        try:
+            stmt = paginate(select(UserModel), UserModel, limit, offset, cursor)
             result = await self._session.execute(stmt)
             db_users = result.scalars().all()
-            return [db_user.to_entity() for db_user in db_users]
+            return UserModel.to_entities(db_users)
         except Exception as e:
             raise UserRepositoryError(f"Failed to retrieve users: {e}")
     
-    async def get_active_users(self, limit: int = 100, offset: int = 0) -> List[User]:
+    async def get_all_raw(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[dict]:
+        check_page_args(offset, cursor)
+        
         try:
-            stmt = select(UserModel).where(
-                UserModel.is_active == True
-            ).order_by(UserModel.created_at.desc()).limit(limit).offset(offset)
+            stmt = paginate(
+                select(
+                    UserModel.id,
+                    UserModel.username,
+                    UserModel.email,
+                    UserModel.full_name,
+                    UserModel.is_active,
+                    UserModel.is_superuser,
+                    UserModel.created_at,
+                    UserModel.updated_at
+                ),
+                UserModel, limit, offset, cursor
+            )
+            return await fetch_rows(self._session, stmt)
+        except Exception as e:
+            raise UserRepositoryError(f"Failed to retrieve users: {e}")
+    
+    async def iter_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        cursor = None
+        
+        while True:
+            try:
+                stmt = paginate(select(UserModel), UserModel, batch_size, cursor=cursor)
+                result = await self._session.execute(stmt)
+                db_users = result.scalars().all()
+                
+                users = UserModel.to_entities(db_users)
+                for db_user in db_users:
+                    self._session.expunge(db_user)
+            except Exception as e:
+                raise UserRepositoryError(f"Failed to stream users: {e}")
+            
+            for user in users:
+                yield user
+            
+            if len(users) < batch_size:
+                break
+            
+            cursor = PageCursor.after(users[-1])
+    
+    async def get_active_users(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[PageCursor] = None
+    ) -> List[User]:
+        check_page_args(offset, cursor)
+        
+        try:
+            stmt = paginate(
+                select(UserModel).where(UserModel.is_active == True),
+                UserModel, limit, offset, cursor
+            )
             
             result = await self._session.execute(stmt)
             db_users = result.scalars().all()
-            return [db_user.to_entity() for db_user in db_users]
+            return UserModel.to_entities(db_users)
         except Exception as e:
             raise UserRepositoryError(f"Failed to retrieve active users: {e}")
     
+    @invalidates_request_cache
     async def update(self, user: User) -> User:
         try:
-            db_user = await self._session.get(UserModel, user.id)
-            if not db_user:
+            # One UPDATE ... RETURNING instead of load, flush and refresh
+            stmt = (
+                update(UserModel)
+                .where(UserModel.id == user.id)
+                .values(
+                    username=user.username,
+                    email=user.email,
+                    password_hash=user.password_hash,
+                    full_name=user.full_name,
+                    is_active=user.is_active,
+                    is_superuser=user.is_superuser,
+                    updated_at=user.updated_at
+                )
+                .returning(UserModel)
+                .execution_options(populate_existing=True)
+            )
+            db_user = (await self._session.execute(stmt)).scalar_one_or_none()
+            if db_user is None:
                 raise UserNotFoundError(str(user.id))
             
-            db_user.update_from_entity(user)
-            await self._session.flush()
-            await self._session.refresh(db_user)
-            
             return db_user.to_entity()
         except UserNotFoundError:
             raise
         except Exception as e:
             raise UserRepositoryError(f"Failed to update user: {e}")
     
+    @invalidates_request_cache
+    async def update_many(self, users: Sequence[User]) -> List[User]:
+        if not users:
+            return []
+        
+        try:
+            stmt = select(UserModel).where(UserModel.id.in_([user.id for user in users]))
+            result = await self._session.execute(stmt)
+            db_users = {db_user.id: db_user for db_user in result.scalars()}
+            
+            for user in users:
+                db_user = db_users.get(user.id)
+                if db_user is None:
+                    raise UserNotFoundError(str(user.id))
+                db_user.update_from_entity(user)
+            
+            await self._session.flush()
+            
+            return [db_users[user.id].to_entity() for user in users]
+        except UserNotFoundError:
+            raise
+        except Exception as e:
+            raise UserRepositoryError(f"Failed to update users: {e}")
+    
+    @invalidates_request_cache
     async def delete(self, user_id: UUID) -> bool:
         try:
             db_user = await self._session.get(UserModel, user_id)
@@ -128,63 +306,106 @@ class UserRepositoryImpl(UserRepository):
         except Exception as e:
             raise UserRepositoryError(f"Failed to delete user: {e}")
     
-    async def exists_by_username(self, username: str) -> bool:
+    @invalidates_request_cache
+    async def delete_many(self, user_ids: Sequence[UUID]) -> int:
+        if not user_ids:
+            return 0
+        
         try:
-            stmt = select(UserModel.id).where(UserModel.username == username)
+            stmt = delete(UserModel).where(UserModel.id.in_(user_ids))
             result = await self._session.execute(stmt)
-            return result.scalar_one_or_none() is not None
+            return result.rowcount
+        except Exception as e:
+            raise UserRepositoryError(f"Failed to delete users: {e}")
+    
+    @request_cached
+    async def exists_by_username(self, username: str) -> bool:
+        try:
+            return await fetch_value(
+                self._session,
+                "SELECT EXISTS(SELECT 1 FROM users WHERE username = $1)",
+                username
+            )
         except Exception as e:
             raise UserRepositoryError(f"Failed to check username existence: {e}")
     
+    @request_cached
     async def exists_by_email(self, email: str) -> bool:
         try:
-            stmt = select(UserModel.id).where(UserModel.email == email.lower())
-            result = await self._session.execute(stmt)
-            return result.scalar_one_or_none() is not None
+            return await fetch_value(
+                self._session,
+                "SELECT EXISTS(SELECT 1 FROM users WHERE email = $1)",
+                email.lower()
+            )
         except Exception as e:
             raise UserRepositoryError(f"Failed to check email existence: {e}")
     
+    @request_cached
+    async def exists_by_username_or_email(self, username: str, email: str) -> Tuple[bool, bool]:
+        try:
+            username_exists, email_exists = await fetch_row(
+                self._session,
+                "SELECT coalesce(bool_or(username = $1), false), coalesce(bool_or(email = $2), false) "
+                "FROM users WHERE username = $1 OR email = $2",
+                username,
+                email.lower()
+            )
+            return username_exists, email_exists
+        except Exception as e:
+            raise UserRepositoryError(f"Failed to check username and email existence: {e}")
+    
+    @request_cached
     async def exists(self, user_id: UUID) -> bool:
         try:
-            stmt = select(UserModel.id).where(UserModel.id == user_id)
-            result = await self._session.execute(stmt)
-            return result.scalar_one_or_none() is not None
+            return await fetch_value(
+                self._session,
+                "SELECT EXISTS(SELECT 1 FROM users WHERE id = $1)",
+                user_id
+            )
         except Exception as e:
             raise UserRepositoryError(f"Failed to check user existence: {e}")
     
     async def count(self) -> int:
         try:
-            stmt = select(func.count(UserModel.id))
-            result = await self._session.execute(stmt)
-            return result.scalar()
+            return await fetch_value(self._session, "SELECT count(*) FROM users")
         except Exception as e:
             raise UserRepositoryError(f"Failed to count users: {e}")
     
     async def count_active(self) -> int:
         try:
-            stmt = select(func.count(UserModel.id)).where(UserModel.is_active == True)
-            result = await self._session.execute(stmt)
-            return result.scalar()
+            return await fetch_value(self._session, "SELECT count(*) FROM users WHERE is_active")
         except Exception as e:
             raise UserRepositoryError(f"Failed to count active users: {e}")
     
+    async def count_estimate(self) -> int:
+        try:
+            return await estimate_row_count(self._session, UserModel)
+        except Exception as e:
+            raise UserRepositoryError(f"Failed to estimate users count: {e}")
+    
     async def search_by_username(self, username_query: str, limit: int = 100) -> List[User]:
         try:
             stmt = select(UserModel).where(
-                UserModel.username.ilike(f"%{username_query}%")
-            ).order_by(UserModel.created_at.desc()).limit(limit)
+                func.lower(UserModel.username).like(
+                    contains_pattern(username_query.lower()), escape=LIKE_ESCAPE
+                )
+            ).order_by(UserModel.created_at.desc(), UserModel.id.desc()).limit(limit)
             
             result = await self._session.execute(stmt)
             db_users = result.scalars().all()
-            return [db_user.to_entity() for db_user in db_users]
+            return UserModel.to_entities(db_users)
         except Exception as e:
             raise UserRepositoryError(f"Failed to search users: {e}")
     
-    async def get_recent(self, limit: int = 10) -> List[User]:
+    async def get_recent(
+        self,
+        limit: int = 10,
+        cursor: Optional[PageCursor] = None
+    ) -> List[User]:
         try:
-            stmt = select(UserModel).order_by(UserModel.created_at.desc()).limit(limit)
+            stmt = paginate(select(UserModel), UserModel, limit, cursor=cursor)
             result = await self._session.execute(stmt)
             db_users = result.scalars().all()
-            return [db_user.to_entity() for db_user in db_users]
+            return UserModel.to_entities(db_users)
         except Exception as e:
             raise UserRepositoryError(f"Failed to retrieve recent users: {e}")
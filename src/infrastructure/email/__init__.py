@@ -0,0 +1 @@
+"""Email Infrastructure"""
@@ -0,0 +1,32 @@
+"""
+Email Sender Service - Infrastructure Layer
+
+This module provides the delivery of transactional emails, such as password
+reset messages, to users.
+"""
+
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class EmailSender:
+    """
+    Service for sending transactional emails.
+    
+    No mail transport is configured yet, so messages are written to the
+    application log at DEBUG level instead of being delivered; reset tokens
+    are bearer credentials and must not reach production logs. Sending is asynchronous so
+    callers can dispatch it in the background without delaying a response.
+    """
+    
+    async def send_password_reset(self, email: str, reset_token: str) -> None:
+        """
+        Send a password reset email.
+        
+        Args:
+            email: Email address of the recipient
+            reset_token: Password reset token to include in the message
+        """
+        logger.debug(f"Password reset token for {email}: {reset_token}")
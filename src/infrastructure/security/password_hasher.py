@@ -3,9 +3,36 @@ Password Hasher Service - Infrastructure Layer
 
 This module provides password hashing and verification functionality
 using bcrypt for secure password storage.
+
+Hashing is deliberately CPU-heavy, so the async variants run it on a shared
+thread pool instead of the event loop. The bcrypt backend releases the GIL
+while hashing, which lets the pool use every core.
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
+from pydantic_settings import BaseSettings
+
+
+# Worker threads shared by every PasswordHasher for the async variants
+_hash_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="password-hasher"
+)
+
+
+class PasswordHasherSettings(BaseSettings):
+    """Password hashing configuration settings."""
+    
+    # bcrypt work factor: each extra round doubles the cost of a hash
+    bcrypt_rounds: int = 12
+    
+    class Config:
+        env_file = ".env"
+        case_sensitive = False
 
 
 class PasswordHasher:
@@ -17,9 +44,19 @@ class PasswordHasher:
     concrete implementation for password security operations.
     """
     
-    def __init__(self):
-        """Initialize the password context with bcrypt."""
-        self._pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    def __init__(self, settings: PasswordHasherSettings = None):
+        """
+        Initialize the password context with bcrypt.
+        
+        Args:
+            settings: Password hashing configuration settings
+        """
+        self._settings = settings or PasswordHasherSettings()
+        self._pwd_context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__rounds=self._settings.bcrypt_rounds
+        )
     
     def hash_password(self, password: str) -> str:
         """
@@ -46,6 +83,35 @@ class PasswordHasher:
         """
         return self._pwd_context.verify(plain_password, hashed_password)
     
+    async def hash_password_async(self, password: str) -> str:
+        """
+        Hash a plain text password without blocking the event loop.
+        
+        Args:
+            password: Plain text password to hash
+            
+        Returns:
+            Hashed password string
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, self.hash_password, password)
+    
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a plain text password against a hash without blocking the event loop.
+        
+        Args:
+            plain_password: Plain text password to verify
+            hashed_password: Hashed password to verify against
+            
+        Returns:
+            True if password matches, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _hash_executor, self.verify_password, plain_password, hashed_password
+        )
+    
     def needs_update(self, hashed_password: str) -> bool:
         """
         Check if a hashed password needs to be updated.
@@ -10,6 +10,8 @@ from typing import Dict, Any, Optional
 from jose import jwt, JWTError
 from pydantic_settings import BaseSettings
 
+from ...domain.use_cases.auth_use_cases import InvalidTokenError
+
 
 class TokenSettings(BaseSettings):
     """JWT token configuration settings."""
@@ -200,7 +202,7 @@ class TokenManager:
             return None
 
 
-class TokenError(Exception):
+class TokenError(InvalidTokenError):
     """Base exception for token operations."""
     pass
 
@@ -17,12 +17,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....domain.entities.user import User
 from ....domain.use_cases.auth_use_cases import AuthUseCases
+from ....domain.use_cases.token_cache import TokenUserCache
 from ....domain.repositories.user_repository import (
     DuplicateUserError,
     UserNotFoundError
 )
 from ....infrastructure.database.database import get_database_session
 from ....infrastructure.database.repositories.user_repository import UserRepositoryImpl
+from ....infrastructure.email.email_sender import EmailSender
 from ....infrastructure.security.password_hasher import PasswordHasher
 from ....infrastructure.security.token_manager import TokenManager, TokenExpiredError, TokenInvalidError
 from ..schemas.auth_schemas import (
@@ -46,6 +48,14 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 # Security scheme for JWT tokens
 security = HTTPBearer()
 
+# Users authenticated by recently seen access tokens, shared across requests
+token_user_cache = TokenUserCache()
+
+# Stateless services, built once instead of on every request
+password_hasher = PasswordHasher()
+token_manager = TokenManager()
+email_sender = EmailSender()
+
 
 async def get_auth_use_cases(
     session: Annotated[AsyncSession, Depends(get_database_session)]
@@ -60,13 +70,13 @@ async def get_auth_use_cases(
         Configured AuthUseCases instance
     """
     user_repository = UserRepositoryImpl(session)
-    password_hasher = PasswordHasher()
-    token_manager = TokenManager()
     
     return AuthUseCases(
         user_repository=user_repository,
         password_hasher=password_hasher,
-        token_manager=token_manager
+        token_manager=token_manager,
+        token_cache=token_user_cache,
+        email_sender=email_sender
     )
 
 
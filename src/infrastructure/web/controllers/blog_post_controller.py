@@ -9,16 +9,20 @@ Following Clean Architecture principles, this controller:
 - Converts between API schemas and domain entities
 """
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....domain.entities.user import User
 from ....domain.use_cases.blog_post_use_cases import BlogPostUseCases
 from ....domain.use_cases.comment_use_cases import CommentUseCases
+from ....domain.use_cases.entity_cache import EntityCache
+from ....domain.use_cases.expiring_value import ExpiringValue
 from ....domain.repositories.blog_post_repository import BlogPostNotFoundError
-from ....infrastructure.database.database import get_database_session
+from ....domain.repositories.pagination import PageCursor
+from ....infrastructure.database.commit_bound_cache import CommitBoundEntityCache, CommitBoundExpiringValue
+from ....infrastructure.database.database import get_database_session, get_readonly_database_session
 from ....infrastructure.database.repositories.blog_post_repository import BlogPostRepositoryImpl
 from ....infrastructure.database.repositories.comment_repository import CommentRepositoryImpl
 from ....infrastructure.web.controllers.auth_controller import get_current_active_user
@@ -35,6 +39,15 @@ from ..schemas.comment_schemas import CommentResponse
 
 router = APIRouter(prefix="/api/posts", tags=["Blog Posts"])
 
+# Hot blog posts, shared across requests and with the comment use cases
+blog_post_cache = EntityCache()
+
+# Comment statistics, shared across requests and cleared by comment writes
+comment_statistics_cache = ExpiringValue(ttl=30.0)
+
+# Blog post statistics, shared across requests and cleared by blog post writes
+blog_post_statistics_cache = ExpiringValue(ttl=30.0)
+
 
 async def get_blog_post_use_cases(
     session: AsyncSession = Depends(get_database_session)
@@ -42,7 +55,30 @@ async def get_blog_post_use_cases(
     """Dependency to get blog post use cases."""
     blog_post_repo = BlogPostRepositoryImpl(session)
     comment_repo = CommentRepositoryImpl(session)
-    return BlogPostUseCases(blog_post_repo, comment_repo)
+    post_cache = CommitBoundEntityCache(blog_post_cache, session)
+    statistics_cache = CommitBoundExpiringValue(blog_post_statistics_cache, session)
+    return BlogPostUseCases(blog_post_repo, comment_repo, post_cache, statistics_cache)
+
+
+async def get_blog_post_read_use_cases(
+    blog_post_session: AsyncSession = Depends(get_readonly_database_session),
+    comment_session: AsyncSession = Depends(get_readonly_database_session, use_cache=False)
+) -> BlogPostUseCases:
+    """
+    Dependency to get blog post use cases for read-only endpoints.
+    
+    Each repository gets its own read-only session, so their queries can
+    run concurrently on separate pooled connections and neither is committed.
+    """
+    blog_post_repo = BlogPostRepositoryImpl(blog_post_session)
+    comment_repo = CommentRepositoryImpl(comment_session)
+    return BlogPostUseCases(
+        blog_post_repo,
+        comment_repo,
+        blog_post_cache,
+        blog_post_statistics_cache,
+        concurrent_reads=True
+    )
 
 
 async def get_comment_use_cases(
@@ -51,7 +87,9 @@ async def get_comment_use_cases(
     """Dependency to get comment use cases."""
     comment_repo = CommentRepositoryImpl(session)
     blog_post_repo = BlogPostRepositoryImpl(session)
-    return CommentUseCases(comment_repo, blog_post_repo)
+    post_cache = CommitBoundEntityCache(blog_post_cache, session)
+    statistics_cache = CommitBoundExpiringValue(comment_statistics_cache, session)
+    return CommentUseCases(comment_repo, blog_post_repo, post_cache, statistics_cache)
 
 
 @router.get(
@@ -61,8 +99,10 @@ async def get_comment_use_cases(
     description="Retrieve a list of all blog posts with their comment counts"
 )
 async def get_all_blog_posts(
+    response: Response,
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of posts to return"),
-    offset: int = Query(0, ge=0, description="Number of posts to skip"),
+    offset: int = Query(0, ge=0, description="Number of posts to skip (prefer cursor)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
     use_cases: BlogPostUseCases = Depends(get_blog_post_use_cases)
 ):
     """
@@ -71,20 +111,31 @@ async def get_all_blog_posts(
     Returns a list of blog post summaries including:
     - Basic post information (id, title, timestamps)
     - Number of approved comments for each post
+    
+    A full page carries an X-Next-Cursor header; pass it back as the cursor
+    query parameter to fetch the next page at constant cost.
     """
     try:
-        summaries = await use_cases.get_blog_posts_summary(limit=limit, offset=offset)
+        page_cursor = PageCursor.decode(cursor) if cursor else None
+        summaries = await use_cases.get_blog_posts_summary(
+            limit=limit, offset=offset, cursor=page_cursor
+        )
         
-        return [
-            BlogPostSummaryResponse(
-                id=summary["id"],
-                title=summary["title"],
-                created_at=summary["created_at"],
-                updated_at=summary["updated_at"],
-                comment_count=summary["comment_count"]
-            )
-            for summary in summaries
-        ]
+        if len(summaries) == limit:
+            last = summaries[-1]
+            response.headers["X-Next-Cursor"] = PageCursor(
+                created_at=last["created_at"],
+                id=UUID(last["id"])
+            ).encode()
+        
+        # The summaries already have the response fields; FastAPI validates
+        # them against the response model once, without building models here
+        return summaries
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -146,7 +197,7 @@ async def create_blog_post(
 )
 async def get_blog_post(
     post_id: UUID,
-    use_cases: BlogPostUseCases = Depends(get_blog_post_use_cases)
+    use_cases: BlogPostUseCases = Depends(get_blog_post_read_use_cases)
 ):
     """
     Get a specific blog post by ID.
@@ -11,10 +11,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ....domain.use_cases.comment_use_cases import CommentUseCases
 from ....domain.repositories.comment_repository import CommentNotFoundError
 from ....domain.repositories.blog_post_repository import BlogPostNotFoundError
+from ....infrastructure.database.commit_bound_cache import CommitBoundEntityCache, CommitBoundExpiringValue
 from ....infrastructure.database.database import get_database_session
 from ....infrastructure.database.repositories.comment_repository import CommentRepositoryImpl
 from ....infrastructure.database.repositories.blog_post_repository import BlogPostRepositoryImpl
 from ..schemas.comment_schemas import CommentCreateRequest, CommentResponse
+from .blog_post_controller import blog_post_cache, comment_statistics_cache
 
 
 router = APIRouter(prefix="/api/posts", tags=["Comments"])
@@ -26,7 +28,9 @@ async def get_comment_use_cases(
     """Dependency to get comment use cases."""
     comment_repo = CommentRepositoryImpl(session)
     blog_post_repo = BlogPostRepositoryImpl(session)
-    return CommentUseCases(comment_repo, blog_post_repo)
+    post_cache = CommitBoundEntityCache(blog_post_cache, session)
+    statistics_cache = CommitBoundExpiringValue(comment_statistics_cache, session)
+    return CommentUseCases(comment_repo, blog_post_repo, post_cache, statistics_cache)
 
 
 @router.post(
@@ -103,11 +103,6 @@ class BlogPostSummaryResponse(BaseModel):
         description="Number of approved comments on this post",
         example=5
     )
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class BlogPostResponse(BaseModel):
@@ -138,11 +133,6 @@ class BlogPostResponse(BaseModel):
         description="When the blog post was last updated",
         example="2024-01-15T10:30:00Z"
     )
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class BlogPostWithCommentsResponse(BaseModel):
@@ -177,11 +167,6 @@ class BlogPostWithCommentsResponse(BaseModel):
         default_factory=list,
         description="List of approved comments on this post"
     )
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class BlogPostListResponse(BaseModel):
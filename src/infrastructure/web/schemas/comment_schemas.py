@@ -79,11 +79,6 @@ class CommentResponse(BaseModel):
         description="When the comment was last updated",
         example="2024-01-15T10:30:00Z"
     )
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class CommentUpdateRequest(BaseModel):